@@ -0,0 +1,43 @@
+import pytest
+from pages.base_page import BasePage
+from benchmarks.fixture_site import FixtureSite
+from benchmarks.runner import DEFAULT_BASELINE, Baseline, BenchmarkRunner
+
+
+@pytest.fixture(scope="session")
+def fixture_site():
+    site = FixtureSite().start()
+    original_rewrites = BasePage.URL_REWRITES
+    BasePage.URL_REWRITES = site.url_rewrites()
+    yield site
+    BasePage.URL_REWRITES = original_rewrites
+    site.stop()
+
+
+@pytest.fixture(scope="session")
+def baseline(pytestconfig):
+    baseline = Baseline(path=pytestconfig.getoption("bench_baseline") or DEFAULT_BASELINE,
+                        tolerance=pytestconfig.getoption("bench_tolerance"))
+    if not baseline.results and not pytestconfig.getoption("bench_save_baseline"):
+        # Without a baseline every comparison would pass, so refuse to run rather than report green
+        pytest.fail(f"No benchmark baseline at {baseline.path}; run once with --bench-save-baseline "
+                    f"against the fixture site and commit the file", pytrace=False)
+    yield baseline
+    if pytestconfig.getoption("bench_save_baseline") and baseline.collected:
+        baseline.save()
+        print(f"Benchmark baseline saved to {baseline.path}")
+
+
+@pytest.fixture
+def bench(driver, fixture_site, pytestconfig, baseline, record_property):
+    """Run an operation repeatedly, report median/p95/commands and fail on regressions"""
+    runner = BenchmarkRunner(driver, rounds=pytestconfig.getoption("bench_rounds"))
+
+    def run(name, operation, setup=None, teardown=None):
+        result = runner.run(name, operation, setup=setup, teardown=teardown)
+        record_property("benchmark", result)
+        problems = baseline.check(result)
+        if not pytestconfig.getoption("bench_save_baseline"):
+            assert not problems, f"{name} regressed: " + "; ".join(problems)
+        return result
+    return run
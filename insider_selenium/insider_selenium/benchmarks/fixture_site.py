@@ -0,0 +1,101 @@
+"""Local stand-in for the careers site, the QA job listing and the Lever feed.
+
+Pages are served under ``/<original host>/<path>``, the same layout the replay
+server uses, so BasePage.URL_REWRITES points the page objects at it.
+"""
+import json
+import os
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+SITE_DIR = os.path.join(os.path.dirname(__file__), "site")
+
+LOCATIONS = ["Istanbul, Turkiye", "London, United Kingdom", "New York, US", "Remote"]
+DEPARTMENTS = ["Quality Assurance", "Software Development", "Sales", "Customer Success"]
+TITLES = {
+    "Quality Assurance": ["QA Engineer", "Senior Software QA Engineer", "Test Automation Engineer"],
+    "Software Development": ["Backend Engineer", "Frontend Engineer", "Mobile Engineer"],
+    "Sales": ["Account Executive", "Sales Development Representative"],
+    "Customer Success": ["Customer Success Manager", "Implementation Specialist"],
+}
+
+
+def build_postings(base_url, per_combination=3):
+    """Deterministic postings for every location x department pair"""
+    postings = []
+    for location in LOCATIONS:
+        for department in DEPARTMENTS:
+            for i in range(per_combination):
+                titles = TITLES[department]
+                posting_id = f"{len(postings):04d}-{department[:2].lower()}"
+                postings.append({
+                    "id": posting_id,
+                    "text": f"{titles[i % len(titles)]} ({location.split(',')[0]})",
+                    "hostedUrl": f"{base_url}/jobs.lever.co/useinsider/{posting_id}",
+                    "applyUrl": f"{base_url}/jobs.lever.co/useinsider/{posting_id}/apply",
+                    "categories": {"location": location, "department": department, "commitment": "Full-time"},
+                })
+    return postings
+
+
+class FixtureSite:
+    def __init__(self, host="127.0.0.1", port=0):
+        self._server = ThreadingHTTPServer((host, port), partial(_Handler, self, directory=SITE_DIR))
+        self.postings = build_postings(self.url)
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url_rewrites(self):
+        """Prefix map for BasePage.URL_REWRITES"""
+        return {
+            "https://useinsider.com": f"{self.url}/useinsider.com",
+            "https://api.lever.co": f"{self.url}/api.lever.co",
+            "https://jobs.lever.co": f"{self.url}/jobs.lever.co",
+        }
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class _Handler(SimpleHTTPRequestHandler):
+    def __init__(self, site, *args, **kwargs):
+        self.site = site
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        if parts.path.rstrip("/") == "/api.lever.co/v0/postings/useinsider":
+            self._send_feed(parse_qs(parts.query))
+            return
+        if parts.path.startswith("/jobs.lever.co/useinsider/"):
+            self.path = "/jobs.lever.co/useinsider/posting.html"
+        super().do_GET()
+
+    def _send_feed(self, query):
+        # Server-side filtering, as the Lever postings API does
+        postings = [
+            posting for posting in self.site.postings
+            if all(posting["categories"].get(key) == values[0]
+                   for key, values in query.items() if key in ("location", "department"))
+        ]
+        body = json.dumps(postings).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
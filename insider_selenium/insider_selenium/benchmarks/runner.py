@@ -0,0 +1,96 @@
+import json
+import os
+import statistics
+import time
+
+from utils.command_hooks import add_command_hook, remove_command_hook
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(fraction * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+class BenchmarkRunner:
+    """Times page-object operations and counts the WebDriver commands they issue"""
+
+    def __init__(self, driver, rounds=5, warmup=1):
+        self.driver = driver
+        self.rounds = rounds
+        self.warmup = warmup
+
+    def run(self, name, operation, setup=None, teardown=None):
+        durations = []
+        commands = []
+        for round_index in range(self.warmup + self.rounds):
+            if setup:
+                setup()
+            count = [0]
+
+            def count_command(execute, command, params):
+                count[0] += 1
+                return execute(command, params)
+
+            add_command_hook(self.driver, count_command)
+            start = time.perf_counter()
+            try:
+                operation()
+            finally:
+                elapsed = time.perf_counter() - start
+                remove_command_hook(self.driver, count_command)
+            if teardown:
+                teardown()
+            if round_index >= self.warmup:
+                durations.append(elapsed * 1000)
+                commands.append(count[0])
+        return {
+            "name": name,
+            "rounds": self.rounds,
+            "median_ms": round(statistics.median(durations), 1),
+            "p95_ms": round(percentile(durations, 0.95), 1),
+            "commands": int(statistics.median(commands)),
+        }
+
+
+class Baseline:
+    """Stored benchmark results and the regression check against them"""
+
+    def __init__(self, path=DEFAULT_BASELINE, tolerance=0.25, slack_ms=20):
+        self.path = path
+        self.tolerance = tolerance
+        self.slack_ms = slack_ms
+        self.collected = []
+        try:
+            with open(path, encoding="utf-8") as f:
+                self.results = json.load(f)
+        except (OSError, ValueError):
+            self.results = {}
+
+    def check(self, result):
+        """Collect a result and return its human-readable regressions versus the baseline"""
+        self.collected.append(result)
+        baseline = self.results.get(result["name"])
+        if not baseline:
+            return [f"no baseline result in {self.path} (record one with --bench-save-baseline)"]
+        problems = []
+        limit = baseline["median_ms"] * (1 + self.tolerance) + self.slack_ms
+        if result["median_ms"] > limit:
+            problems.append(f"median {result['median_ms']}ms > {round(limit, 1)}ms (baseline {baseline['median_ms']}ms)")
+        if result["commands"] > baseline["commands"]:
+            problems.append(f"{result['commands']} commands > baseline {baseline['commands']}")
+        return problems
+
+    def save(self):
+        """Store the collected results as the new baseline"""
+        stored = dict(self.results)
+        for result in self.collected:
+            stored[result["name"]] = {key: result[key] for key in ("median_ms", "p95_ms", "commands")}
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(stored, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self.results = stored
@@ -0,0 +1,71 @@
+import pytest
+from pages.base_page import BasePage
+from pages.careers_page import CareersPage
+from pages.home_page import HomePage
+from pages.qa_jobs_page import QAJobsPage
+
+pytestmark = pytest.mark.benchmark
+
+LOCATION = "Istanbul, Turkiye"
+DEPARTMENT = "Quality Assurance"
+
+
+def open_listing(driver):
+    page = QAJobsPage(driver)
+    page.go_to("https://useinsider.com/careers/open-positions/?department=qualityassurance")
+    page.wait.until(lambda d: next(page.iter_job_cards(chunk_size=1), None))
+    return page
+
+
+def close_extra_tabs(driver):
+    handles = driver.window_handles
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(handles[0])
+
+
+def test_go_to(bench, driver):
+    page = HomePage(driver)
+    bench("go_to", page.navigate_to_careers)
+
+
+def test_find(bench, driver):
+    page = CareersPage(driver)
+    page.go_to("https://useinsider.com/careers/")
+    bench("find", lambda: page.find(CareersPage.PAGE_HEADING))
+
+
+def test_click(bench, driver):
+    page = BasePage(driver)
+    bench(
+        "click",
+        lambda: page.click(QAJobsPage.SEE_ALL_LINK),
+        setup=lambda: page.go_to("https://useinsider.com/careers/quality-assurance/")
+    )
+
+
+def test_apply_filters(bench, driver):
+    pages = []
+    bench(
+        "apply_filters",
+        lambda: pages[-1].apply_filters(location=LOCATION, department=DEPARTMENT),
+        setup=lambda: pages.append(open_listing(driver))
+    )
+
+
+def test_verify_job_filters(bench, driver):
+    page = open_listing(driver)
+    page.apply_filters(location=LOCATION, department=DEPARTMENT)
+    bench("verify_job_filters", lambda: page.verify_job_filters(LOCATION, DEPARTMENT))
+
+
+def test_open_first_job(bench, driver):
+    pages = []
+
+    def setup():
+        pages.append(open_listing(driver))
+        pages[-1].apply_filters(location=LOCATION, department=DEPARTMENT)
+
+    bench("open_first_job", lambda: pages[-1].open_first_job(), setup=setup,
+          teardown=lambda: close_extra_tabs(driver))
@@ -1,17 +1,362 @@
+import os
 import pytest
-from selenium import webdriver
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service as ChromeService
+from pages.base_page import BasePage
+from pages.careers_page import CareersPage
+from pages.home_page import HomePage
+from pages.job_detail_page import JobDetailPage
+from pages.qa_jobs_page import QAJobsPage
+from utils.artifacts import ArtifactWriter
+from utils.driver_factory import DriverFactory
+from utils.driver_pool import DriverPool, memory_capped_size, worker_count
+from utils.driver_resolver import DriverResolver
+from utils.locator_cache import LocatorCache
+from utils.tracing import TRACE_PAGE_JS, TraceRecorder
+from utils.wait_stats import WaitHistory
+from utils.profiler import CommandProfiler
+from utils.remote import PooledRemoteConnection, RemoteCommandStats
+from utils.resources import ResourceMonitor, budget_violations
+from utils.traffic_archive import ReplayServer, TrafficRecorder
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("browser")
+    group.addoption("--headless", action="store_true", default=False,
+                    help="Run Chrome in headless mode")
+    group.addoption("--lean", action="store_true", default=False,
+                    help="Run a lean headless Chrome that blocks images, fonts, media and trackers")
+    group.addoption("--lean-block", action="append", default=[], metavar="PATTERN",
+                    help="Extra URL pattern to block in lean mode (may be repeated)")
+    group.addoption("--lean-allow", action="append", default=[], metavar="PATTERN",
+                    help="URL exempted from the lean deny list, in URLPattern syntax such as "
+                         "'https://fonts.gstatic.com/*' (may be repeated)")
+    group.addoption("--chromedriver", metavar="PATH", default=None,
+                    help="Use this chromedriver binary instead of resolving one")
+    group.addoption("--offline-driver", action="store_true", default=False,
+                    help="Never download chromedriver; fail if no local binary matches the installed Chrome")
+    group.addoption("--browsers-per-worker", type=int, default=1,
+                    help="Maximum number of browsers each (xdist) worker may run at once")
+    group.addoption("--browser-memory-mb", type=int, default=600,
+                    help="Estimated memory per browser, used to cap the pool size by available memory")
+    group.addoption("--page-load-strategy", choices=["normal", "eager", "none"], default="eager",
+                    help="WebDriver page-load strategy; page objects wait for their own readiness contract (default: eager)")
+    group.addoption("--remote-url", metavar="URL", default=None,
+                    help="Run browsers on a remote WebDriver endpoint (Selenium Grid or chromedriver --port=N)")
+    group.addoption("--remote-pool-size", type=int, default=8,
+                    help="Keep-alive HTTP connections to --remote-url shared by all sessions in a worker (default: 8)")
+    group.addoption("--bidi", action="store_true", default=False,
+                    help="Enable WebDriver BiDi so new tabs and navigations are detected from browser events")
+    group.addoption("--early-commit", action="store_true", default=False,
+                    help="With --bidi, accept the Lever redirect once its navigation commits instead of after the page loads")
+
+    group = parser.getgroup("verification")
+    group.addoption("--verify-source", choices=["ui", "feed"], default="ui",
+                    help="Verify job filters from rendered cards (ui) or from the job feed with a UI cross-check (feed)")
+
+    group = parser.getgroup("matrix")
+    group.addoption("--matrix", action="store_true", default=False,
+                    help="Run the location x department filter matrix")
+    group.addoption("--matrix-shards", type=int, default=None,
+                    help="Number of shards the filter matrix is split into (default: one per xdist worker)")
+
+    group = parser.getgroup("benchmarks")
+    group.addoption("--benchmark", action="store_true", default=False,
+                    help="Run the page-object benchmarks in benchmarks/ against the local fixture site")
+    group.addoption("--bench-rounds", type=int, default=5,
+                    help="Timed rounds per benchmark (after one warm-up round)")
+    group.addoption("--bench-baseline", metavar="PATH", default=None,
+                    help="Baseline file to compare against (default: benchmarks/baseline.json)")
+    group.addoption("--bench-tolerance", type=float, default=0.25,
+                    help="Allowed median slowdown versus the baseline, as a fraction (default: 0.25)")
+    group.addoption("--bench-save-baseline", action="store_true", default=False,
+                    help="Store this run's results as the new baseline instead of comparing")
+
+    group = parser.getgroup("artifacts")
+    group.addoption("--artifact-max-files", type=int, default=200,
+                    help="Maximum number of screenshots/page sources kept per artifact directory")
+    group.addoption("--artifact-max-mb", type=int, default=100,
+                    help="Maximum size of each artifact directory in MB")
+    group.addoption("--trace-size", type=int, default=500,
+                    help="WebDriver commands kept in the in-memory failure trace per test; 0 disables tracing")
+
+    group = parser.getgroup("resources")
+    group.addoption("--no-resource-monitor", action="store_true", default=False,
+                    help="Don't sample browser memory, CPU and JS heap during tests")
+    group.addoption("--max-browser-rss-mb", type=float, default=None,
+                    help="Fail tests whose Chrome process tree RSS peaks above this many MB")
+    group.addoption("--max-browser-cpu-percent", type=float, default=None,
+                    help="Fail tests whose Chrome process tree CPU use peaks above this percentage "
+                         "(measured over windows of at least a second)")
+    group.addoption("--max-js-heap-mb", type=float, default=None,
+                    help="Fail tests whose page JS heap peaks above this many MB")
+
+    group = parser.getgroup("locators")
+    group.addoption("--locator-cache", metavar="PATH", default=".locator_cache.json",
+                    help="File remembering which fallback locator strategy worked (default: .locator_cache.json)")
+    group.addoption("--no-locator-cache", action="store_true", default=False,
+                    help="Always walk fallback locator strategies in their declared order")
+    group.addoption("--wait-history", metavar="PATH", default=".wait_history.json",
+                    help="File of per-locator wait latencies used to size timeouts (default: .wait_history.json)")
+    group.addoption("--no-adaptive-waits", action="store_true", default=False,
+                    help="Use the fixed 10s timeout for every locator wait")
+
+    group = parser.getgroup("profiling")
+    group.addoption("--profile-commands", metavar="DIR", default=None,
+                    help="Write a per-test WebDriver command/wait/sleep profile (JSON + folded stacks) to DIR")
+
+    group = parser.getgroup("traffic")
+    group.addoption("--record", metavar="DIR", default=None,
+                    help="Record every response the browser receives into an archive directory")
+    group.addoption("--replay", metavar="DIR", default=None,
+                    help="Serve a recorded archive from a local server instead of the live sites")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "matrix: filter matrix tests, only run with --matrix")
+    config.addinivalue_line("markers", "benchmark: page-object benchmarks, only run with --benchmark")
+    if config.getoption("record") and config.getoption("remote_url"):
+        # Recording reads the local performance log, which webdriver.Remote has no get_log for
+        raise pytest.UsageError("--record cannot be combined with --remote-url")
+
+
+def pytest_generate_tests(metafunc):
+    if "matrix_shard" in metafunc.fixturenames:
+        shards = metafunc.config.getoption("matrix_shards") or worker_count()
+        metafunc.parametrize("matrix_shard", range(shards))
+
+
+def pytest_collection_modifyitems(config, items):
+    for marker, option in (("matrix", "matrix"), ("benchmark", "benchmark")):
+        if config.getoption(option):
+            continue
+        skip = pytest.mark.skip(reason=f"{marker} tests only run with --{option}")
+        for item in items:
+            if marker in item.keywords:
+                item.add_marker(skip)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def artifact_writer(pytestconfig):
+    writer = ArtifactWriter(
+        max_files=pytestconfig.getoption("artifact_max_files"),
+        max_bytes=pytestconfig.getoption("artifact_max_mb") * 1024 * 1024
+    )
+    original_writer = BasePage.artifacts
+    BasePage.artifacts = writer
+    yield writer
+    writer.close()
+    BasePage.artifacts = original_writer
+
+
+@pytest.fixture(scope="session", autouse=True)
+def verify_source(pytestconfig):
+    original_source = QAJobsPage.VERIFY_SOURCE
+    QAJobsPage.VERIFY_SOURCE = pytestconfig.getoption("verify_source")
+    yield QAJobsPage.VERIFY_SOURCE
+    QAJobsPage.VERIFY_SOURCE = original_source
+
+
+@pytest.fixture(scope="session", autouse=True)
+def early_commit(pytestconfig):
+    original = JobDetailPage.EARLY_COMMIT
+    JobDetailPage.EARLY_COMMIT = pytestconfig.getoption("early_commit")
+    yield JobDetailPage.EARLY_COMMIT
+    JobDetailPage.EARLY_COMMIT = original
+
+
+@pytest.fixture(scope="session", autouse=True)
+def locator_cache(pytestconfig):
+    if pytestconfig.getoption("no_locator_cache"):
+        yield None
+        return
+    cache = LocatorCache(os.path.join(str(pytestconfig.rootpath), pytestconfig.getoption("locator_cache")))
+    BasePage.locator_cache = cache
+    yield cache
+    BasePage.locator_cache = None
+    cache.save()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def wait_history(pytestconfig):
+    if pytestconfig.getoption("no_adaptive_waits"):
+        yield None
+        return
+    history = WaitHistory(os.path.join(str(pytestconfig.rootpath), pytestconfig.getoption("wait_history")))
+    BasePage.wait_history = history
+    yield history
+    BasePage.wait_history = None
+    history.save()
+
+
+@pytest.fixture(scope="session")
+def replay_server(pytestconfig):
+    archive_dir = pytestconfig.getoption("replay")
+    if not archive_dir:
+        yield None
+        return
+    server = ReplayServer(archive_dir).start()
+    original_rewrites = BasePage.URL_REWRITES
+    BasePage.URL_REWRITES = server.url_rewrites()
+    yield server
+    BasePage.URL_REWRITES = original_rewrites
+    server.stop()
+
 
 @pytest.fixture(scope="session")
-def driver():
-    options = webdriver.ChromeOptions()
-    # Uncomment the next line to run in headed mode
-    # options.add_argument('--headless')
-    options.add_argument('--window-size=1920,1080')
-    driver = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=options)
+def traffic_recorder(pytestconfig):
+    archive_dir = pytestconfig.getoption("record")
+    if not archive_dir:
+        yield None
+        return
+    recorder = TrafficRecorder(archive_dir, worker=os.environ.get("PYTEST_XDIST_WORKER", "main"))
+    yield recorder
+    recorder.save()
+
+
+@pytest.fixture(scope="session")
+def driver_pool(pytestconfig, replay_server):
+    factory = DriverFactory(
+        headless=pytestconfig.getoption("headless"),
+        lean=pytestconfig.getoption("lean"),
+        block_urls=pytestconfig.getoption("lean_block"),
+        allow_urls=pytestconfig.getoption("lean_allow"),
+        performance_log=bool(pytestconfig.getoption("record")),
+        driver_path=pytestconfig.getoption("chromedriver"),
+        resolver=DriverResolver(offline=pytestconfig.getoption("offline_driver")),
+        bidi=pytestconfig.getoption("bidi"),
+        page_load_strategy=pytestconfig.getoption("page_load_strategy"),
+        remote_url=pytestconfig.getoption("remote_url"),
+        remote_pool_size=pytestconfig.getoption("remote_pool_size")
+    )
+    size = memory_capped_size(
+        pytestconfig.getoption("browsers_per_worker"),
+        pytestconfig.getoption("browser_memory_mb"),
+        workers=worker_count()
+    )
+    pool = DriverPool(factory, max_size=size)
+    pool.warm(1)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def command_profiler(request, pytestconfig):
+    directory = pytestconfig.getoption("profile_commands")
+    if not directory:
+        yield None
+        return
+    profiler = CommandProfiler(request.node.name)
+    yield profiler
+    profiler.write(directory)
+
+
+@pytest.fixture
+def driver(request, pytestconfig, driver_pool, traffic_recorder, command_profiler):
+    driver = driver_pool.checkout()
+    trace_size = pytestconfig.getoption("trace_size")
+    tracer = TraceRecorder(trace_size) if trace_size > 0 else None
+    if tracer:
+        BasePage(driver).install_document_script("failure-trace", TRACE_PAGE_JS)
+        tracer.attach(driver)
+    if traffic_recorder:
+        traffic_recorder.attach(driver)
+    if command_profiler:
+        command_profiler.attach(driver)
+    monitor = None
+    # Benchmarks count commands per operation, so they run without the extra sampling calls
+    if not pytestconfig.getoption("no_resource_monitor") and not request.node.get_closest_marker("benchmark"):
+        monitor = ResourceMonitor(driver).attach()
+        monitor.sample("test start")
     yield driver
-    driver.quit()
+    if monitor:
+        monitor.detach()
+    if command_profiler:
+        command_profiler.detach()
+    if traffic_recorder:
+        traffic_recorder.detach(driver)
+    if tracer:
+        tracer.detach()
+    driver_pool.checkin(driver)
+
+
+@pytest.fixture
+def qa_jobs_page(driver):
+    """QA job listing with all jobs shown, restored from a checkpoint when one exists"""
+    page = QAJobsPage(driver)
+    if not page.restore_checkpoint(QAJobsPage.ALL_JOBS_CHECKPOINT):
+        home_page = HomePage(driver)
+        home_page.open()
+        home_page.navigate_to_careers()
+        CareersPage(driver).go_to_quality_assurance()
+        page.open_all_jobs()
+    return page
+
+
+@pytest.fixture
+def matrix_shards(pytestconfig):
+    return pytestconfig.getoption("matrix_shards") or worker_count()
+
+
+@pytest.fixture(scope="session")
+def filter_combinations():
+    """Filter pairs enumerated from the dropdowns once per worker"""
+    combinations = []
+
+    def enumerate_once(page):
+        if not combinations:
+            combinations.extend(page.filter_combinations())
+        return combinations
+    return enumerate_once
+
+
+@pytest.fixture
+def step(command_profiler):
+    """Announce a test step; when profiling, later commands are attributed to it"""
+    def announce(message):
+        print(message)
+        if command_profiler:
+            command_profiler.mark_step(message)
+    return announce
+
+def check_resource_budgets(item, report):
+    """Take the end-of-test resource sample, record the peaks and fail the test if a budget was exceeded"""
+    driver = item.funcargs.get('driver')
+    monitor = driver.__dict__.get("_resource_monitor") if driver else None
+    if not monitor:
+        return
+    monitor.sample("test end")
+    summary = monitor.summary()
+    report.user_properties.append(("browser_resources", summary))
+    budgets = {
+        "rss_mb": item.config.getoption("max_browser_rss_mb"),
+        "cpu_percent": item.config.getoption("max_browser_cpu_percent"),
+        "js_heap_mb": item.config.getoption("max_js_heap_mb"),
+    }
+    violations = budget_violations(summary, budgets)
+    if violations and report.passed:
+        report.outcome = "failed"
+        report.longrepr = "Browser resource budget exceeded:\n" + "\n".join(violations)
+
+
+def record_startup_timings(item, report):
+    """Move the browsers started since the previous test onto this report, so xdist ships them to the controller"""
+    pool = item.funcargs.get('driver_pool')
+    if not pool or not pool.factory.startup_timings:
+        return
+    timings = pool.factory.startup_timings[:]
+    del pool.factory.startup_timings[:len(timings)]
+    report.user_properties.append(("browser_startup", timings))
+
+
+def record_remote_stats(item, report):
+    """Put the remote command latencies since the previous test and this worker's pool usage on the report"""
+    pool = item.funcargs.get('driver_pool')
+    if not pool or not pool.factory.remote_url:
+        return
+    sample = PooledRemoteConnection.stats.drain()
+    sample["worker"] = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    sample["connections"] = PooledRemoteConnection.connection_stats()
+    report.user_properties.append(("remote_webdriver", sample))
+
 
 # Hook to capture a screenshot on failure
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -19,9 +364,99 @@ def pytest_runtest_makereport(item, call):
     # execute all other hooks to obtain the report object
     outcome = yield
     report = outcome.get_result()
+    if report.when == 'call':
+        check_resource_budgets(item, report)
+        record_startup_timings(item, report)
+        record_remote_stats(item, report)
     if report.when == 'call' and report.failed:
         driver = item.funcargs.get('driver')
         if driver:
-            file_name = f"screenshots/{item.name}.png"
-            driver.save_screenshot(file_name)
+            tracer = driver.__dict__.get("_trace_recorder")
+            if tracer:
+                print(f"Trace saved to {tracer.flush(item.name, BasePage.artifacts)}")
+            file_name = BasePage.artifacts.save_screenshot(driver, item.name)
             print(f"Screenshot saved to {file_name}")
+
+
+def pytest_terminal_summary(terminalreporter):
+    rows = []
+    for report in terminalreporter.stats.get("passed", []) + terminalreporter.stats.get("failed", []):
+        if report.when == "call":
+            rows.extend(row for name, value in report.user_properties if name == "filter_matrix" for row in value)
+    if rows:
+        terminalreporter.section("filter matrix")
+        width = max(len(row["location"]) for row in rows)
+        for row in sorted(rows, key=lambda row: (row["location"], row["department"])):
+            status = "ok" if not row["mismatched"] else f"{row['mismatched']} mismatched"
+            terminalreporter.write_line(
+                f"{row['location']:<{width}}  {row['department']:<30} {row['jobs']:>4} jobs "
+                f"{row['seconds']:>7.2f}s  {status}"
+            )
+
+    results = []
+    for report in terminalreporter.stats.get("passed", []) + terminalreporter.stats.get("failed", []):
+        if report.when == "call":
+            results.extend(value for name, value in report.user_properties if name == "benchmark")
+    if results:
+        terminalreporter.section("benchmarks")
+        terminalreporter.write_line(f"{'operation':<22}{'median ms':>11}{'p95 ms':>11}{'commands':>10}")
+        for result in results:
+            terminalreporter.write_line(
+                f"{result['name']:<22}{result['median_ms']:>11}{result['p95_ms']:>11}{result['commands']:>10}"
+            )
+
+    usage = []
+    for report in terminalreporter.stats.get("passed", []) + terminalreporter.stats.get("failed", []):
+        if report.when == "call":
+            usage.extend((report.nodeid, value) for name, value in report.user_properties
+                         if name == "browser_resources")
+    if usage:
+        terminalreporter.section("browser resources")
+        terminalreporter.write_line(f"{'peak rss MB':>12}{'cpu s':>8}{'peak cpu %':>12}{'peak heap MB':>14}  test")
+        usage.sort(key=lambda row: -(row[1].get("peak_rss_mb") or row[1].get("peak_js_heap_mb") or 0))
+        for nodeid, summary in usage[:20]:
+            terminalreporter.write_line(
+                f"{summary.get('peak_rss_mb', '-'):>12}{summary.get('cpu_seconds', '-'):>8}"
+                f"{summary.get('peak_cpu_percent', '-'):>12}{summary.get('peak_js_heap_mb', '-'):>14}  {nodeid}"
+            )
+
+    remote = RemoteCommandStats()
+    # Pool counters are cumulative per worker, so keep the latest reading of each worker's pools
+    connections = {}
+    for report in terminalreporter.stats.get("passed", []) + terminalreporter.stats.get("failed", []):
+        if report.when == "call":
+            for name, value in report.user_properties:
+                if name == "remote_webdriver":
+                    remote.merge(value)
+                    for server, pool in value["connections"].items():
+                        connections[(value["worker"], server)] = pool
+    if remote.latencies:
+        summary = remote.summary()
+        terminalreporter.section("remote webdriver")
+        terminalreporter.write_line(f"{summary['requests']} commands, "
+                                    f"peak {summary['peak_in_flight']} in flight per worker")
+        for server in sorted({server for _, server in connections}):
+            pools = [pool for (_, name), pool in connections.items() if name == server]
+            terminalreporter.write_line(f"{server}: {sum(p['connections'] for p in pools)} connections for "
+                                        f"{sum(p['requests'] for p in pools)} requests "
+                                        f"({len(pools)} pool(s) of size {pools[0]['pool_size']})")
+        terminalreporter.write_line(f"{'command':<28}{'count':>7}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}")
+        by_total = sorted(summary["commands"].items(), key=lambda item: -item[1]["count"] * item[1]["p50_ms"])
+        for command, row in by_total:
+            terminalreporter.write_line(
+                f"{command:<28}{row['count']:>7}{row['p50_ms']:>10}{row['p95_ms']:>10}{row['max_ms']:>10}"
+            )
+
+    startups = []
+    for report in terminalreporter.stats.get("passed", []) + terminalreporter.stats.get("failed", []):
+        if report.when == "call":
+            startups.extend(timings for name, value in report.user_properties
+                            if name == "browser_startup" for timings in value)
+    if not startups:
+        return
+    terminalreporter.section("browser startup")
+    for i, timings in enumerate(startups, 1):
+        terminalreporter.write_line(
+            f"browser {i}: resolve {timings['resolve_ms']}ms ({timings['source']}), "
+            f"spawn {timings['spawn_ms']}ms, first command {timings['first_command_ms']}ms"
+        )
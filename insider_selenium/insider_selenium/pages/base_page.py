@@ -1,47 +1,243 @@
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-import os
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, JavascriptException
+import json
 import time
+import uuid
 from datetime import datetime
+from utils.artifacts import ArtifactWriter
+from utils.checkpoints import DUMP_STORAGE_JS, SEED_STORAGE_JS, PageCheckpoint
+from utils.network import NETWORK_TRACKER_JS, WAIT_FOR_NETWORK_IDLE_JS
+from utils.overlays import OVERLAY_SUPPRESSOR_JS
+from utils.resources import sample_resources
+from utils.tracing import note_trace
+from utils.wait_stats import WaitHistory
+
+# Resolves a Selenium (by, value) locator to an array of elements in the page
+LOCATOR_QUERY_JS = """
+    const queryLocator = (by, value) => {
+        const all = list => Array.from(list);
+        switch (by) {
+            case 'id': return all(document.querySelectorAll('#' + CSS.escape(value)));
+            case 'name': return all(document.getElementsByName(value));
+            case 'class name': return all(document.getElementsByClassName(value));
+            case 'tag name': return all(document.getElementsByTagName(value));
+            case 'css selector': return all(document.querySelectorAll(value));
+            case 'link text': return all(document.links).filter(a => a.innerText.trim() === value);
+            case 'partial link text': return all(document.links).filter(a => a.innerText.includes(value));
+            case 'xpath': {
+                const result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                const nodes = [];
+                for (let i = 0; i < result.snapshotLength; i++) nodes.push(result.snapshotItem(i));
+                return nodes;
+            }
+        }
+        throw new Error('Unsupported locator strategy: ' + by);
+    };
+    const isVisible = el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)
+        && getComputedStyle(el).visibility !== 'hidden';
+"""
+
+FIND_ANY_JS = LOCATOR_QUERY_JS + """
+    const [locators, condition] = arguments;
+    const accept = {
+        present: el => true,
+        visible: el => isVisible(el),
+        clickable: el => isVisible(el) && !el.disabled,
+    }[condition];
+    for (let i = 0; i < locators.length; i++) {
+        let matches;
+        try { matches = queryLocator(locators[i][0], locators[i][1]); } catch (e) { continue; }
+        const match = matches.find(accept);
+        if (match) return [i, match];
+    }
+    return null;
+"""
+
+# Evaluates every condition once and returns per-condition results when the any/all mode is met
+WAIT_FOR_CONDITIONS_JS = LOCATOR_QUERY_JS + """
+    const [conditions, mode, staleMarker] = arguments;
+    // The document go_to navigated away from must never satisfy a wait
+    if (staleMarker && window.__goToMarker === staleMarker) return null;
+    const textOf = el => el.innerText || el.textContent || '';
+    const check = c => {
+        let matches;
+        try { matches = queryLocator(c.by, c.value); } catch (e) { return false; }
+        switch (c.state) {
+            case 'present': return matches.length > 0;
+            case 'absent': return matches.length === 0;
+            case 'visible': return matches.some(isVisible);
+            case 'invisible': return !matches.some(isVisible);
+            case 'text': return matches.some(el => textOf(el).includes(c.text));
+            case 'count': return matches.length >= c.at_least && (c.at_most === null || matches.length <= c.at_most);
+        }
+        return false;
+    };
+    const results = conditions.map(check);
+    const met = mode === 'all' ? results.every(Boolean) : results.some(Boolean);
+    return met ? results : null;
+"""
+
+CONDITION_STATES = ("present", "absent", "visible", "invisible", "text", "count")
+
+
+def condition(locator, state="visible", text=None, at_least=1, at_most=None):
+    """Describe one locator condition for BasePage.wait_for_conditions"""
+    if state not in CONDITION_STATES:
+        raise Exception(f"Unsupported wait condition '{state}', expected one of {CONDITION_STATES}")
+    by, value = locator
+    return {"by": by, "value": value, "state": state, "text": text, "at_least": at_least, "at_most": at_most}
+
 
 class BasePage:
+    # Prefix rewrites applied to every navigation, e.g. to point the suite at a replay server
+    URL_REWRITES = {}
+
+    # utils.locator_cache.LocatorCache remembering winning fallback strategies (set by conftest)
+    locator_cache = None
+
+    # utils.wait_stats.WaitHistory sizing timeouts for waits that don't pass one (set by conftest)
+    wait_history = None
+
+    # Background writer for screenshots and page sources (replaced by conftest with the configured budget)
+    artifacts = ArtifactWriter()
+
+    # Page-state checkpoints shared by all page objects in this process, keyed by name
+    checkpoints = {}
+
+    # Conditions (see condition()) that mean a freshly loaded page of this type is usable, and how they combine
+    READY_WHEN = [condition(("tag name", "body"), "present")]
+    READY_MODE = "all"
+
+    # How long fetch/XHR traffic must be silent before the network counts as idle
+    NETWORK_QUIET_MS = 300
+
     def __init__(self, driver):
         self.driver = driver
         self.wait = WebDriverWait(driver, 10)  # Reduced from 15 to 10 seconds
+        # Result of the most recent wait_for_network_idle: {"elapsed_ms", "requests"} or None
+        self.last_network_idle = None
+        # Result of the most recent go_to: {"url", "usable_ms"} or None
+        self.last_navigation = None
+
+    def resolve_url(self, url: str):
+        """Apply URL_REWRITES to a hard-coded page URL"""
+        for prefix, target in self.URL_REWRITES.items():
+            if url.startswith(prefix):
+                return target + url[len(prefix):]
+        return url
 
-    def go_to(self, url: str):
-        """Navigate to a URL with error handling"""
+    def go_to(self, url: str, ready=None):
+        """Navigate to a URL and return as soon as the destination's readiness contract holds.
+
+        ready is the destination page-object class, or a list of conditions;
+        it defaults to this page's READY_WHEN. The old document is marked
+        before navigating so it can never satisfy the contract, which keeps
+        this safe under the eager and none page-load strategies.
+        """
+        url = self.resolve_url(url)
+        if ready is None:
+            ready = type(self)
+        conditions, mode = (ready.READY_WHEN, ready.READY_MODE) if isinstance(ready, type) else (ready, "all")
         try:
+            started = time.perf_counter()
+            marker = self._mark_document()
             self.driver.get(url)
-            # Wait for page to load
-            self.wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
-            print(f"Successfully navigated to: {url}")
+            self.wait_for_conditions(conditions, mode=mode, timeout=10, stale_marker=marker)
+            usable_ms = round((time.perf_counter() - started) * 1000)
+            self.last_navigation = {"url": url, "usable_ms": usable_ms}
+            print(f"Successfully navigated to: {url} (usable after {usable_ms} ms)")
         except Exception as e:
-            self.take_screenshot(f"navigation_error_{url.split('/')[-1]}")
+            self.trace("navigation_error", url=url, error=str(e)[:200])
             raise Exception(f"Failed to navigate to {url}: {str(e)}")
 
-    def find(self, locator, timeout=10):
-        """Find element with custom timeout and error handling"""
+    def _mark_document(self):
+        """Tag the current document with a random marker; returns it (None if there is no scriptable document)"""
+        marker = uuid.uuid4().hex
         try:
-            wait = WebDriverWait(self.driver, timeout)
-            element = wait.until(EC.presence_of_element_located(locator))
-            return element
+            self.driver.execute_script("window.__goToMarker = arguments[0];", marker)
+        except Exception:
+            return None
+        return marker
+
+    def wait_key(self, locator, condition="present"):
+        """History key for a wait on a locator (or list of locators) under a condition"""
+        locators = locator if isinstance(locator, list) else [locator]
+        target = "|".join(f"{by}={value}" for by, value in locators)
+        return f"{type(self).__name__}:{condition}:{target}"
+
+    def wait_until(self, key, predicate, timeout=None):
+        """WebDriverWait.until with outcome recorded under key.
+
+        With timeout=None the timeout and poll interval come from wait_history:
+        a ceiling near the observed p99 for known locators, fail-fast for
+        locators that never match, and 10 seconds for unseen ones. A wait cut
+        short by its ceiling that times out gets the rest of the 10 seconds,
+        so a slower run raises the ceiling instead of failing.
+        """
+        poll = WaitHistory.DEFAULT_POLL
+        budget = timeout
+        if timeout is None:
+            timeout = budget = WaitHistory.DEFAULT_TIMEOUT
+            if self.wait_history:
+                timeout, poll = self.wait_history.policy(key)
+        full_budget = timeout >= budget
+        started = time.perf_counter()
+        try:
+            try:
+                result = WebDriverWait(self.driver, timeout, poll_frequency=poll).until(predicate)
+            except TimeoutException:
+                remaining = budget - (time.perf_counter() - started)
+                if full_budget or remaining <= 0 or self.wait_history.fails_fast(key):
+                    raise
+                full_budget = True
+                print(f"Wait on {key} exceeded its {timeout:.1f}s ceiling, allowing {remaining:.1f}s more")
+                result = WebDriverWait(self.driver, remaining, poll_frequency=poll).until(predicate)
+        except TimeoutException:
+            # Fail-fast misses are not recorded, so they age out and the locator gets a full wait again
+            if self.wait_history and full_budget:
+                self.wait_history.record(key, time.perf_counter() - started, found=False)
+            raise
+        if self.wait_history:
+            self.wait_history.record(key, time.perf_counter() - started, found=True)
+        return result
+
+    def find_any(self, locators, timeout=None, condition="present"):
+        """Resolve an ordered list of locators in one browser call per poll tick.
+
+        condition is "present", "visible" or "clickable". Returns (element, index)
+        for the first locator with a matching element.
+        """
+        key = self.wait_key(locators, condition)
+        locators = [list(locator) for locator in locators]
+        try:
+            match = self.wait_until(key, lambda driver: driver.execute_script(FIND_ANY_JS, locators, condition), timeout)
+            return match[1], match[0]
+        except TimeoutException:
+            self.trace("no_locator_matched", locators=locators, condition=condition)
+            raise Exception(f"None of the locators matched ({condition}): {locators}")
+
+    def find(self, locator, timeout=None):
+        """Find element with custom timeout and error handling (accepts a list of locators)"""
+        if isinstance(locator, list):
+            return self.find_any(locator, timeout)[0]
+        try:
+            return self.wait_until(self.wait_key(locator), EC.presence_of_element_located(locator), timeout)
         except TimeoutException:
-            self.take_screenshot(f"element_not_found_{locator[1]}")
+            self.trace("element_not_found", locator=list(locator))
             raise Exception(f"Element not found: {locator}")
 
-    def find_clickable(self, locator, timeout=10):
-        """Find clickable element with custom timeout"""
+    def find_clickable(self, locator, timeout=None):
+        """Find clickable element with custom timeout (accepts a list of locators)"""
+        if isinstance(locator, list):
+            return self.find_any(locator, timeout, condition="clickable")[0]
         try:
-            wait = WebDriverWait(self.driver, timeout)
-            element = wait.until(EC.element_to_be_clickable(locator))
-            return element
+            return self.wait_until(self.wait_key(locator, "clickable"), EC.element_to_be_clickable(locator), timeout)
         except TimeoutException:
-            self.take_screenshot(f"element_not_clickable_{locator[1]}")
+            self.trace("element_not_clickable", locator=list(locator))
             raise Exception(f"Element not clickable: {locator}")
 
-    def click(self, locator, timeout=10):
+    def click(self, locator, timeout=None):
         """Click element with error handling and retry logic"""
         try:
             element = self.find_clickable(locator, timeout)
@@ -55,91 +251,264 @@ class BasePage:
                 self.driver.execute_script("arguments[0].click();", element)
                 print("Used JavaScript click as fallback")
             except:
-                self.take_screenshot(f"click_failed_{locator[1]}")
+                self.trace("click_failed", locator=str(locator), error=str(e)[:200])
                 raise Exception(f"Failed to click element {locator}: {str(e)}")
 
-    def get_elements(self, locator, timeout=10):
+    def run_strategies(self, key, strategies):
+        """Run (name, callable) fallback strategies until one succeeds.
+
+        The strategy that won last time for this page and key is tried first.
+        Returns (name, result) of the winning strategy.
+        """
+        cache_key = f"{type(self).__name__}:{key}"
+        cached = self.locator_cache.get(cache_key) if self.locator_cache else None
+        ordered = sorted(strategies, key=lambda strategy: strategy[0] != cached)
+
+        for name, strategy in ordered:
+            try:
+                result = strategy()
+            except Exception as e:
+                print(f"{key} strategy '{name}' failed: {str(e)}")
+                if name == cached:
+                    self.locator_cache.forget(cache_key)
+                continue
+            if self.locator_cache and name != cached:
+                self.locator_cache.remember(cache_key, name)
+            return name, result
+
+        raise Exception(f"All strategies failed for {key}")
+
+    def find_with_fallbacks(self, key, locators, timeout=None):
+        """Find an element using the first of several locators that works"""
+        strategies = [
+            (f"{by}={value}", lambda locator=(by, value): self.find(locator, timeout))
+            for by, value in locators
+        ]
+        return self.run_strategies(key, strategies)[1]
+
+    def get_elements(self, locator, timeout=None):
         """Get multiple elements with error handling"""
         try:
-            wait = WebDriverWait(self.driver, timeout)
-            elements = wait.until(EC.presence_of_all_elements_located(locator))
-            return elements
+            return self.wait_until(self.wait_key(locator, "all"), EC.presence_of_all_elements_located(locator), timeout)
         except TimeoutException:
-            self.take_screenshot(f"elements_not_found_{locator[1]}")
+            self.trace("elements_not_found", locator=list(locator))
             raise Exception(f"Elements not found: {locator}")
 
+    def install_document_script(self, name, source):
+        """Run a script in the current document and in every document loaded afterwards.
+
+        The script is registered once per tab via CDP (new-document scripts
+        belong to a single target); without CDP it is evaluated on every call
+        instead, so it must be idempotent.
+        Returns True when the script is registered for future documents.
+        """
+        registered = self.driver.__dict__.setdefault("_document_scripts", {})
+        key = (self.driver.current_window_handle, name)
+        if key in registered:
+            return True
+        try:
+            result = self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": source})
+            registered[key] = result["identifier"]
+        except Exception:
+            pass
+        self.driver.execute_script(source)
+        return key in registered
+
     def dismiss_cookie_banner(self):
-        """Remove Insider's cookie consent banner and other overlays if present"""
-        try:
-            self.driver.execute_script("""
-                // Remove cookie banner
-                const banner = document.getElementById('wt-cli-cookie-banner');
-                if (banner) { 
-                    banner.remove(); 
-                    console.log('Cookie banner removed');
-                }
-                
-                // Remove any other overlay modals
-                const overlays = document.querySelectorAll('[class*="modal"], [class*="overlay"], [class*="popup"], [class*="notification"]');
-                overlays.forEach(overlay => {
-                    if (overlay.style.display !== 'none') {
-                        overlay.remove();
-                        console.log('Overlay removed:', overlay.className);
-                    }
-                });
-                
-                // Remove fixed positioned elements that might interfere
-                const fixedElements = document.querySelectorAll('[style*="position: fixed"], [style*="position:fixed"]');
-                fixedElements.forEach(element => {
-                    if (element.offsetHeight > 50) { // Only remove medium+ fixed elements
-                        element.style.display = 'none';
-                        console.log('Fixed element hidden:', element.className);
-                    }
-                });
-                
-                // Remove any ads or promotional banners
-                const adSelectors = [
-                    '[class*="ad-"]', '[class*="advertisement"]', '[class*="promo"]',
-                    '[id*="ad-"]', '[id*="advertisement"]', '[id*="promo"]'
-                ];
-                
-                adSelectors.forEach(selector => {
-                    const ads = document.querySelectorAll(selector);
-                    ads.forEach(ad => {
-                        if (ad.offsetHeight > 30) { // Only remove visible ads
-                            ad.style.display = 'none';
-                            console.log('Ad element hidden:', ad.className || ad.id);
-                        }
-                    });
-                });
-                
-                // Remove any floating elements that might block clicks
-                const floatingElements = document.querySelectorAll('[style*="z-index"]');
-                floatingElements.forEach(element => {
-                    const zIndex = window.getComputedStyle(element).zIndex;
-                    if (zIndex && parseInt(zIndex) > 1000) {
-                        element.style.zIndex = '1';
-                        console.log('High z-index element lowered:', element.className);
-                    }
-                });
-            """)
-            
-            # Small wait to ensure DOM changes take effect
-            time.sleep(0.5)
-            
+        """Keep Insider's cookie consent banner and other overlays suppressed"""
+        try:
+            self.install_document_script("overlay-suppressor", OVERLAY_SUPPRESSOR_JS)
         except Exception as e:
             print(f"Could not dismiss overlays: {str(e)}")
 
+    def overlay_suppression_stats(self):
+        """What the overlay suppressor has neutralised on the current page"""
+        return self.driver.execute_script(
+            "return window.__overlaySuppressor ? window.__overlaySuppressor.counts : null;"
+        )
+
+    def checkpoint(self, name):
+        """Snapshot the current URL, cookies, storage and page-specific state under a name"""
+        state = self.driver.execute_script(DUMP_STORAGE_JS)
+        checkpoint = PageCheckpoint(
+            page=type(self).__name__,
+            url=state["url"],
+            cookies=self.driver.get_cookies(),
+            local_storage=state["local"],
+            session_storage=state["session"],
+            extras=self.checkpoint_extras()
+        )
+        self.checkpoints[name] = checkpoint
+        print(f"Checkpoint '{name}' saved at {checkpoint.url}")
+        return checkpoint
+
+    def checkpoint_extras(self):
+        """Page-specific state to store in checkpoints (override in subclasses)"""
+        return {}
+
+    def restore_checkpoint(self, name):
+        """Load a saved checkpoint directly; returns False if it is missing or not equivalent"""
+        checkpoint = self.checkpoints.get(name)
+        if checkpoint is None or checkpoint.page != type(self).__name__:
+            return False
+        try:
+            # A later step may have left us in another tab (e.g. the Lever application)
+            self.close_other_tabs()
+            self._seed_and_open(checkpoint)
+            self.wait_for_page_load()
+            self.restore_extras(checkpoint)
+            if not self.verify_checkpoint(checkpoint):
+                print(f"Restored page does not match checkpoint '{name}'")
+                return False
+        except Exception as e:
+            print(f"Could not restore checkpoint '{name}': {str(e)}")
+            return False
+        print(f"Restored checkpoint '{name}' at {checkpoint.url}")
+        return True
+
+    def close_other_tabs(self):
+        """Close every tab except the first one opened and switch back to it"""
+        handles = self.driver.window_handles
+        for handle in handles[1:]:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        if len(handles) > 1 or self.driver.current_window_handle != handles[0]:
+            self.driver.switch_to.window(handles[0])
+
+    def restore_extras(self, checkpoint):
+        """Re-apply page-specific state from checkpoint_extras (override in subclasses)"""
+
+    def verify_checkpoint(self, checkpoint):
+        """Check the restored page is equivalent to the checkpoint (extend in subclasses)"""
+        current = self.driver.current_url.split("#")[0]
+        return current == checkpoint.url.split("#")[0]
+
+    def _seed_and_open(self, checkpoint):
+        """Install cookies and storage before the checkpoint URL loads"""
+        seed = SEED_STORAGE_JS % {
+            "origin": json.dumps(checkpoint.origin),
+            "local": json.dumps(checkpoint.local_storage),
+            "session": json.dumps(checkpoint.session_storage),
+        }
+        try:
+            for cookie in checkpoint.cookies:
+                self.driver.execute_cdp_cmd("Network.setCookie", self._cdp_cookie(cookie, checkpoint.origin))
+            script = self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": seed})
+        except Exception:
+            # No CDP: load the page, set state from inside it and reload
+            self.driver.get(checkpoint.url)
+            for cookie in checkpoint.cookies:
+                self.driver.add_cookie(cookie)
+            self.driver.execute_script(seed)
+            self.driver.refresh()
+            return
+        try:
+            self.driver.get(checkpoint.url)
+        finally:
+            self.driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument",
+                                        {"identifier": script["identifier"]})
+
+    @staticmethod
+    def _cdp_cookie(cookie, origin):
+        cdp_cookie = {key: cookie[key] for key in ("name", "value", "domain", "path", "secure", "httpOnly")
+                      if key in cookie}
+        if "expiry" in cookie:
+            cdp_cookie["expires"] = cookie["expiry"]
+        if "sameSite" in cookie:
+            cdp_cookie["sameSite"] = cookie["sameSite"]
+        if "domain" not in cdp_cookie:
+            cdp_cookie["url"] = origin
+        return cdp_cookie
+
     def wait_for_page_load(self, timeout=10):
         """Wait for page to fully load"""
         try:
             wait = WebDriverWait(self.driver, timeout)
             wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
-            # Additional wait for any AJAX requests
-            time.sleep(0.5)  # Reduced from 1 to 0.5 seconds
+            # Wait for any AJAX requests
+            self.wait_for_network_idle(timeout=timeout)
         except TimeoutException:
             print("Page load timeout - continuing anyway")
 
+    def wait_for_network_idle(self, quiet_ms=None, timeout=10):
+        """Wait until no fetch/XHR request has been in flight for quiet_ms.
+
+        Returns {"elapsed_ms", "requests"} (also kept in last_network_idle),
+        or None if the network did not go idle within timeout.
+        """
+        if quiet_ms is None:
+            quiet_ms = self.NETWORK_QUIET_MS
+        self.last_network_idle = None
+        try:
+            self.install_document_script("network-tracker", NETWORK_TRACKER_JS)
+            self.driver.set_script_timeout(timeout)
+            self.last_network_idle = self.driver.execute_async_script(WAIT_FOR_NETWORK_IDLE_JS, quiet_ms)
+        except TimeoutException:
+            pending = self.driver.execute_script("return window.__netIdle ? window.__netIdle.pending : null")
+            print(f"Network not idle after {timeout}s ({pending} request(s) pending) - continuing anyway")
+        except Exception as e:
+            print(f"Could not wait for network idle: {str(e)}")
+        return self.last_network_idle
+
+    def arm_dom_observer(self, selector="body"):
+        """Install (once per document) a MutationObserver on the first element matching selector.
+
+        Returns the observer's current mutation count, to be passed as ``since``
+        to ``wait_for_dom_quiet`` so that only mutations caused by the next action count.
+        """
+        return self.driver.execute_script("""
+            const selector = arguments[0];
+            let state = window.__domQuiet;
+            const target = document.querySelector(selector) || document.body;
+            if (!state || state.selector !== selector || !state.target.isConnected) {
+                if (state) { state.observer.disconnect(); }
+                state = window.__domQuiet = {
+                    selector: selector, target: target, count: 0, last: performance.now(), observer: null
+                };
+                state.observer = new MutationObserver(records => {
+                    state.count += records.length;
+                    state.last = performance.now();
+                });
+                state.observer.observe(target, {childList: true, subtree: true, attributes: true, characterData: true});
+            }
+            return state.count;
+        """, selector)
+
+    def wait_for_dom_quiet(self, selector="body", since=None, quiet_ms=300, start_grace_ms=1000, timeout=10):
+        """Wait until the observed container has had no mutations for quiet_ms.
+
+        Resolves in a single execute_async_script call. If ``since`` is given and no
+        mutation happens after it within start_grace_ms, the container is considered
+        unchanged and the wait returns. Returns a dict with the mutation count and
+        elapsed time ("timed_out" is set if the container never went quiet), or
+        None if the observer could not be used.
+        """
+        if since is None:
+            since = self.arm_dom_observer(selector)
+        self.driver.set_script_timeout(timeout)
+        try:
+            return self.driver.execute_async_script("""
+                const [since, quietMs, graceMs, done] = arguments;
+                const state = window.__domQuiet;
+                const start = performance.now();
+                if (!state) { done(null); return; }
+                (function check() {
+                    const now = performance.now();
+                    const changed = state.count > since;
+                    if ((changed && now - state.last >= quietMs) || (!changed && now - start >= graceMs)) {
+                        done({mutations: state.count - since, elapsed_ms: Math.round(now - start)});
+                        return;
+                    }
+                    setTimeout(check, Math.max(20, Math.min(quietMs, 100)));
+                })();
+            """, since, quiet_ms, start_grace_ms)
+        except TimeoutException:
+            print(f"DOM did not settle within {timeout}s - continuing anyway")
+            return {"mutations": None, "elapsed_ms": round(timeout * 1000), "timed_out": True}
+        except Exception as e:
+            print(f"Could not wait for DOM to settle: {str(e)}")
+            return None
+
     def scroll_to_element(self, element):
         """Scroll element into view"""
         try:
@@ -148,58 +517,83 @@ class BasePage:
         except Exception as e:
             print(f"Could not scroll to element: {str(e)}")
 
+    def trace(self, event, **details):
+        """Note an event in the driver's failure trace (see utils.tracing); free when tracing is off"""
+        note_trace(self.driver, event, **details)
+
+    def sample_resources(self, label):
+        """Sample browser memory/CPU for the per-test peaks (see utils.resources); free when monitoring is off"""
+        sample_resources(self.driver, label)
+
     def take_screenshot(self, name=None):
-        """Take screenshot for debugging/failure cases"""
+        """Take screenshot for debugging/failure cases (written in the background)"""
         try:
             if not name:
                 name = f"screenshot_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             
-            # Create screenshots directory if it doesn't exist
-            screenshot_dir = "screenshots"
-            if not os.path.exists(screenshot_dir):
-                os.makedirs(screenshot_dir)
-            
-            screenshot_path = os.path.join(screenshot_dir, f"{name}.png")
-            self.driver.save_screenshot(screenshot_path)
-            print(f"Screenshot saved: {screenshot_path}")
+            screenshot_path = self.artifacts.save_screenshot(self.driver, name)
+            if screenshot_path:
+                print(f"Screenshot saved: {screenshot_path}")
             return screenshot_path
         except Exception as e:
             print(f"Could not take screenshot: {str(e)}")
             return None
 
     def get_page_source_debug(self):
-        """Get page source for debugging"""
+        """Get page source for debugging (written gzip-compressed in the background)"""
         try:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            debug_dir = "debug"
-            if not os.path.exists(debug_dir):
-                os.makedirs(debug_dir)
-            
-            with open(f"{debug_dir}/page_source_{timestamp}.html", "w", encoding="utf-8") as f:
-                f.write(self.driver.page_source)
-            print(f"Page source saved for debugging: debug/page_source_{timestamp}.html")
+            path = self.artifacts.save_text("debug", f"page_source_{timestamp}.html", self.driver.page_source)
+            if path:
+                print(f"Page source saved for debugging: {path}")
         except Exception as e:
             print(f"Could not save page source: {str(e)}")
 
-    def wait_and_handle_loading(self, additional_wait=2):
+    # Loading indicators that must all be hidden before a page counts as loaded
+    LOADING_INDICATORS = [
+        "//div[contains(@class, 'loading')]",
+        "//div[contains(@class, 'spinner')]",
+        "//div[contains(@class, 'loader')]",
+        "//*[contains(text(), 'Loading')]",
+    ]
+
+    def wait_for_conditions(self, conditions, mode="all", timeout=10, poll=0.25, stale_marker=None):
+        """Wait until all (or any) of several conditions hold, checking them in one script per poll tick.
+
+        conditions come from condition(); the whole set shares one deadline.
+        A document still carrying stale_marker (see go_to) never matches.
+        Returns the list of per-condition results at the moment the mode was met.
+        """
+        if mode not in ("all", "any"):
+            raise Exception(f"Unsupported wait mode '{mode}', expected 'all' or 'any'")
+        # Scripts can fail while a navigation swaps the document out
+        wait = WebDriverWait(self.driver, timeout, poll_frequency=poll, ignored_exceptions=[JavascriptException])
+        try:
+            return wait.until(lambda driver: driver.execute_script(WAIT_FOR_CONDITIONS_JS, conditions, mode,
+                                                                   stale_marker))
+        except TimeoutException:
+            described = [f"{c['state']} {c['by']}={c['value']}" for c in conditions]
+            raise TimeoutException(f"Timed out after {timeout}s waiting for {mode} of: {described}")
+
+    def wait_for_loading_indicators(self, indicators=None, timeout=5):
+        """Wait, with one overall deadline, until none of the loading indicators is visible"""
+        indicators = indicators or self.LOADING_INDICATORS
+        try:
+            self.wait_for_conditions([condition(("xpath", xpath), "invisible") for xpath in indicators],
+                                     timeout=timeout)
+            return True
+        except TimeoutException:
+            print(f"Loading indicators still visible after {timeout}s")
+            return False
+
+    def wait_and_handle_loading(self, additional_wait=0):
         """Wait for any loading indicators to disappear"""
         try:
-            # Wait for common loading indicators to disappear
-            loading_selectors = [
-                "//div[contains(@class, 'loading')]",
-                "//div[contains(@class, 'spinner')]", 
-                "//div[contains(@class, 'loader')]",
-                "//*[contains(text(), 'Loading')]"
-            ]
-            
-            for selector in loading_selectors:
-                try:
-                    WebDriverWait(self.driver, 5).until(
-                        EC.invisibility_of_element_located(("xpath", selector))
-                    )
-                except:
-                    pass  # Ignore if loading indicator not found
-            
-            time.sleep(additional_wait)
+            self.wait_for_loading_indicators()
+
+            # Loading indicators can disappear before the data they wait for arrives
+            self.wait_for_network_idle()
+            if additional_wait:
+                time.sleep(additional_wait)
         except Exception as e:
             print(f"Loading handler error: {str(e)}")
\ No newline at end of file
@@ -1,12 +1,14 @@
 from selenium.webdriver.common.by import By
-from .base_page import BasePage
+from .base_page import BasePage, condition
+from .qa_jobs_page import QAJobsPage
 
 class CareersPage(BasePage):
     PAGE_HEADING = (By.TAG_NAME, "h1")
+    READY_WHEN = [condition(PAGE_HEADING, "visible")]
 
     def verify_sections(self):
         heading = self.find(self.PAGE_HEADING)
         assert heading and heading.text.strip(), "Careers page heading not found!"
 
     def go_to_quality_assurance(self):
-        self.go_to("https://useinsider.com/careers/quality-assurance/")
+        self.go_to("https://useinsider.com/careers/quality-assurance/", ready=QAJobsPage)
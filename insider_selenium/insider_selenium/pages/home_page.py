@@ -1,11 +1,12 @@
 from selenium.webdriver.common.by import By
-from .base_page import BasePage
+from .base_page import BasePage, condition
+from .careers_page import CareersPage
 
 class HomePage(BasePage):
-    
+    READY_WHEN = [condition((By.TAG_NAME, "h1"), "visible")]
 
     def open(self):
         self.go_to("https://useinsider.com/")
 
     def navigate_to_careers(self):
-        self.go_to("https://useinsider.com/careers/")
+        self.go_to("https://useinsider.com/careers/", ready=CareersPage)
@@ -0,0 +1,46 @@
+import hashlib
+
+
+class JobCard:
+    """Immutable snapshot of one job listing card.
+
+    Cards are plain data read from the page, so they never go stale when the
+    listing re-renders. The id is the Lever posting id taken from the View Role
+    link, or a content hash for cards without one.
+    """
+    __slots__ = ("id", "title", "department", "location", "link", "text")
+
+    def __init__(self, id, title="", department="", location="", link="", text=""):
+        for name, value in zip(self.__slots__, (id, title, department, location, link, text)):
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_payload(cls, payload):
+        """Build a card from one entry of the job-card extraction script"""
+        fields = {name: payload.get(name) or "" for name in cls.__slots__[1:]}
+        return cls(cls.stable_id(**fields), **fields)
+
+    @staticmethod
+    def stable_id(title, department, location, link, text=""):
+        if link:
+            return link.rstrip("/").split("/")[-1].split("?")[0]
+        content = "|".join((title, department, location)).encode("utf-8")
+        return hashlib.sha1(content).hexdigest()[:12]
+
+    def _values(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("JobCard is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("JobCard is immutable")
+
+    def __eq__(self, other):
+        return isinstance(other, JobCard) and self._values() == other._values()
+
+    def __hash__(self):
+        return hash(self._values())
+
+    def __repr__(self):
+        return f"JobCard(id={self.id!r}, title={self.title!r}, location={self.location!r})"
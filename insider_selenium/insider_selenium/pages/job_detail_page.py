@@ -1,13 +1,21 @@
-from selenium.webdriver.support import expected_conditions as EC
+from utils.navigation import NavigationWatcher
 from .base_page import BasePage
 
 class JobDetailPage(BasePage):
-    def verify_application_form_displayed(self):
-        # 1) If it opened in a new tab/window, switch to it
-        handles = self.driver.window_handles
-        if len(handles) > 1:
-            self.driver.switch_to.window(handles[-1])
-
-        # 2) Wait until the URL clearly contains "lever.co"
-        self.wait.until(EC.url_contains("lever.co"))
+    # Accept the Lever redirect once the navigation commits instead of after the page loads (set by conftest)
+    EARLY_COMMIT = False
+
+    def verify_application_form_displayed(self, watcher=None):
+        """Switch to the Lever tab opened by 'View Role' and confirm the redirect.
+
+        Pass the NavigationWatcher returned by QAJobsPage.open_first_job so the
+        tab is detected from the moment of the click; without one, any tab
+        other than the current one counts as new.
+        """
+        if watcher is None:
+            watcher = NavigationWatcher(self.driver, known_handles=[self.driver.current_window_handle])
+
+        _, url = watcher.wait_for_url("lever.co", timeout=10, early_commit=self.EARLY_COMMIT)
         # At this point we know we've landed on the external application page
+        print(f"Application page opened: {url}")
+        return url
@@ -3,8 +3,53 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
 from selenium.common.exceptions import TimeoutException, ElementClickInterceptedException
+import json
 import time
-from .base_page import BasePage
+import unicodedata
+from urllib.request import urlopen
+from .base_page import BasePage, condition
+from .job_card import JobCard
+from utils.navigation import NavigationWatcher
+
+# Reads job cards [start, start + count) as plain data, plus the total number of cards.
+# count = null reads every card. Cards are the first matching card selector, or else the
+# nearest job-like container of each View Role link (never every nested div with 'job' in its class).
+JOB_CARDS_JS = """
+    const [cardSelectors, fields, viewRoleXPath, start, count] = arguments;
+    let cards = [];
+    for (const selector of cardSelectors) {
+        cards = Array.from(document.querySelectorAll(selector));
+        if (cards.length) break;
+    }
+    if (!cards.length) {
+        const links = document.evaluate(viewRoleXPath, document, null,
+                                        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        const seen = new Set();
+        for (let i = 0; i < links.snapshotLength; i++) {
+            const link = links.snapshotItem(i);
+            const card = link.closest('[class*="job"], [class*="position"]') || link.parentElement;
+            if (card && !seen.has(card)) { seen.add(card); cards.push(card); }
+        }
+    }
+    if (count === 0) return {total: cards.length, cards: []};
+    const read = (card, selector) => {
+        const el = card.querySelector(selector);
+        return el ? el.innerText.trim() : '';
+    };
+    const end = count === null ? cards.length : start + count;
+    return {
+        total: cards.length,
+        cards: cards.slice(start, end).map(card => {
+            const link = Array.from(card.querySelectorAll('a'))
+                .find(a => a.textContent.includes('View Role')) || card.querySelector('a[href]');
+            const job = {link: link ? link.href : '', text: card.innerText.trim()};
+            for (const [name, selector] of Object.entries(fields)) {
+                job[name] = read(card, selector);
+            }
+            return job;
+        })
+    };
+"""
 
 class QAJobsPage(BasePage):
     SEE_ALL_LINK = (By.XPATH, "//a[contains(text(), 'See all QA jobs')]")
@@ -29,23 +74,61 @@ class QAJobsPage(BasePage):
     JOB_DEPARTMENT = (By.XPATH, "//span[contains(@class, 'position-department') or contains(@class, 'department')]")
     JOB_LOCATION = (By.XPATH, "//div[contains(@class, 'position-location') or contains(@class, 'location')]")
 
+    # Job card extraction: card containers, in order of preference, and the fields read from each card
+    JOB_CARD_CSS = [".position-list-item", ".job-item"]
+    JOB_CARD_FIELDS_CSS = {
+        "title": ".position-title, .job-title",
+        "department": ".position-department, .department",
+        "location": ".position-location, .location",
+    }
+
+    # Lever postings feed the listing is rendered from, and where verification reads from
+    # ("ui" scrapes rendered cards, "feed" checks the whole feed and cross-checks the UI)
+    JOB_FEED_URL = "https://api.lever.co/v0/postings/useinsider?mode=json"
+    VERIFY_SOURCE = "ui"
+
+    # Filter settle detection: "observer" waits on a MutationObserver over the job list,
+    # "poll" uses the legacy job-count stability loop
+    FILTER_SETTLE_MODE = "observer"
+    JOB_LIST_CONTAINER_CSS = "#jobs-list"
+    FILTER_QUIET_MS = 300
+    FILTER_SETTLE_TIMEOUT = 10
+
+    # Usable as the QA landing page (See all link) or as the open-positions listing (job list)
+    READY_WHEN = [condition(SEE_ALL_LINK, "visible"), condition((By.CSS_SELECTOR, JOB_LIST_CONTAINER_CSS), "present")]
+    READY_MODE = "any"
+
+    # Checkpoints saved once the unfiltered QA listing is loaded, and once filters are applied to it
+    ALL_JOBS_CHECKPOINT = "qa-all-jobs"
+    FILTERED_JOBS_CHECKPOINT = "qa-filtered-jobs"
+
     def open_all_jobs(self):
         """Click 'See all QA jobs' link and wait for job listings to load"""
         self.dismiss_cookie_banner()
         
         # Wait for and click the "See all QA jobs" link
-        link = self.wait.until(EC.element_to_be_clickable(self.SEE_ALL_LINK))
+        link = self.wait_until(self.wait_key(self.SEE_ALL_LINK, "clickable"), EC.element_to_be_clickable(self.SEE_ALL_LINK))
         self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", link)
         time.sleep(1)  # Brief pause after scrolling
         link.click()
         
         # Wait for job listings to appear
-        self.wait.until(EC.presence_of_element_located((By.XPATH, self.VIEW_ROLE_XPATH)))
+        self.wait_for_view_role_links()
         print("Job listings loaded successfully")
+        self.checkpoint(self.ALL_JOBS_CHECKPOINT)
+
+    def wait_for_view_role_links(self):
+        """Wait until at least one 'View Role' link is in the job list"""
+        locator = (By.XPATH, self.VIEW_ROLE_XPATH)
+        return self.wait_until(self.wait_key(locator), EC.presence_of_element_located(locator))
 
     def apply_filters(self, location="Istanbul, Turkey", department="Quality Assurance"):
         """Apply location and department filters"""
         self.dismiss_cookie_banner()
+
+        if self.FILTER_SETTLE_MODE == "observer":
+            self._apply_filters_with_observer(location, department)
+            return
         
         # Wait a moment for the page to fully load
         time.sleep(2)  # Reduced from 3 to 2 seconds
@@ -65,49 +148,135 @@ class QAJobsPage(BasePage):
         
         print(f"Filters applied: Location='{location}', Department='{department}'")
 
+    def _apply_filters_with_observer(self, location, department):
+        """Apply filters, waiting for the job list to go quiet after each one instead of sleeping"""
+        since = self.arm_dom_observer(self.JOB_LIST_CONTAINER_CSS)
+        self._apply_location_filter(location)
+        self._wait_for_job_list_to_settle(since)
+
+        since = self.arm_dom_observer(self.JOB_LIST_CONTAINER_CSS)
+        self._apply_department_filter(department)
+        self._wait_for_job_list_to_settle(since)
+
+        print(f"Filters applied: Location='{location}', Department='{department}'")
+
+    def _wait_for_job_list_to_settle(self, since):
+        """Wait until the job list container has stopped re-rendering"""
+        result = self.wait_for_dom_quiet(
+            self.JOB_LIST_CONTAINER_CSS,
+            since=since,
+            quiet_ms=self.FILTER_QUIET_MS,
+            timeout=self.FILTER_SETTLE_TIMEOUT
+        )
+        if result is None:
+            # Observer unavailable (e.g. page navigated) - fall back to the polling loop
+            self._wait_for_filter_results_to_load(self._get_current_job_count())
+        elif result.get("timed_out"):
+            # The observer worked and the list kept changing; polling it for another 10s would not help
+            self.trace("job_list_not_settled", timeout=self.FILTER_SETTLE_TIMEOUT)
+        else:
+            print(f"Job list settled after {result['mutations']} mutation(s) in {result['elapsed_ms']}ms")
+
+    def selected_filters(self):
+        """Currently selected location and department option texts"""
+        return self.driver.execute_script("""
+            const text = id => {
+                const select = document.getElementById(id);
+                return select && select.selectedIndex >= 0 ? select.options[select.selectedIndex].text.trim() : null;
+            };
+            return {location: text(arguments[0]), department: text(arguments[1])};
+        """, self.LOCATION_FILTER[1], self.DEPARTMENT_FILTER[1])
+
+    def get_filter_options(self):
+        """All option texts of the location and department selects, read in one call (first is the "All" option)"""
+        return self.driver.execute_script("""
+            const texts = id => {
+                const select = document.getElementById(id);
+                return select ? Array.from(select.options).map(option => option.text.trim()) : [];
+            };
+            return {location: texts(arguments[0]), department: texts(arguments[1])};
+        """, self.LOCATION_FILTER[1], self.DEPARTMENT_FILTER[1])
+
+    def filter_combinations(self):
+        """Every (location, department) pair offered by the filter dropdowns"""
+        options = self.get_filter_options()
+        return [(location, department)
+                for location in options["location"][1:]
+                for department in options["department"][1:]]
+
+    def reset_filters(self):
+        """Put both filters back on their first ("All") option without reloading the page"""
+        options = self.get_filter_options()
+        current = self.selected_filters()
+        for filter_type in ("location", "department"):
+            if options[filter_type] and current.get(filter_type) != options[filter_type][0]:
+                since = self.arm_dom_observer(self.JOB_LIST_CONTAINER_CSS)
+                filter_locator = self.LOCATION_FILTER if filter_type == "location" else self.DEPARTMENT_FILTER
+                self._select_from_dropdown(filter_locator, options[filter_type][0])
+                self._wait_for_job_list_to_settle(since)
+
+    @classmethod
+    def find_mismatched_cards(cls, jobs, expected_location, expected_department):
+        """Extracted cards whose department or location field doesn't match the filters"""
+        location = cls._normalise(expected_location)
+        department = cls._normalise(expected_department)
+        return [job for job in jobs
+                if department not in cls._normalise(job.department)
+                or location not in cls._normalise(job.location)]
+
+    def checkpoint_extras(self):
+        return {"filters": self.selected_filters()}
+
+    def restore_extras(self, checkpoint):
+        """Re-apply filters that the restored URL did not already carry"""
+        wanted = checkpoint.extras.get("filters") or {}
+        # The selects are only populated once the listing has rendered
+        self.wait_for_view_role_links()
+        current = self.selected_filters()
+        if wanted.get("location") and wanted["location"] != current.get("location"):
+            since = self.arm_dom_observer(self.JOB_LIST_CONTAINER_CSS)
+            self._apply_location_filter(wanted["location"])
+            self._wait_for_job_list_to_settle(since)
+        if wanted.get("department") and wanted["department"] != current.get("department"):
+            since = self.arm_dom_observer(self.JOB_LIST_CONTAINER_CSS)
+            self._apply_department_filter(wanted["department"])
+            self._wait_for_job_list_to_settle(since)
+
+    def verify_checkpoint(self, checkpoint):
+        """Same listing URL, job list rendered and the same filters selected"""
+        if not super().verify_checkpoint(checkpoint):
+            return False
+        if not self.driver.find_elements(By.XPATH, self.VIEW_ROLE_XPATH):
+            return False
+        return self.selected_filters() == (checkpoint.extras.get("filters") or self.selected_filters())
+
     def _apply_location_filter(self, location):
         """Apply location filter using various strategies"""
-        strategies = [
-            lambda: self._select_from_dropdown(self.LOCATION_FILTER, location),
-            lambda: self._select_from_dropdown(self.LOCATION_DROPDOWN, location),
-            lambda: self._select_from_generic_dropdown("location", location),
-            lambda: self._click_filter_option("location", location)
-        ]
-        
-        for i, strategy in enumerate(strategies):
-            try:
-                strategy()
-                print(f"Location filter applied using strategy {i+1}")
-                return
-            except Exception as e:
-                print(f"Location filter strategy {i+1} failed: {str(e)}")
-                continue
-        
-        print("Warning: Could not apply location filter")
+        self._apply_filter("location", self.LOCATION_FILTER, self.LOCATION_DROPDOWN, location)
 
     def _apply_department_filter(self, department):
         """Apply department filter using various strategies"""
+        self._apply_filter("department", self.DEPARTMENT_FILTER, self.DEPARTMENT_DROPDOWN, department)
+
+    def _apply_filter(self, filter_type, filter_locator, dropdown_locator, value):
+        """Apply a filter, starting with the strategy that worked on the previous run"""
         strategies = [
-            lambda: self._select_from_dropdown(self.DEPARTMENT_FILTER, department),
-            lambda: self._select_from_dropdown(self.DEPARTMENT_DROPDOWN, department),
-            lambda: self._select_from_generic_dropdown("department", department),
-            lambda: self._click_filter_option("department", department)
+            ("filter-id", lambda: self._select_from_dropdown(filter_locator, value)),
+            ("named-dropdown", lambda: self._select_from_dropdown(dropdown_locator, value)),
+            ("generic-dropdown", lambda: self._select_from_generic_dropdown(filter_type, value)),
+            ("clickable-option", lambda: self._click_filter_option(filter_type, value))
         ]
         
-        for i, strategy in enumerate(strategies):
-            try:
-                strategy()
-                print(f"Department filter applied using strategy {i+1}")
-                return
-            except Exception as e:
-                print(f"Department filter strategy {i+1} failed: {str(e)}")
-                continue
-        
-        print("Warning: Could not apply department filter")
+        try:
+            name, _ = self.run_strategies(f"{filter_type}-filter", strategies)
+            print(f"{filter_type.capitalize()} filter applied using strategy '{name}'")
+        except Exception:
+            print(f"Warning: Could not apply {filter_type} filter")
 
     def _select_from_dropdown(self, locator, value):
         """Select value from a standard dropdown"""
-        dropdown_element = self.wait.until(EC.element_to_be_clickable(locator))
+        # Adaptive: a dropdown that has never existed on this page fails fast instead of costing 10s
+        dropdown_element = self.wait_until(self.wait_key(locator, "clickable"), EC.element_to_be_clickable(locator))
         self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", dropdown_element)
         
         select = Select(dropdown_element)
@@ -158,63 +327,178 @@ class QAJobsPage(BasePage):
             f"//*[contains(text(), '{value}')]"
         ]
         
-        for selector in possible_selectors:
-            try:
-                elements = self.driver.find_elements(By.XPATH, selector)
-                for element in elements:
-                    if element.is_displayed() and element.is_enabled():
-                        self.driver.execute_script("arguments[0].click();", element)
-                        return
-            except Exception:
+        try:
+            # Single evaluation of all candidates, as no waiting was done here before
+            element, _ = self.find_any([(By.XPATH, selector) for selector in possible_selectors],
+                                       timeout=0, condition="clickable")
+        except Exception:
+            raise Exception(f"Could not find clickable {filter_type} option for '{value}'")
+        self.driver.execute_script("arguments[0].click();", element)
+
+    def extract_job_cards(self):
+        """Return every job card as a JobCard, read in a single round trip"""
+        return [JobCard.from_payload(payload) for payload in self._read_job_cards(0, None)["cards"]]
+
+    def iter_job_cards(self, chunk_size=25, load_more=False):
+        """Stream job cards chunk by chunk without holding the whole listing.
+
+        With load_more, reaching the end scrolls to the last card and waits for
+        the list to settle, continuing if more cards were lazily loaded.
+        """
+        start = 0
+        while True:
+            chunk = self._read_job_cards(start, chunk_size)["cards"]
+            for payload in chunk:
+                yield JobCard.from_payload(payload)
+            start += len(chunk)
+            if len(chunk) == chunk_size:
                 continue
-        
-        raise Exception(f"Could not find clickable {filter_type} option for '{value}'")
+            if not load_more or not self._load_more_job_cards(start):
+                return
+
+    def _read_job_cards(self, start, count):
+        return self.driver.execute_script(
+            JOB_CARDS_JS, self.JOB_CARD_CSS, self.JOB_CARD_FIELDS_CSS, self.VIEW_ROLE_XPATH, start, count
+        ) or {"total": 0, "cards": []}
+
+    def _load_more_job_cards(self, loaded):
+        """Scroll to the end of the listing; True if more than `loaded` cards exist afterwards"""
+        since = self.arm_dom_observer(self.JOB_LIST_CONTAINER_CSS)
+        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        self.wait_for_dom_quiet(self.JOB_LIST_CONTAINER_CSS, since=since, quiet_ms=self.FILTER_QUIET_MS,
+                                start_grace_ms=500, timeout=self.FILTER_SETTLE_TIMEOUT)
+        return self._read_job_cards(0, 0)["total"] > loaded
 
     def verify_job_filters(self, expected_location="Istanbul, Turkey", expected_department="Quality Assurance"):
         """Verify that all displayed jobs match the filter criteria"""
+        if self.VERIFY_SOURCE == "feed":
+            self.verify_job_filters_from_feed(expected_location, expected_department)
+            return
+
         self.dismiss_cookie_banner()
         
         # Wait for jobs to load after filtering
-        time.sleep(2)
-        
-        # Get all job elements
-        job_elements = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'position-list-item') or contains(@class, 'job-item')]")
-        
-        if not job_elements:
-            # Try alternative job container selectors
-            job_elements = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'job') or contains(@class, 'position')]")
-        
-        assert job_elements, "No job listings found after filtering"
-        print(f"Found {len(job_elements)} job(s) after filtering")
+        self.wait_for_network_idle()
+        
+        # Stream job cards as plain data, a chunk per call
+        qa_keywords = ["quality assurance", "qa", "test", "automation"]
+        location_keywords = ["istanbul", "turkey", "remote"]
+        found = 0
+        for i, job in enumerate(self.iter_job_cards()):
+            found += 1
+            job_text = job.text.lower()
+            
+            # Check if Quality Assurance is mentioned in the job
+            has_qa = any(keyword in job_text for keyword in qa_keywords)
+            
+            # Check if Istanbul/Turkey is mentioned
+            has_location = any(keyword in job_text for keyword in location_keywords)
+            
+            print(f"Job {i+1}: QA keywords found: {has_qa}, Location keywords found: {has_location}")
+            
+            # At minimum, we expect QA-related jobs
+            assert has_qa, f"Job {i+1} does not appear to be a Quality Assurance position"
         
-        # Verify each job meets the criteria
-        for i, job in enumerate(job_elements):
-            try:
-                # Extract job details from the job element
-                job_text = job.text.lower()
-                
-                # Check if Quality Assurance is mentioned in the job
-                qa_keywords = ["quality assurance", "qa", "test", "automation"]
-                has_qa = any(keyword in job_text for keyword in qa_keywords)
-                
-                # Check if Istanbul/Turkey is mentioned
-                location_keywords = ["istanbul", "turkey", "remote"]
-                has_location = any(keyword in job_text for keyword in location_keywords)
-                
-                print(f"Job {i+1}: QA keywords found: {has_qa}, Location keywords found: {has_location}")
-                
-                # At minimum, we expect QA-related jobs
-                assert has_qa, f"Job {i+1} does not appear to be a Quality Assurance position"
-                
-            except Exception as e:
-                print(f"Warning: Could not fully verify job {i+1}: {str(e)}")
+        assert found, "No job listings found after filtering"
+        print(f"Found {found} job(s) after filtering")
+
+    def fetch_job_feed(self, timeout=15):
+        """Fetch every posting from the job feed in one HTTP request"""
+        with urlopen(self.resolve_url(self.JOB_FEED_URL), timeout=timeout) as response:
+            return json.load(response)
+
+    def verify_job_filters_from_feed(self, expected_location="Istanbul, Turkey", expected_department="Quality Assurance"):
+        """Filter the unfiltered feed here and check the rendered cards are exactly that result set"""
+        postings = self.fetch_job_feed()
+        mismatched = self.find_mismatched_postings(postings, expected_location, expected_department)
+        mismatched = {id(posting) for posting in mismatched}
+        expected = [posting for posting in postings if id(posting) not in mismatched]
+        assert expected, f"No postings in the job feed for '{expected_location}' / '{expected_department}'"
+        print(f"{len(expected)} of {len(postings)} feed postings match Location='{expected_location}', Department='{expected_department}'")
+
+        jobs = list(self.iter_job_cards())
+        unknown = self.find_cards_missing_from_feed(jobs, postings)
+        assert not unknown, (
+            f"{len(unknown)} rendered job(s) are not in the job feed: "
+            + ", ".join(job.title or job.link for job in unknown[:10])
+        )
+        outside = self.find_cards_missing_from_feed(jobs, expected)
+        assert not outside, (
+            f"{len(outside)} rendered job(s) do not match the filters: "
+            + ", ".join(job.title or job.link for job in outside[:10])
+        )
+        hidden = self.find_postings_missing_from_cards(expected, jobs)
+        assert not hidden, (
+            f"{len(hidden)} of {len(expected)} matching feed postings are not rendered: "
+            + ", ".join(posting.get("text", posting.get("id", "?")) for posting in hidden[:10])
+        )
+        print(f"All {len(jobs)} rendered job(s) match the filtered feed")
+
+    @classmethod
+    def find_mismatched_postings(cls, postings, expected_location, expected_department):
+        """Postings whose department or locations don't match the expected values"""
+        location = cls._normalise(expected_location)
+        department = cls._normalise(expected_department)
+        mismatched = []
+        for posting in postings:
+            categories = posting.get("categories") or {}
+            locations = [categories.get("location")] + list(categories.get("allLocations") or [])
+            if (cls._normalise(categories.get("department")) != department
+                    or not any(cls._normalise(loc) == location for loc in locations if loc)):
+                mismatched.append(posting)
+        return mismatched
+
+    @staticmethod
+    def _title_key(text):
+        return ("title", " ".join((text or "").split()).lower())
+
+    @classmethod
+    def _posting_keys(cls, posting):
+        """Links, id and title a rendered card can be matched to a posting by"""
+        keys = {("link", url.rstrip("/")) for url in (posting.get("hostedUrl"), posting.get("applyUrl")) if url}
+        if posting.get("id"):
+            keys.add(("id", posting["id"]))
+        keys.add(cls._title_key(posting.get("text")))
+        return keys
+
+    @classmethod
+    def _card_keys(cls, job):
+        """A card is identified by its link (and the posting id in it); only link-less cards fall back to the title"""
+        if job.link:
+            return {("link", job.link.rstrip("/")), ("id", job.id)}
+        return {cls._title_key(job.title)}
+
+    @classmethod
+    def find_cards_missing_from_feed(cls, jobs, postings):
+        """Rendered cards that match no feed posting by link or id (title for cards without a link)"""
+        keys = set()
+        for posting in postings:
+            keys.update(cls._posting_keys(posting))
+        return [job for job in jobs if not cls._card_keys(job) & keys]
+
+    @classmethod
+    def find_postings_missing_from_cards(cls, postings, jobs):
+        """Feed postings that match no rendered card by link or id (title for cards without a link)"""
+        keys = set()
+        for job in jobs:
+            keys.update(cls._card_keys(job))
+        return [posting for posting in postings if not cls._posting_keys(posting) & keys]
+
+    @staticmethod
+    def _normalise(text):
+        """Case-, accent- and spelling-insensitive form of a location/department name"""
+        text = unicodedata.normalize("NFKD", text or "").encode("ascii", "ignore").decode().lower()
+        return " ".join(text.replace("turkey", "turkiye").split())
 
     def open_first_job(self):
-        """Click on the first 'View Role' button with enhanced waiting"""
+        """Click on the first 'View Role' button with enhanced waiting.
+
+        Returns the NavigationWatcher armed just before the click, for JobDetailPage.
+        """
         self.dismiss_cookie_banner()
         
         # Wait for View Role buttons to be present and stable
-        self.wait.until(EC.presence_of_element_located((By.XPATH, self.VIEW_ROLE_XPATH)))
+        self.wait_for_view_role_links()
         
         # Additional wait to ensure all filtering/loading is complete
         self._wait_for_stable_job_list()
@@ -223,15 +507,15 @@ class QAJobsPage(BasePage):
         view_role_links = self.driver.find_elements(By.XPATH, self.VIEW_ROLE_XPATH)
         
         if not view_role_links:
-            self.take_screenshot("no_view_role_links")
+            self.trace("no_view_role_links", xpath=self.VIEW_ROLE_XPATH)
             raise AssertionError("No 'View Role' links found on the page")
         
         print(f"Found {len(view_role_links)} 'View Role' links")
         
         # Verify the first job is actually a QA job before clicking
-        first_job_container = self._find_job_container_for_link(view_role_links[0])
-        if first_job_container:
-            self._verify_job_is_qa_related(first_job_container)
+        first_job = next(self.iter_job_cards(chunk_size=1), None)
+        if first_job:
+            self._verify_job_is_qa_related(first_job)
         
         first_link = view_role_links[0]
         
@@ -242,20 +526,27 @@ class QAJobsPage(BasePage):
         # Ensure no overlays are blocking the click
         self.dismiss_cookie_banner()
         
+        # Armed before the click so the new tab can't be missed
+        watcher = NavigationWatcher(self.driver)
         try:
-            first_link.click()
-        except ElementClickInterceptedException:
-            # If normal click fails, use JavaScript click
-            self.driver.execute_script("arguments[0].click();", first_link)
-            print("Used JavaScript click due to click interception")
+            try:
+                first_link.click()
+            except ElementClickInterceptedException:
+                # If normal click fails, use JavaScript click
+                self.driver.execute_script("arguments[0].click();", first_link)
+                print("Used JavaScript click due to click interception")
+        except Exception:
+            # Nobody will call wait_for_url, so drop the BiDi handlers here
+            watcher.stop()
+            raise
         
         print("Clicked on first job's 'View Role' button")
+        return watcher
 
     def _get_current_job_count(self):
         """Get current number of job listings on the page"""
         try:
-            job_elements = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'position-list-item') or contains(@class, 'job-item') or contains(@class, 'job') or contains(@class, 'position')]")
-            return len(job_elements)
+            return self._read_job_cards(0, 0)["total"]
         except:
             return 0
 
@@ -297,26 +588,15 @@ class QAJobsPage(BasePage):
 
     def _wait_for_loading_to_complete(self):
         """Wait for any loading indicators to disappear"""
-        loading_indicators = [
-            "//div[contains(@class, 'loading')]",
-            "//div[contains(@class, 'spinner')]", 
-            "//div[contains(@class, 'loader')]",
+        self.wait_for_loading_indicators(self.LOADING_INDICATORS + [
             "//div[contains(@class, 'fetching')]",
-            "//*[contains(text(), 'Loading')]",
-            "//*[contains(text(), 'Searching')]"
-        ]
-        
-        for indicator in loading_indicators:
-            try:
-                WebDriverWait(self.driver, 5).until(
-                    EC.invisibility_of_element_located((By.XPATH, indicator))
-                )
-            except:
-                pass  # Ignore if indicator not found
+            "//*[contains(text(), 'Searching')]",
+        ])
 
     def _wait_for_stable_job_list(self, stability_time=3):
         """Wait for job list to be stable (no more changes happening)"""
         print("Waiting for job list to stabilize...")
+        self.sample_resources("before _wait_for_stable_job_list")
         
         last_html = ""
         stable_count = 0
@@ -343,56 +623,21 @@ class QAJobsPage(BasePage):
         
         # Final safety wait
         time.sleep(1)
+        self.sample_resources("after _wait_for_stable_job_list")
 
-    def _find_job_container_for_link(self, view_role_link):
-        """Find the job container that contains the given View Role link"""
-        try:
-            # Navigate up the DOM to find the parent job container
-            return self.driver.execute_script("""
-                let link = arguments[0];
-                let parent = link.parentElement;
-                
-                // Look for job container up to 5 levels up
-                for (let i = 0; i < 5; i++) {
-                    if (!parent) break;
-                    
-                    let className = parent.className || '';
-                    if (className.includes('job') || className.includes('position') || 
-                        className.includes('listing') || className.includes('item')) {
-                        return parent;
-                    }
-                    parent = parent.parentElement;
-                }
-                return null;
-            """, view_role_link)
-        except:
-            return None
-
-    def _verify_job_is_qa_related(self, job_container):
-        """Verify that a job container contains QA-related content"""
+    def _verify_job_is_qa_related(self, job):
+        """Verify that an extracted job card contains QA-related content"""
         try:
-            job_text = job_container.text.lower()
+            job_text = job.text.lower()
             qa_keywords = ["quality assurance", "qa", "test", "automation", "testing", "quality"]
             
             has_qa_keyword = any(keyword in job_text for keyword in qa_keywords)
             
             if not has_qa_keyword:
                 print(f"Warning: First job may not be QA-related. Job text: {job_text[:200]}...")
-                # Take screenshot for debugging
-                self.take_screenshot("non_qa_job_detected")
+                self.trace("non_qa_job_detected", title=job.title, link=job.link)
             else:
                 print("Confirmed: First job appears to be QA-related")
                 
         except Exception as e:
             print(f"Could not verify job content: {str(e)}")
-
-    def take_screenshot(self, name):
-        """Take screenshot for debugging (delegated to base page if available)"""
-        try:
-            if hasattr(self, 'driver'):
-                timestamp = time.strftime("%Y%m%d_%H%M%S")
-                filename = f"{name}_{timestamp}.png"
-                self.driver.save_screenshot(filename)
-                print(f"Screenshot saved: {filename}")
-        except Exception as e:
-            print(f"Could not take screenshot: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,45 @@
+import base64
+import os
+from utils.artifacts import ArtifactWriter
+
+
+def files_in(directory):
+    return sorted(os.listdir(directory))
+
+
+def test_identical_capture_is_written_once(tmp_path):
+    writer = ArtifactWriter()
+    directory = str(tmp_path / "screenshots")
+    data = base64.b64encode(b"png bytes").decode()
+    first = writer.submit(directory, "first.png", data, encoding="base64")
+    second = writer.submit(directory, "second.png", data, encoding="base64")
+    writer.close()
+
+    assert second == first
+    assert files_in(directory) == ["first.png"]
+
+
+def test_oldest_file_is_evicted_at_the_count_cap(tmp_path):
+    writer = ArtifactWriter(max_files=2)
+    directory = str(tmp_path / "sources")
+    for name in ("a", "b", "c"):
+        writer.save_text(directory, f"{name}.html", f"<html>{name}</html>", compress=False)
+        writer.flush()
+    writer.close()
+
+    assert files_in(directory) == ["b.html", "c.html"]
+    # The evicted capture is no longer deduplicated against, so it can be written again
+    assert writer.save_text(directory, "a.html", "<html>a</html>", compress=False) is not None
+    writer.close()
+
+
+def test_oldest_files_are_evicted_at_the_byte_cap(tmp_path):
+    writer = ArtifactWriter(max_bytes=250)
+    directory = str(tmp_path / "sources")
+    for name in ("a", "b", "c"):
+        writer.save_text(directory, f"{name}.html", name * 100, compress=False)
+        writer.flush()
+    writer.close()
+
+    assert files_in(directory) == ["b.html", "c.html"]
+    assert sum(os.path.getsize(os.path.join(directory, f)) for f in files_in(directory)) <= 250
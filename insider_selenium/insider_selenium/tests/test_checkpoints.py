@@ -0,0 +1,140 @@
+import pytest
+from pages.base_page import BasePage
+from pages.qa_jobs_page import QAJobsPage
+from utils.checkpoints import DUMP_STORAGE_JS
+from utils.flow import Flow, Step
+
+LISTING_URL = "https://useinsider.com/careers/open-positions/?department=qualityassurance"
+
+
+class BrowserState:
+    """A single-tab browser: cookies, storage and filter selects, reset by new_session()"""
+
+    def __init__(self):
+        self.window_handles = ["main"]
+        self.current_window_handle = "main"
+        self.switch_to = self
+        self.cdp = []
+        self.seed_scripts = {}
+        self.seeded_loads = []
+        self.new_session()
+
+    def new_session(self):
+        self.current_url = "about:blank"
+        self.cookies = []
+        self.local = {}
+        self.filters = {"location": "All", "department": "All"}
+
+    def window(self, handle):
+        self.current_window_handle = handle
+
+    def get(self, url):
+        self.current_url = url
+        # New-document scripts run before the page's own scripts
+        self.seeded_loads.append((url, list(self.seed_scripts.values())))
+
+    def get_cookies(self):
+        return list(self.cookies)
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp.append((cmd, params))
+        if cmd == "Page.addScriptToEvaluateOnNewDocument":
+            identifier = str(len(self.cdp))
+            self.seed_scripts[identifier] = params["source"]
+            return {"identifier": identifier}
+        if cmd == "Page.removeScriptToEvaluateOnNewDocument":
+            del self.seed_scripts[params["identifier"]]
+        return {}
+
+    def execute_script(self, script, *args):
+        if script == DUMP_STORAGE_JS:
+            return {"url": self.current_url, "local": dict(self.local), "session": {}}
+        if "selectedIndex" in script:
+            return dict(self.filters)
+        return 0
+
+    def find_elements(self, by, value):
+        return [object()]
+
+
+@pytest.fixture
+def browser(monkeypatch):
+    monkeypatch.setattr(BasePage, "checkpoints", {})
+    monkeypatch.setattr(BasePage, "wait_history", None)
+    monkeypatch.setattr(BasePage, "wait_for_page_load", lambda self, timeout=10: None)
+    return BrowserState()
+
+
+def listing_page(browser, monkeypatch):
+    page = QAJobsPage(browser)
+    applied = []
+
+    def apply(filter_type):
+        def select(value):
+            applied.append((filter_type, value))
+            browser.filters[filter_type] = value
+        return select
+    monkeypatch.setattr(page, "wait_for_view_role_links", lambda: None)
+    monkeypatch.setattr(page, "_wait_for_job_list_to_settle", lambda since: None)
+    monkeypatch.setattr(page, "_apply_location_filter", apply("location"))
+    monkeypatch.setattr(page, "_apply_department_filter", apply("department"))
+    return page, applied
+
+
+def test_restore_seeds_cookies_and_storage_before_the_page_loads(browser):
+    browser.get(LISTING_URL)
+    browser.cookies = [{"name": "consent", "value": "yes", "domain": ".useinsider.com", "path": "/"}]
+    browser.local = {"jobs-view": "list"}
+    page = BasePage(browser)
+    page.checkpoint("listing")
+
+    browser.new_session()
+    assert page.restore_checkpoint("listing") is True
+
+    assert ("Network.setCookie", {"name": "consent", "value": "yes", "domain": ".useinsider.com", "path": "/"}) in browser.cdp
+    url, seeds = browser.seeded_loads[-1]
+    assert url == LISTING_URL and len(seeds) == 1
+    assert '"jobs-view": "list"' in seeds[0] and '"https://useinsider.com"' in seeds[0]
+    # The seed only applies to that one load
+    assert browser.seed_scripts == {}
+
+
+def test_missing_or_stale_checkpoint_makes_the_flow_fall_back(browser, monkeypatch):
+    page, _ = listing_page(browser, monkeypatch)
+    assert page.restore_checkpoint(QAJobsPage.FILTERED_JOBS_CHECKPOINT) is False
+
+    # Saved by another page class, so it does not describe this page
+    browser.get(LISTING_URL)
+    BasePage(browser).checkpoint(QAJobsPage.FILTERED_JOBS_CHECKPOINT)
+    assert page.restore_checkpoint(QAJobsPage.FILTERED_JOBS_CHECKPOINT) is False
+
+    opened, verified = [], []
+
+    def verify():
+        verified.append(True)
+        if len(verified) == 1:
+            raise AssertionError("job list not rendered yet")
+    flow = Flow([
+        Step("open", lambda: opened.append(True)),
+        Step("filters", lambda: None, reenter=lambda: page.restore_checkpoint(QAJobsPage.FILTERED_JOBS_CHECKPOINT)),
+        Step("verify", verify),
+    ], retries=1, announce=lambda message: None)
+    flow.run()
+    assert len(opened) == 2
+    assert ("open", "ran") in [(name, status) for name, status, _ in flow.history][1:]
+
+
+def test_filters_missing_from_the_restored_url_are_reapplied(browser, monkeypatch):
+    page, applied = listing_page(browser, monkeypatch)
+    browser.get(LISTING_URL)
+    browser.filters = {"location": "Istanbul, Turkiye", "department": "Quality Assurance"}
+    page.checkpoint(QAJobsPage.FILTERED_JOBS_CHECKPOINT)
+
+    browser.new_session()
+    # The department is carried by the URL, the location is not
+    original_get = browser.get
+    browser.get = lambda url: (original_get(url), browser.filters.update(department="Quality Assurance"))
+
+    assert page.restore_checkpoint(QAJobsPage.FILTERED_JOBS_CHECKPOINT) is True
+    assert applied == [("location", "Istanbul, Turkiye")]
+    assert browser.filters == {"location": "Istanbul, Turkiye", "department": "Quality Assurance"}
@@ -0,0 +1,32 @@
+from utils.driver_factory import DEFAULT_BLOCKED_URLS, DriverFactory
+
+
+class CdpDriver:
+    """Records CDP calls; optionally rejects urlPatterns like a browser without support for them"""
+
+    def __init__(self, reject_patterns=False):
+        self.reject_patterns = reject_patterns
+        self.calls = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        if self.reject_patterns and "urlPatterns" in params:
+            raise Exception("Invalid parameters")
+        self.calls.append((cmd, params))
+        return {}
+
+
+def test_allow_exception_keeps_the_whole_deny_pattern():
+    factory = DriverFactory(lean=True, allow_urls=["https://fonts.gstatic.com/s/inter/*"])
+    assert "*fonts.gstatic.com*" in factory.blocked_urls
+    driver = CdpDriver()
+    factory.apply_url_blocking(driver)
+    assert driver.calls[-1] == ("Network.setBlockedURLs", {
+        "urls": DEFAULT_BLOCKED_URLS,
+        "urlPatterns": [{"urlPattern": "https://fonts.gstatic.com/s/inter/*", "block": False}]})
+
+
+def test_deny_list_still_applies_without_url_pattern_support():
+    factory = DriverFactory(lean=True, allow_urls=["https://fonts.gstatic.com/*"])
+    driver = CdpDriver(reject_patterns=True)
+    factory.apply_url_blocking(driver)
+    assert driver.calls[-1] == ("Network.setBlockedURLs", {"urls": DEFAULT_BLOCKED_URLS})
@@ -0,0 +1,102 @@
+import pytest
+from utils.driver_pool import DriverPool
+
+
+class PooledDriver:
+    """Tabs with an origin each; records storage clears and quits"""
+
+    def __init__(self, fail_reset=False):
+        self.fail_reset = fail_reset
+        self.origins = {"main": "null"}
+        self.window_handles = ["main"]
+        self.current_window_handle = "main"
+        self.cleared = []
+        self.quit_called = False
+        self.switch_to = self
+
+    def window(self, handle):
+        self.current_window_handle = handle
+
+    def execute(self, command, params=None):
+        if command == "get":
+            url = params["url"]
+            self.origins[self.current_window_handle] = "/".join(url.split("/")[:3]) if "://" in url else "null"
+        return {"value": None}
+
+    def get(self, url):
+        self.execute("get", {"url": url})
+
+    def open_tab(self, handle, origin):
+        self.window_handles.append(handle)
+        self.origins[handle] = origin
+
+    def close(self):
+        self.window_handles.remove(self.current_window_handle)
+
+    def execute_script(self, script, *args):
+        if self.fail_reset:
+            raise Exception("browser crashed")
+        if script == "return location.origin":
+            return self.origins[self.current_window_handle]
+
+    def execute_cdp_cmd(self, cmd, params):
+        if cmd == "Storage.clearDataForOrigin":
+            self.cleared.append(params["origin"])
+        return {}
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeFactory:
+    def __init__(self):
+        self.created = []
+
+    def create(self):
+        driver = PooledDriver()
+        self.created.append(driver)
+        return driver
+
+
+def test_checked_in_browser_is_reused_with_every_visited_origin_cleared():
+    factory = FakeFactory()
+    pool = DriverPool(factory, max_size=1)
+    driver = pool.checkout()
+    driver.get("https://useinsider.com/careers/")
+    driver.get("https://www.example.com/")
+    driver.open_tab("lever", "https://jobs.lever.co")
+    pool.checkin(driver)
+
+    assert driver.cleared == ["https://jobs.lever.co", "https://useinsider.com", "https://www.example.com"]
+    assert driver.window_handles == ["main"] and driver.current_window_handle == "main"
+    assert pool.checkout() is driver
+    assert len(factory.created) == 1
+
+
+def test_browser_that_cannot_be_reset_is_discarded_and_replaced():
+    factory = FakeFactory()
+    pool = DriverPool(factory, max_size=1)
+    broken = pool.checkout()
+    broken.fail_reset = True
+    pool.checkin(broken)
+
+    assert broken.quit_called
+    replacement = pool.checkout()
+    assert replacement is not broken and len(factory.created) == 2
+
+
+def test_checkout_waits_for_a_free_slot():
+    pool = DriverPool(FakeFactory(), max_size=1)
+    pool.checkout()
+    with pytest.raises(Exception, match="No browser became available within 0.1s"):
+        pool.checkout(timeout=0.1)
+
+
+def test_close_quits_idle_and_checked_out_browsers():
+    pool = DriverPool(FakeFactory(), max_size=2)
+    pool.warm(1)
+    idle = pool.checkout()
+    busy = pool.checkout()
+    pool.checkin(idle)
+    pool.close()
+    assert idle.quit_called and busy.quit_called
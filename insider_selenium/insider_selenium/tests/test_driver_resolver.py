@@ -0,0 +1,53 @@
+import json
+import sys
+import types
+import pytest
+from utils import driver_resolver
+from utils.driver_resolver import DriverResolver
+
+
+@pytest.fixture
+def chrome_120(monkeypatch):
+    """Chrome 120 installed, local chromedriver binaries answering with the versions in `versions`"""
+    versions = {}
+    monkeypatch.setattr(driver_resolver, "installed_chrome_version", lambda: "120.0.6099.109")
+    monkeypatch.setattr(driver_resolver, "chromedriver_version", lambda path: versions.get(path))
+    monkeypatch.setattr(DriverResolver, "_local_candidates", lambda self: iter(versions))
+
+    def no_download():
+        raise AssertionError("chromedriver download attempted")
+    monkeypatch.setitem(sys.modules, "webdriver_manager.chrome", types.SimpleNamespace(ChromeDriverManager=no_download))
+    return versions
+
+
+def fake_binary(tmp_path, name):
+    path = tmp_path / name
+    path.write_text("")
+    return str(path)
+
+
+def test_cached_index_entry_is_used_without_probing_drivers(chrome_120, tmp_path, monkeypatch):
+    cached = fake_binary(tmp_path, "chromedriver-120")
+    (tmp_path / "chromedriver-index.json").write_text(json.dumps({"120": {"path": cached, "version": "120.0.6099.109"}}))
+    monkeypatch.setattr(DriverResolver, "_local_candidates", lambda self: pytest.fail("local drivers probed"))
+    resolver = DriverResolver(cache_dir=str(tmp_path))
+    assert resolver.resolve() == cached
+    assert resolver.source == "index"
+
+
+def test_matching_local_driver_skips_the_network_and_is_indexed(chrome_120, tmp_path):
+    chrome_120[fake_binary(tmp_path, "chromedriver-119")] = "119.0.6045.105"
+    local = fake_binary(tmp_path, "chromedriver-120")
+    chrome_120[local] = "120.0.6099.109"
+    resolver = DriverResolver(cache_dir=str(tmp_path))
+    assert resolver.resolve() == local
+    assert resolver.source == "local"
+    index = json.loads((tmp_path / "chromedriver-index.json").read_text())
+    assert index["120"]["path"] == local
+
+
+def test_offline_without_a_matching_driver_fails(chrome_120, tmp_path):
+    chrome_120[fake_binary(tmp_path, "chromedriver-119")] = "119.0.6045.105"
+    resolver = DriverResolver(cache_dir=str(tmp_path), offline=True)
+    with pytest.raises(Exception, match="No local chromedriver matches Chrome 120 and downloads are disabled"):
+        resolver.resolve()
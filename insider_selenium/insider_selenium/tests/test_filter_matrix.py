@@ -0,0 +1,30 @@
+import time
+import pytest
+from pages.qa_jobs_page import QAJobsPage
+
+pytestmark = pytest.mark.matrix
+
+
+def test_filter_matrix(qa_jobs_page, filter_combinations, matrix_shard, matrix_shards, record_property):
+    """Apply every location/department pair in place on one loaded listing, one shard per test"""
+    combinations = filter_combinations(qa_jobs_page)
+    assert combinations, "No filter options found in the location/department dropdowns"
+
+    rows = []
+    for location, department in combinations[matrix_shard::matrix_shards]:
+        start = time.perf_counter()
+        qa_jobs_page.reset_filters()
+        qa_jobs_page.apply_filters(location=location, department=department)
+        jobs = qa_jobs_page.extract_job_cards()
+        mismatched = QAJobsPage.find_mismatched_cards(jobs, location, department)
+        rows.append({
+            "location": location,
+            "department": department,
+            "jobs": len(jobs),
+            "mismatched": len(mismatched),
+            "seconds": round(time.perf_counter() - start, 3),
+        })
+    record_property("filter_matrix", rows)
+
+    failures = [row for row in rows if row["mismatched"]]
+    assert not failures, f"Jobs outside the selected filters: {failures}"
@@ -0,0 +1,52 @@
+import pytest
+from utils.flow import Flow, FlowError, Step
+
+
+def flaky(calls, name, failures=1, output=None):
+    """Action that fails its first `failures` calls"""
+    def action():
+        calls.append(name)
+        if calls.count(name) <= failures:
+            raise Exception(f"{name} flaked")
+        return output
+    return action
+
+
+def test_retry_resumes_from_last_reenterable_step_and_reuses_pure_steps():
+    calls = []
+    record = lambda name, output=None: lambda: calls.append(name) or output
+    flow = Flow([
+        Step("home", record("home")),
+        Step("listing", record("listing", "listing-url"), reenter=lambda: calls.append("restore") or True),
+        Step("filters", record("filters", {"location": "Istanbul"}), requires=["listing"]),
+        Step("verify", record("verify", 12), requires=["filters"], pure=True),
+        Step("open_job", flaky(calls, "open_job"), requires=["verify"]),
+    ], retries=1, announce=lambda message: None)
+
+    outputs = flow.run()
+
+    assert calls == ["home", "listing", "filters", "verify", "open_job",
+                     "restore", "filters", "open_job"]
+    assert outputs["verify"] == 12
+    assert ("verify", "reused", 0.0) in flow.history
+
+
+def test_failure_without_reentry_restarts_and_then_gives_up():
+    calls = []
+    flow = Flow([
+        Step("home", lambda: calls.append("home")),
+        Step("careers", flaky(calls, "careers", failures=2)),
+    ], retries=1, announce=lambda message: None)
+    with pytest.raises(Exception, match="careers flaked"):
+        flow.run()
+    assert calls == ["home", "careers", "home", "careers"]
+
+
+def test_preconditions_are_checked():
+    with pytest.raises(FlowError, match="do not run before it"):
+        Flow([Step("verify", lambda: None, requires=["filters"]), Step("filters", lambda: None)])
+
+    flow = Flow([Step("open_job", lambda: None, precondition=lambda: False)], retries=0,
+                announce=lambda message: None)
+    with pytest.raises(FlowError, match="Precondition"):
+        flow.run()
@@ -0,0 +1,47 @@
+import pytest
+from pages.job_card import JobCard
+from pages.qa_jobs_page import QAJobsPage
+
+
+def payload(i):
+    return {"title": f"QA Engineer {i}", "department": "Quality Assurance", "location": "Istanbul, Turkiye",
+            "link": f"https://jobs.lever.co/useinsider/posting-{i}", "text": f"QA Engineer {i}"}
+
+
+class ListingDriver:
+    """Answers the job-card extraction script from an in-memory listing"""
+
+    def __init__(self, total):
+        self.listing = [payload(i) for i in range(total)]
+        self.calls = 0
+
+    def execute_script(self, script, *args):
+        self.calls += 1
+        start, count = args[-2], args[-1]
+        end = len(self.listing) if count is None else start + count
+        return {"total": len(self.listing), "cards": self.listing[start:end]}
+
+
+def test_job_card_is_immutable_with_stable_id():
+    card = JobCard.from_payload(payload(7))
+    assert card.id == "posting-7"
+    assert card == JobCard.from_payload(payload(7))
+    with pytest.raises(AttributeError):
+        card.title = "Changed"
+    with pytest.raises(AttributeError):
+        card.extra = "field"
+
+
+def test_job_card_without_link_gets_content_id():
+    first = JobCard.from_payload(dict(payload(1), link=""))
+    assert first.id == JobCard.from_payload(dict(payload(1), link="")).id
+    assert first.id != JobCard.from_payload(dict(payload(2), link="")).id
+
+
+def test_iter_job_cards_streams_in_chunks():
+    driver = ListingDriver(total=60)
+    cards = QAJobsPage(driver).iter_job_cards(chunk_size=25)
+    assert next(cards).id == "posting-0"
+    assert driver.calls == 1
+    assert [card.id for card in cards][-1] == "posting-59"
+    assert driver.calls == 3
@@ -0,0 +1,107 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from pages.job_card import JobCard
+from pages.qa_jobs_page import QAJobsPage
+
+
+def posting(posting_id, title, location, department):
+    return {
+        "id": posting_id,
+        "text": title,
+        "hostedUrl": f"https://jobs.lever.co/useinsider/{posting_id}",
+        "categories": {"location": location, "department": department},
+    }
+
+
+POSTINGS = [
+    posting("a1", "Senior Software QA Engineer", "Istanbul, Turkiye", "Quality Assurance"),
+    posting("a2", "QA Automation Engineer", "Istanbul, Turkey", "Quality Assurance"),
+    posting("b1", "Account Executive", "London, UK", "Sales"),
+] + [posting(f"q{i}", f"Test Engineer {i}", "Istanbul, Turkiye", "Quality Assurance") for i in range(2000)]
+
+
+@pytest.fixture
+def job_feed(monkeypatch):
+    """Local stand-in for the Lever postings feed"""
+    feed = {"requests": 0, "queries": []}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            feed["requests"] += 1
+            feed["queries"].append(parse_qs(urlsplit(self.path).query))
+            payload = json.dumps(POSTINGS).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(QAJobsPage, "JOB_FEED_URL", f"http://127.0.0.1:{server.server_address[1]}/v0/postings/useinsider?mode=json")
+    yield feed
+    server.shutdown()
+    server.server_close()
+
+
+def page_rendering(monkeypatch, jobs):
+    page = QAJobsPage(driver=None)
+    monkeypatch.setattr(page, "iter_job_cards", lambda: iter(jobs))
+    return page
+
+
+def card(posting_id, title):
+    return JobCard.from_payload({"title": title, "link": f"https://jobs.lever.co/useinsider/{posting_id}",
+                                 "text": title, "department": "Quality Assurance", "location": "Istanbul, Turkiye"})
+
+
+def qa_cards():
+    """Cards for every feed posting that matches the Istanbul / Quality Assurance filters"""
+    return [card(p["id"], p["text"]) for p in POSTINGS if p["categories"]["department"] == "Quality Assurance"]
+
+
+def test_whole_result_set_is_verified_with_one_unfiltered_request(job_feed, monkeypatch):
+    page = page_rendering(monkeypatch, qa_cards())
+    page.verify_job_filters_from_feed("Istanbul, Turkiye", "Quality Assurance")
+    assert job_feed["requests"] == 1
+    assert job_feed["queries"] == [{"mode": ["json"]}]
+
+
+def test_rendered_job_outside_the_filters_fails(job_feed, monkeypatch):
+    page = page_rendering(monkeypatch, qa_cards() + [card("b1", "Account Executive")])
+    with pytest.raises(AssertionError, match="do not match the filters: Account Executive"):
+        page.verify_job_filters_from_feed("Istanbul, Turkiye", "Quality Assurance")
+
+
+def test_rendered_job_missing_from_feed_fails(job_feed, monkeypatch):
+    page = page_rendering(monkeypatch, qa_cards() + [card("z9", "Office Manager")])
+    with pytest.raises(AssertionError, match="not in the job feed: Office Manager"):
+        page.verify_job_filters_from_feed("Istanbul, Turkiye", "Quality Assurance")
+
+
+def test_matching_posting_that_is_not_rendered_fails(job_feed, monkeypatch):
+    page = page_rendering(monkeypatch, qa_cards()[1:])
+    with pytest.raises(AssertionError, match="1 of 2002 matching feed postings are not rendered: Senior Software QA Engineer"):
+        page.verify_job_filters_from_feed("Istanbul, Turkiye", "Quality Assurance")
+
+
+def test_postings_sharing_a_title_are_told_apart_by_link():
+    istanbul = posting("ist1", "QA Engineer", "Istanbul, Turkiye", "Quality Assurance")
+    london = posting("lon1", "QA Engineer", "London, UK", "Quality Assurance")
+    expected = [p for p in (istanbul, london)
+                if p not in QAJobsPage.find_mismatched_postings([istanbul, london], "Istanbul, Turkiye", "Quality Assurance")]
+    assert expected == [istanbul]
+
+    london_card = card("lon1", "QA Engineer")
+    assert QAJobsPage.find_cards_missing_from_feed([london_card], expected) == [london_card]
+    assert QAJobsPage.find_postings_missing_from_cards(expected, [london_card]) == [istanbul]
+
+    # Without a link the title is all there is to go on
+    unlinked = JobCard.from_payload({"title": "QA  engineer", "department": "Quality Assurance"})
+    assert QAJobsPage.find_cards_missing_from_feed([unlinked], expected) == []
@@ -0,0 +1,46 @@
+import pytest
+from pages.base_page import BasePage
+from utils.locator_cache import LocatorCache
+
+
+class FilterPage(BasePage):
+    pass
+
+
+def failing():
+    raise Exception("not found")
+
+
+@pytest.fixture
+def page(tmp_path, monkeypatch):
+    monkeypatch.setattr(BasePage, "locator_cache", LocatorCache(str(tmp_path / "locators.json")))
+    return FilterPage(driver=None)
+
+
+def test_winning_strategy_is_tried_first_on_next_run(page, tmp_path):
+    calls = []
+    strategies = [
+        ("first", lambda: calls.append("first") or failing()),
+        ("second", lambda: calls.append("second") or "ok"),
+    ]
+    assert page.run_strategies("location-filter", strategies) == ("second", "ok")
+    page.locator_cache.save()
+
+    # A fresh cache loaded from disk, as on the next run
+    BasePage.locator_cache = LocatorCache(str(tmp_path / "locators.json"))
+    calls.clear()
+    assert page.run_strategies("location-filter", strategies) == ("second", "ok")
+    assert calls == ["second"]
+
+
+def test_stale_entry_is_invalidated_and_chain_falls_back(page):
+    page.locator_cache.remember("FilterPage:location-filter", "second")
+    strategies = [("first", lambda: "ok"), ("second", failing)]
+    assert page.run_strategies("location-filter", strategies) == ("first", "ok")
+    assert page.locator_cache.get("FilterPage:location-filter") == "first"
+
+
+def test_all_strategies_failing_raises(page):
+    with pytest.raises(Exception, match="All strategies failed"):
+        page.run_strategies("location-filter", [("only", failing)])
+    assert page.locator_cache.get("FilterPage:location-filter") is None
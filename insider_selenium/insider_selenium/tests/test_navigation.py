@@ -0,0 +1,102 @@
+import threading
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from pages.base_page import BasePage
+from pages.qa_jobs_page import QAJobsPage
+from utils.navigation import NavigationWatcher
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current_window_handle = handle
+
+
+class FakeBrowsingContext:
+    def __init__(self):
+        self.handlers = {}
+
+    def add_event_handler(self, event, callback):
+        self.handlers[event] = callback
+        return len(self.handlers)
+
+    def remove_event_handler(self, event, handler_id):
+        self.handlers.pop(event, None)
+
+    def emit(self, event, **params):
+        self.handlers[event](params)
+
+
+class FakeDriver:
+    def __init__(self, bidi=False):
+        self.caps = {"webSocketUrl": "ws://localhost/session"} if bidi else {}
+        self.browsing_context = FakeBrowsingContext()
+        self.window_handles = ["main"]
+        self.current_window_handle = "main"
+        self.urls = {"main": "https://useinsider.com/careers/open-positions/"}
+        self.switch_to = FakeSwitchTo(self)
+
+    @property
+    def current_url(self):
+        return self.urls[self.current_window_handle]
+
+
+def test_polling_fallback_switches_to_new_tab():
+    driver = FakeDriver()
+    watcher = NavigationWatcher(driver)
+    driver.window_handles.append("lever")
+    driver.urls["lever"] = "https://jobs.lever.co/useinsider/posting-1"
+    assert watcher.wait_for_url("lever.co", timeout=1) == ("lever", "https://jobs.lever.co/useinsider/posting-1")
+    assert driver.current_window_handle == "lever"
+
+
+def test_bidi_early_commit_does_not_wait_for_load():
+    driver = FakeDriver(bidi=True)
+    watcher = NavigationWatcher(driver)
+    context = driver.browsing_context
+    threading.Timer(0.05, lambda: (
+        context.emit("context_created", context="lever", url="about:blank"),
+        context.emit("navigation_committed", context="lever", url="https://jobs.lever.co/useinsider/posting-1"),
+    )).start()
+    handle, _ = watcher.wait_for_url("lever.co", timeout=2, early_commit=True)
+    assert handle == "lever" and driver.current_window_handle == "lever"
+    assert context.handlers == {}
+
+
+def test_bidi_without_early_commit_waits_for_load_event():
+    driver = FakeDriver(bidi=True)
+    watcher = NavigationWatcher(driver)
+    driver.browsing_context.emit("navigation_committed", context="lever", url="https://jobs.lever.co/useinsider/x")
+    with pytest.raises(TimeoutException):
+        watcher.wait_for_url("lever.co", timeout=0.1)
+
+
+class BrokenLink:
+    def click(self):
+        raise StaleElementReferenceException("link re-rendered")
+
+
+def test_failed_click_removes_the_watchers_bidi_handlers(monkeypatch):
+    driver = FakeDriver(bidi=True)
+    driver.find_elements = lambda by, value: [BrokenLink()]
+    driver.execute_script = lambda script, *args: None
+    page = QAJobsPage(driver)
+    for name in ("dismiss_cookie_banner", "wait_for_view_role_links", "_wait_for_stable_job_list"):
+        monkeypatch.setattr(page, name, lambda: None)
+    monkeypatch.setattr(page, "iter_job_cards", lambda chunk_size=None: iter(()))
+    monkeypatch.setattr("pages.qa_jobs_page.time.sleep", lambda seconds: None)
+
+    with pytest.raises(StaleElementReferenceException):
+        page.open_first_job()
+    assert driver.browsing_context.handlers == {}
+
+
+def test_closing_other_tabs_returns_to_the_original_one():
+    driver = FakeDriver()
+    driver.window_handles.append("lever")
+    driver.current_window_handle = "lever"
+    driver.close = lambda: driver.window_handles.remove(driver.current_window_handle)
+    BasePage(driver).close_other_tabs()
+    assert driver.window_handles == ["main"] and driver.current_window_handle == "main"
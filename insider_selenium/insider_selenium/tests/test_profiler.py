@@ -0,0 +1,27 @@
+import time
+from pages.base_page import BasePage
+from utils.profiler import CommandProfiler
+
+
+class IdleDriver:
+    def execute(self, command, params=None):
+        return {"value": None}
+
+
+def test_wait_polls_are_profiled_under_the_waiting_method(monkeypatch):
+    # Keep the fake wait out of the session's on-disk wait history
+    monkeypatch.setattr(BasePage, "wait_history", None)
+    driver = IdleDriver()
+    profiler = CommandProfiler("wait")
+    profiler.attach(driver)
+    ready_at = time.perf_counter() + 0.2
+    try:
+        BasePage(driver).wait_until("BasePage:present:id=x", lambda d: time.perf_counter() >= ready_at, timeout=2)
+    finally:
+        profiler.detach()
+
+    waits = [event for event in profiler.events if event["kind"] == "wait"]
+    assert waits and waits[0]["stack"] == ["BasePage.wait_until", "WebDriverWait.until"]
+    assert sum(event["duration_ms"] for event in waits) >= 150
+    assert profiler.report()["by_method"]["WebDriverWait.until"]["waits"] == len(waits)
+    assert "WebDriverWait.until;wait:poll" in profiler.folded_stacks()
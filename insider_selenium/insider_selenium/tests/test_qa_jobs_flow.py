@@ -3,10 +3,11 @@ from pages.home_page import HomePage
 from pages.careers_page import CareersPage  
 from pages.qa_jobs_page import QAJobsPage
 from pages.job_detail_page import JobDetailPage
+from utils.flow import Flow, Step
 
 @pytest.mark.usefixtures('driver')
 class TestQAJobsFlow:
-    def test_end_to_end_qa_flow(self, driver):
+    def test_end_to_end_qa_flow(self, driver, step):
         """
         Test automation flow as per requirements:
         1. Visit Insider homepage and verify it opens
@@ -14,49 +15,53 @@ class TestQAJobsFlow:
         3. Go to QA jobs page and apply filters
         4. Verify filtered jobs meet criteria
         5. Click View Role and verify Lever application form
+
+        Runs as a Flow: if a step fails, the retry resumes from the last
+        checkpointed step instead of walking the whole site again.
         """
-        
-        # Step 1: Visit homepage and verify it opens
-        print("Step 1: Opening Insider homepage...")
         home_page = HomePage(driver)
-        home_page.open()
-        
-        # Step 2: Navigate to Careers and verify sections
-        print("Step 2: Navigating to Careers page...")
-        home_page.navigate_to_careers()
-        
         careers_page = CareersPage(driver)
-        careers_page.verify_sections()
-        
-        # Step 3: Go to QA jobs page
-        print("Step 3: Going to Quality Assurance jobs page...")
-        careers_page.go_to_quality_assurance()
-        
-        # Step 4: Open job listings and apply filters
-        print("Step 4: Opening job listings and applying filters...")
         qa_page = QAJobsPage(driver)
-        qa_page.open_all_jobs()
+        job_detail_page = JobDetailPage(driver)
+
+        def open_careers():
+            home_page.navigate_to_careers()
+            careers_page.verify_sections()
+
+        def apply_filters():
+            # Apply filters as required: Istanbul, Turkey + Quality Assurance
+            qa_page.apply_filters(location="Istanbul, Turkiye", department="Quality Assurance")
+            qa_page.checkpoint(QAJobsPage.FILTERED_JOBS_CHECKPOINT)
+            return qa_page.selected_filters()
+
+        flow = Flow([
+            Step("home", home_page.open, title="Step 1: Opening Insider homepage..."),
+            Step("careers", open_careers, title="Step 2: Navigating to Careers page..."),
+            Step("qa_page", careers_page.go_to_quality_assurance, title="Step 3: Going to Quality Assurance jobs page..."),
+            Step("all_jobs", qa_page.open_all_jobs, title="Step 4: Opening job listings...",
+                 reenter=lambda: qa_page.restore_checkpoint(QAJobsPage.ALL_JOBS_CHECKPOINT)),
+            Step("filters", apply_filters, title="Step 5: Applying filters...", requires=["all_jobs"],
+                 reenter=lambda: qa_page.restore_checkpoint(QAJobsPage.FILTERED_JOBS_CHECKPOINT)),
+            Step("verified", lambda: qa_page.verify_job_filters(expected_location="Istanbul, Turkiye",
+                                                                expected_department="Quality Assurance"),
+                 title="Step 6: Verifying filtered jobs meet criteria...", requires=["filters"], pure=True),
+            Step("first_job", qa_page.open_first_job, title="Step 7: Clicking on first job's View Role button...",
+                 requires=["verified"],
+                 precondition=lambda: next(qa_page.iter_job_cards(chunk_size=1), None) is not None),
+            Step("application", lambda: job_detail_page.verify_application_form_displayed(flow.outputs["first_job"]),
+                 title="Step 8: Verifying redirect to Lever application form...", requires=["first_job"]),
+        ], retries=1, announce=step)
+        flow.run()
         
-        # Apply filters as required: Istanbul, Turkey + Quality Assurance
-        qa_page.apply_filters(
-            location="Istanbul, Turkiye", 
+        print("Test completed successfully!")
+
+    def test_filtered_jobs_are_qa_positions(self, qa_jobs_page):
+        """Filtering only: starts from the QA listing checkpoint instead of walking the site"""
+        qa_jobs_page.apply_filters(
+            location="Istanbul, Turkiye",
             department="Quality Assurance"
         )
-        
-        # Step 5: Verify filtered jobs meet criteria
-        print("Step 5: Verifying filtered jobs meet criteria...")
-        qa_page.verify_job_filters(
+        qa_jobs_page.verify_job_filters(
             expected_location="Istanbul, Turkiye",
             expected_department="Quality Assurance"
         )
-        
-        # Step 6: Click first job's View Role button
-        print("Step 6: Clicking on first job's View Role button...")
-        qa_page.open_first_job()
-        
-        # Step 7: Verify redirect to Lever application form
-        print("Step 7: Verifying redirect to Lever application form...")
-        job_detail_page = JobDetailPage(driver)
-        job_detail_page.verify_application_form_displayed()
-        
-        print("Test completed successfully!")
\ No newline at end of file
@@ -0,0 +1,48 @@
+from utils.remote import PooledRemoteConnection, RemoteCommandStats
+
+SERVER = "http://127.0.0.1:9515"
+
+
+def test_sessions_share_one_pool_until_the_last_closes():
+    first = PooledRemoteConnection(SERVER, pool_size=4)
+    second = PooledRemoteConnection(SERVER, pool_size=4)
+    manager = first._conn
+    assert second._conn is manager
+    assert manager.connection_pool_kw["maxsize"] == 4
+
+    first.close()
+    assert PooledRemoteConnection._shared[(SERVER, 4)] == [manager, 1]
+    second.close()
+    assert (SERVER, 4) not in PooledRemoteConnection._shared
+
+
+def test_command_latency_is_recorded_per_command(monkeypatch):
+    stats = RemoteCommandStats()
+    monkeypatch.setattr(PooledRemoteConnection, "stats", stats)
+    monkeypatch.setattr(PooledRemoteConnection, "_request", lambda self, method, url, body=None: {"value": None})
+    connection = PooledRemoteConnection(SERVER, pool_size=2)
+    for _ in range(3):
+        connection.execute("getCurrentUrl", {"sessionId": "abc"})
+    connection.close()
+
+    summary = stats.summary()
+    assert summary["requests"] == 3
+    assert summary["commands"]["getCurrentUrl"]["count"] == 3
+    assert summary["peak_in_flight"] == 1
+
+
+def test_drained_samples_merge_into_one_summary():
+    workers = [RemoteCommandStats(), RemoteCommandStats()]
+    for worker, latencies in zip(workers, ([0.010, 0.020], [0.030])):
+        for seconds in latencies:
+            worker.begin()
+            worker.end("findElement", seconds)
+    merged = RemoteCommandStats()
+    for worker in workers:
+        merged.merge(worker.drain())
+
+    assert workers[0].summary()["requests"] == 0
+    summary = merged.summary()
+    assert summary["commands"]["findElement"]["count"] == 3
+    assert summary["commands"]["findElement"]["max_ms"] == 30.0
+    assert summary["peak_in_flight"] == 1
@@ -0,0 +1,63 @@
+import os
+import subprocess
+import sys
+from utils.resources import ResourceMonitor, _proc_tree_usage, budget_violations
+
+
+class MetricsDriver:
+    """Reports a fixed JS heap through CDP Performance.getMetrics"""
+
+    def __init__(self, heap_mb):
+        self.heap_mb = heap_mb
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        if cmd == "Performance.getMetrics":
+            return {"metrics": [{"name": "JSHeapUsedSize", "value": self.heap_mb * 1024 * 1024}]}
+        return {}
+
+
+def test_process_tree_includes_descendants():
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"])
+    try:
+        rss, cpu, count = _proc_tree_usage(os.getpid())
+        assert count >= 2
+        assert rss > 0 and cpu > 0
+    finally:
+        child.kill()
+        child.wait()
+
+
+def test_monitor_keeps_peaks_and_where_they_happened():
+    driver = MetricsDriver(heap_mb=20)
+    monitor = ResourceMonitor(driver, root_pid=os.getpid()).attach()
+    monitor.sample("test start")
+    driver.heap_mb = 80
+    monitor.sample("after _wait_for_stable_job_list")
+    driver.heap_mb = 30
+    monitor.sample("test end")
+    monitor.detach()
+
+    summary = monitor.summary()
+    assert summary["peak_js_heap_mb"] == 80
+    assert summary["peak_at"]["js_heap_mb"] == "after _wait_for_stable_job_list"
+    assert summary["peak_rss_mb"] > 0 and summary["cpu_seconds"] >= 0
+    # Samples milliseconds apart are too close for a meaningful CPU percentage
+    assert "peak_cpu_percent" not in summary
+    assert "_resource_monitor" not in driver.__dict__
+
+    assert budget_violations(summary, {"js_heap_mb": 50, "rss_mb": None}) == [
+        "browser js_heap_mb peaked at 80.0 (budget 50) during 'after _wait_for_stable_job_list'"]
+
+
+def test_cpu_percent_needs_a_minimum_window(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr("utils.resources.time.monotonic", lambda: clock[0])
+    monkeypatch.setattr("utils.resources.process_tree_usage", lambda pid: (0, cpu[0], 1))
+    cpu = [10.0]
+    monitor = ResourceMonitor(MetricsDriver(heap_mb=20), root_pid=1)
+    monitor.sample("test start")
+    clock[0], cpu[0] = 100.01, 10.01
+    assert "cpu_percent" not in monitor.sample("mid-test")
+    clock[0], cpu[0] = 102.0, 11.0
+    assert monitor.sample("test end")["cpu_percent"] == 50.0
+    assert monitor.summary()["cpu_seconds"] == 1.0
@@ -0,0 +1,59 @@
+import gzip
+import json
+import pytest
+from utils.artifacts import ArtifactWriter
+from utils.tracing import DRAIN_TRACE_JS, TraceRecorder, note_trace
+
+
+class CommandDriver:
+    """Answers WebDriver commands from memory; findElement always misses"""
+
+    def __init__(self):
+        self.page_events = [{"t": 1, "kind": "console", "level": "error", "text": "boom"}]
+
+    def execute(self, command, params=None):
+        if command == "findElement":
+            raise LookupError("no such element")
+        return {"value": None}
+
+    def execute_script(self, script, *args):
+        if script == DRAIN_TRACE_JS:
+            return {"events": self.page_events, "dropped": 4}
+        return self.execute("executeScript", {"script": script, "args": list(args)})["value"]
+
+    @property
+    def current_url(self):
+        return "https://useinsider.com/careers/open-positions/"
+
+
+def test_ring_keeps_only_recent_commands_with_errors():
+    driver = CommandDriver()
+    tracer = TraceRecorder(size=3)
+    tracer.attach(driver)
+    for i in range(5):
+        driver.execute("get", {"url": f"https://example.com/{i}"})
+    with pytest.raises(LookupError):
+        driver.execute("findElement", {"using": "xpath", "value": "//h1"})
+    tracer.detach()
+
+    assert [entry.get("args") for entry in tracer.commands] == [
+        "https://example.com/3", "https://example.com/4", "xpath=//h1"]
+    assert tracer.commands[-1]["error"] == "LookupError"
+    assert "execute" not in driver.__dict__
+
+
+def test_flush_merges_page_events_into_compact_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    driver = CommandDriver()
+    tracer = TraceRecorder()
+    tracer.attach(driver)
+    note_trace(driver, "element_not_found", locator=["id", "jobs-list"])
+    artifacts = ArtifactWriter()
+    path = tracer.flush("test_listing", artifacts)
+    artifacts.flush()
+
+    with gzip.open(tmp_path / path, "rt", encoding="utf-8") as f:
+        trace = json.load(f)
+    assert trace["url"] == "https://useinsider.com/careers/open-positions/"
+    assert trace["page_dropped"] == 4
+    assert [event["kind"] for event in trace["events"]] == ["console", "note"]
@@ -0,0 +1,30 @@
+from utils.traffic_archive import TrafficRecorder
+
+
+class LogDriver:
+    """Counts how often the performance log is drained"""
+
+    def __init__(self):
+        self.drains = 0
+
+    def execute(self, command, params=None):
+        return {"value": None}
+
+    def get_log(self, log_type):
+        self.drains += 1
+        return []
+
+
+def test_only_navigating_commands_drain_the_log(tmp_path):
+    driver = LogDriver()
+    recorder = TrafficRecorder(str(tmp_path))
+    recorder.attach(driver)
+    driver.execute("w3cExecuteScript", {"script": "return document.readyState;", "args": []})
+    driver.execute("findElement", {"using": "xpath", "value": "//h1"})
+    assert driver.drains == 0
+
+    driver.execute("w3cExecuteScript", {"script": "arguments[0].click();", "args": []})
+    driver.execute("get", {"url": "https://useinsider.com/careers/"})
+    assert driver.drains == 2
+    recorder.detach(driver)
+    assert driver.drains == 3
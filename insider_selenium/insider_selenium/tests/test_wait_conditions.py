@@ -0,0 +1,149 @@
+import pytest
+from selenium.common.exceptions import TimeoutException
+from pages.base_page import BasePage, WAIT_FOR_CONDITIONS_JS, condition
+from pages.qa_jobs_page import QAJobsPage
+
+
+class ScriptedDriver:
+    """Returns queued results for the composite-condition script, one per call"""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = []
+
+    def execute_script(self, script, *args):
+        assert script == WAIT_FOR_CONDITIONS_JS
+        self.calls.append(args)
+        return self.results.pop(0) if self.results else None
+
+
+def test_all_conditions_are_checked_in_one_call_per_tick():
+    driver = ScriptedDriver(None, None, [True, True])
+    conditions = [condition(("css selector", ".spinner"), "invisible"),
+                  condition(("xpath", "//a[text()='View Role']"), "count", at_least=3)]
+    assert BasePage(driver).wait_for_conditions(conditions, poll=0.01) == [True, True]
+    assert len(driver.calls) == 3
+    assert driver.calls[0] == (conditions, "all", None)
+
+
+def test_conditions_share_one_deadline():
+    driver = ScriptedDriver()
+    conditions = [condition(("xpath", f"//div[@class='loader-{i}']"), "invisible") for i in range(6)]
+    with pytest.raises(TimeoutException, match="any of"):
+        BasePage(driver).wait_for_conditions(conditions, mode="any", timeout=0.2, poll=0.05)
+    assert BasePage(driver).wait_for_loading_indicators(timeout=0.1) is False
+
+
+def test_unknown_condition_state_is_rejected():
+    with pytest.raises(Exception, match="Unsupported wait condition"):
+        condition(("id", "jobs-list"), "shown")
+
+
+class NavigatingDriver:
+    """Keeps serving the old document (still marked) for a few ticks after get()"""
+
+    def __init__(self, stale_ticks):
+        self.stale_ticks = stale_ticks
+        self.marker = None
+        self.waited_with = []
+
+    def get(self, url):
+        self.url = url
+
+    def execute_script(self, script, *args):
+        if script != WAIT_FOR_CONDITIONS_JS:
+            if "__goToMarker" in script:
+                self.marker = args[0]
+            return None
+        conditions, mode, stale_marker = args
+        self.waited_with.append((conditions, mode))
+        if stale_marker == self.marker and self.stale_ticks:
+            self.stale_ticks -= 1
+            return None
+        return [True] * len(conditions)
+
+
+class ListingPage(BasePage):
+    READY_WHEN = [condition(("id", "jobs-list"), "present"), condition(("id", "see-all"), "visible")]
+    READY_MODE = "any"
+
+
+def test_go_to_waits_past_the_marked_old_document_for_destination_contract():
+    driver = NavigatingDriver(stale_ticks=2)
+    page = BasePage(driver)
+    page.go_to("https://useinsider.com/careers/open-positions/", ready=ListingPage)
+    assert driver.marker is not None
+    assert len(driver.waited_with) == 3
+    assert driver.waited_with[-1] == (ListingPage.READY_WHEN, "any")
+    assert page.last_navigation["url"] == "https://useinsider.com/careers/open-positions/"
+
+
+class IdleNetworkDriver(NavigatingDriver):
+    """NavigatingDriver whose network is already idle"""
+
+    current_window_handle = "main"
+
+    def set_script_timeout(self, timeout):
+        pass
+
+    def execute_async_script(self, script, *args):
+        return {"elapsed_ms": 300, "requests": 2}
+
+
+def test_network_idle_wait_keeps_last_navigation():
+    page = BasePage(IdleNetworkDriver(stale_ticks=0))
+    page.go_to("https://useinsider.com/careers/")
+    assert page.wait_for_network_idle() == {"elapsed_ms": 300, "requests": 2}
+    assert page.last_navigation["url"] == "https://useinsider.com/careers/"
+
+
+class TabbedDriver:
+    """Records which tab each new-document script was registered in"""
+
+    def __init__(self):
+        self.current_window_handle = "main"
+        self.registered = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.registered.append(self.current_window_handle)
+        return {"identifier": str(len(self.registered))}
+
+    def execute_script(self, script, *args):
+        return None
+
+
+def test_overlay_suppressor_is_installed_in_each_tab():
+    driver = TabbedDriver()
+    page = BasePage(driver)
+    page.dismiss_cookie_banner()
+    page.dismiss_cookie_banner()
+    driver.current_window_handle = "lever"
+    page.dismiss_cookie_banner()
+    assert driver.registered == ["main", "lever"]
+
+
+class ObservedListDriver:
+    """Job list whose DOM-quiet wait either times out or finds no observer"""
+
+    def __init__(self, outcome):
+        self.outcome = outcome
+
+    def execute_script(self, script, *args):
+        return 0
+
+    def set_script_timeout(self, timeout):
+        pass
+
+    def execute_async_script(self, script, *args):
+        if self.outcome == "timeout":
+            raise TimeoutException("script timeout")
+        return None
+
+
+@pytest.mark.parametrize("outcome, polled", [("timeout", False), ("unarmed", True)])
+def test_job_list_falls_back_to_polling_only_without_an_observer(outcome, polled, monkeypatch):
+    page = QAJobsPage(ObservedListDriver(outcome))
+    calls = []
+    monkeypatch.setattr(page, "_wait_for_filter_results_to_load", lambda count: calls.append(count))
+    page._wait_for_job_list_to_settle(since=0)
+    assert bool(calls) == polled
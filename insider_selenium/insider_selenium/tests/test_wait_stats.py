@@ -0,0 +1,64 @@
+import json
+import time
+import pytest
+from selenium.common.exceptions import TimeoutException
+from pages.base_page import BasePage
+from utils.wait_stats import WaitHistory
+
+
+class FilterPage(BasePage):
+    pass
+
+
+@pytest.fixture
+def page(tmp_path, monkeypatch):
+    monkeypatch.setattr(BasePage, "wait_history", WaitHistory(str(tmp_path / "waits.json")))
+    return FilterPage(driver=None)
+
+
+def test_unseen_locator_gets_conservative_default(page):
+    assert page.wait_history.policy("FilterPage:present:id=unknown") == (10, 0.5)
+
+
+def test_known_locator_ceiling_follows_history_across_runs(page, tmp_path):
+    key = page.wait_key(("id", "jobs-list"))
+    for _ in range(WaitHistory.MIN_SAMPLES):
+        assert page.wait_until(key, lambda driver: True) is True
+    page.wait_history.save()
+
+    # A fresh history loaded from disk, as on the next run
+    timeout, poll = WaitHistory(str(tmp_path / "waits.json")).policy(key)
+    assert timeout == pytest.approx(WaitHistory.SLACK, abs=0.05)
+    assert poll == WaitHistory.MIN_POLL
+
+
+def test_locator_that_never_matches_fails_fast(page):
+    key = page.wait_key(("id", "filter-by-location"), "clickable")
+    for _ in range(WaitHistory.MIN_SAMPLES):
+        page.wait_history.record(key, 10, found=False)
+
+    started = time.perf_counter()
+    with pytest.raises(TimeoutException):
+        page.wait_until(key, lambda driver: False)
+    assert time.perf_counter() - started < 2
+
+
+def test_wait_past_its_ceiling_gets_the_rest_of_the_default_budget(page):
+    key = page.wait_key(("id", "jobs-list"))
+    for _ in range(WaitHistory.MIN_SAMPLES):
+        page.wait_history.record(key, 0.01, found=True)
+    ceiling, _ = page.wait_history.policy(key)
+
+    ready_at = time.perf_counter() + ceiling + 0.3
+    assert page.wait_until(key, lambda driver: time.perf_counter() >= ready_at) is True
+    # The slower wait is recorded as a hit, so the ceiling grows instead of locking in
+    assert page.wait_history.policy(key)[0] > ceiling + 0.3
+
+
+def test_misses_age_out(page, tmp_path):
+    key = page.wait_key(("id", "filter-by-location"), "clickable")
+    stale = time.time() - WaitHistory.MISS_TTL - 60
+    (tmp_path / "waits.json").write_text(json.dumps({key: {"hits": [], "misses": [stale] * 10}}))
+    history = WaitHistory(str(tmp_path / "waits.json"))
+    assert not history.fails_fast(key)
+    assert history.policy(key) == (WaitHistory.DEFAULT_TIMEOUT, WaitHistory.DEFAULT_POLL)
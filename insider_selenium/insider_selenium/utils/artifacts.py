@@ -0,0 +1,130 @@
+"""Background writer for debugging artifacts (screenshots, page sources).
+
+Captures are taken in memory on the test thread and handed to a single
+worker thread that decodes, compresses and writes them. Identical captures
+are written once, and each artifact directory is kept within a file-count
+and byte budget by evicting the oldest files. If the queue is full the
+capture is dropped rather than blocking the test.
+"""
+import atexit
+import base64
+import gzip
+import hashlib
+import os
+import queue
+import threading
+from collections import OrderedDict
+
+
+class ArtifactWriter:
+    def __init__(self, max_files=200, max_bytes=100 * 1024 * 1024, queue_size=32):
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._seen = {}
+        self._ledgers = {}
+        self._thread = None
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def save_screenshot(self, driver, name, directory="screenshots"):
+        """Capture a screenshot now and write it in the background; returns the target path"""
+        data = driver.get_screenshot_as_base64()
+        return self.submit(directory, f"{name}.png", data, encoding="base64")
+
+    def save_text(self, directory, filename, text, compress=True):
+        """Write text (e.g. page source) in the background, gzip-compressed by default"""
+        if compress:
+            filename += ".gz"
+        return self.submit(directory, filename, text, encoding="gzip" if compress else "utf-8")
+
+    def submit(self, directory, filename, data, encoding):
+        digest = hashlib.sha1(data.encode("utf-8") if isinstance(data, str) else data).hexdigest()
+        with self._lock:
+            if digest in self._seen:
+                return self._seen[digest]
+            path = os.path.join(directory, filename)
+            self._seen[digest] = path
+        try:
+            self._queue.put_nowait((directory, path, data, encoding))
+        except queue.Full:
+            self.dropped += 1
+            with self._lock:
+                del self._seen[digest]
+            print(f"Artifact writer busy, dropped {path}")
+            return None
+        self._ensure_worker()
+        return path
+
+    def flush(self):
+        """Block until every queued artifact has been written"""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self):
+        if self._thread is not None:
+            self.flush()
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _ensure_worker(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._write(*item)
+            except Exception as e:
+                print(f"Could not write artifact: {str(e)}")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, directory, path, data, encoding):
+        if encoding == "base64":
+            payload = base64.b64decode(data)
+        elif encoding == "gzip":
+            payload = gzip.compress(data.encode("utf-8"))
+        else:
+            payload = data.encode("utf-8")
+        os.makedirs(directory, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(payload)
+        self._enforce_budget(directory, path, len(payload))
+
+    def _enforce_budget(self, directory, path, size):
+        ledger = self._ledger(directory)
+        ledger.pop(path, None)
+        ledger[path] = size
+        while len(ledger) > self.max_files or sum(ledger.values()) > self.max_bytes:
+            oldest, _ = ledger.popitem(last=False)
+            if oldest == path:
+                ledger[path] = size
+                break
+            try:
+                os.remove(oldest)
+            except OSError:
+                pass
+            with self._lock:
+                for digest, seen_path in list(self._seen.items()):
+                    if seen_path == oldest:
+                        del self._seen[digest]
+
+    def _ledger(self, directory):
+        """Files in directory, oldest first, including those left by earlier runs"""
+        ledger = self._ledgers.get(directory)
+        if ledger is None:
+            entries = []
+            for entry in os.scandir(directory):
+                if entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.path, stat.st_size))
+            ledger = self._ledgers[directory] = OrderedDict((p, size) for _, p, size in sorted(entries))
+        return ledger
@@ -0,0 +1,42 @@
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+# Collects a storage area into a plain object
+DUMP_STORAGE_JS = """
+    const dump = storage => {
+        const out = {};
+        for (let i = 0; i < storage.length; i++) {
+            const key = storage.key(i);
+            out[key] = storage.getItem(key);
+        }
+        return out;
+    };
+    return {url: location.href, local: dump(localStorage), session: dump(sessionStorage)};
+"""
+
+# Seeds storage for the checkpoint's origin before any page script runs
+SEED_STORAGE_JS = """
+(() => {
+    if (location.origin !== %(origin)s) return;
+    const seed = (storage, items) => {
+        for (const [key, value] of Object.entries(items)) storage.setItem(key, value);
+    };
+    try { seed(localStorage, %(local)s); seed(sessionStorage, %(session)s); } catch (e) {}
+})();
+"""
+
+
+@dataclass(frozen=True)
+class PageCheckpoint:
+    """Reachable state of a page: where it was and what the browser remembered there"""
+    page: str
+    url: str
+    cookies: list = field(default_factory=list)
+    local_storage: dict = field(default_factory=dict)
+    session_storage: dict = field(default_factory=dict)
+    extras: dict = field(default_factory=dict)
+
+    @property
+    def origin(self):
+        parts = urlsplit(self.url)
+        return f"{parts.scheme}://{parts.netloc}"
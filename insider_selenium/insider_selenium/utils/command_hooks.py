@@ -0,0 +1,40 @@
+"""Chain of hooks around WebDriver.execute, the single choke point every command passes through.
+
+A hook is a callable ``hook(execute, command, params)`` that must call
+``execute(command, params)`` to continue the chain and return its result.
+Hooks can be added and removed in any order; with no hooks installed the
+driver's own ``execute`` is restored, so there is no overhead when unused.
+"""
+
+
+def add_command_hook(driver, hook):
+    hooks = driver.__dict__.get("_command_hooks")
+    if hooks is None:
+        hooks = driver._command_hooks = []
+        original = type(driver).execute.__get__(driver)
+
+        def execute(driver_command, params=None):
+            return _call_chain(hooks, 0, original, driver_command, params)
+
+        driver.execute = execute
+    hooks.append(hook)
+
+
+def remove_command_hook(driver, hook):
+    hooks = driver.__dict__.get("_command_hooks")
+    if not hooks or hook not in hooks:
+        return
+    hooks.remove(hook)
+    if not hooks:
+        del driver.execute
+        del driver._command_hooks
+
+
+def _call_chain(hooks, index, original, command, params):
+    if index >= len(hooks):
+        return original(command, params)
+    return hooks[index](
+        lambda cmd, prm=None: _call_chain(hooks, index + 1, original, cmd, prm),
+        command,
+        params
+    )
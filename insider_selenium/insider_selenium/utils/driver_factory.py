@@ -0,0 +1,134 @@
+import time
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service as ChromeService
+
+from .driver_resolver import DriverResolver
+from .remote import PooledRemoteConnection
+
+# URL patterns blocked in lean mode (Network.setBlockedURLs wildcard syntax)
+DEFAULT_BLOCKED_URLS = [
+    # Images, fonts and media
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.mp3", "*.m3u8",
+    # Third-party analytics, trackers and embeds
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*facebook.com/tr*", "*connect.facebook.net*",
+    "*hotjar.com*", "*clarity.ms*", "*licdn.com*", "*linkedin.com/px*",
+    "*hs-scripts.com*", "*hs-analytics.net*", "*hubspot.com*",
+    "*youtube.com*", "*ytimg.com*", "*vimeo.com*", "*fonts.googleapis.com*", "*fonts.gstatic.com*",
+]
+
+
+def lean_blocked_urls(block=None):
+    """The default deny list plus extra block patterns"""
+    return DEFAULT_BLOCKED_URLS + list(block or [])
+
+
+def lean_allowed_urls(allow=None):
+    """Exceptions to the deny list as Network.setBlockedURLs urlPatterns (URLPattern syntax, checked first)"""
+    return [{"urlPattern": pattern, "block": False} for pattern in allow or []]
+
+
+class DriverFactory:
+    """Builds configured Chrome drivers, resolving the chromedriver binary only once"""
+
+    def __init__(self, headless=False, window_size="1920,1080", lean=False, block_urls=None, allow_urls=None,
+                 performance_log=False, driver_path=None, resolver=None, bidi=False,
+                 page_load_strategy="normal", remote_url=None, remote_pool_size=8):
+        self.headless = headless or lean
+        self.window_size = window_size
+        self.lean = lean
+        self.performance_log = performance_log
+        self.bidi = bidi
+        self.page_load_strategy = page_load_strategy
+        # Remote WebDriver endpoint (Grid or a chromedriver --port); every session shares one connection pool
+        self.remote_url = remote_url
+        self.remote_pool_size = remote_pool_size
+        self.blocked_urls = lean_blocked_urls(block_urls) if lean else []
+        self.allowed_urls = lean_allowed_urls(allow_urls) if lean else []
+        self._driver_path = driver_path
+        self.resolver = resolver or DriverResolver()
+        # One entry per launched browser: {"resolve_ms", "spawn_ms", "first_command_ms", "source"}
+        self.startup_timings = []
+
+    def build_options(self):
+        options = webdriver.ChromeOptions()
+        if self.headless:
+            options.add_argument('--headless=new')
+        options.add_argument(f'--window-size={self.window_size}')
+        # With "eager"/"none" BasePage.go_to waits on the page's readiness contract instead
+        options.page_load_strategy = self.page_load_strategy
+        if self.lean:
+            options.add_argument('--blink-settings=imagesEnabled=false')
+            options.add_argument('--disable-extensions')
+            options.add_argument('--mute-audio')
+            options.add_argument('--autoplay-policy=user-gesture-required')
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2,
+            })
+        if self.performance_log:
+            # Network events are read back by utils.traffic_archive.TrafficRecorder
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        if self.bidi:
+            # browsingContext events are used by utils.navigation.NavigationWatcher
+            options.enable_bidi = True
+        return options
+
+    def driver_path(self):
+        if self._driver_path is None:
+            self._driver_path = self.resolver.resolve()
+        return self._driver_path
+
+    def create(self):
+        start = time.perf_counter()
+        if self.remote_url:
+            resolved = start
+            timings = {"source": "remote"}
+            executor = PooledRemoteConnection(self.remote_url, pool_size=self.remote_pool_size)
+            driver = webdriver.Remote(command_executor=executor, options=self.build_options())
+        else:
+            already_resolved = self._driver_path is not None
+            driver_path = self.driver_path()
+            resolved = time.perf_counter()
+            timings = {"source": "reused" if already_resolved else (self.resolver.source or "configured")}
+            driver = webdriver.Chrome(service=ChromeService(driver_path), options=self.build_options())
+        spawned = time.perf_counter()
+        driver.execute_script("return 1")
+        first_command = time.perf_counter()
+
+        timings["resolve_ms"] = round((resolved - start) * 1000, 1)
+        timings["spawn_ms"] = round((spawned - resolved) * 1000, 1)
+        timings["first_command_ms"] = round((first_command - spawned) * 1000, 1)
+        self.startup_timings.append(timings)
+        print(f"Browser started: resolve {timings['resolve_ms']}ms ({timings['source']}), "
+              f"spawn {timings['spawn_ms']}ms, first command {timings['first_command_ms']}ms")
+
+        if self.blocked_urls:
+            self.apply_url_blocking(driver)
+        return driver
+
+    def apply_url_blocking(self, driver):
+        """Block requests matching the lean deny list, except the allowed ones, in the current tab.
+
+        Network.setBlockedURLs only applies to the target it is sent to, so
+        tabs opened later (e.g. the Lever application tab) load unblocked
+        unless this is called again after switching to them.
+        """
+        params = {"urls": self.blocked_urls}
+        if self.allowed_urls:
+            params["urlPatterns"] = self.allowed_urls
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            try:
+                driver.execute_cdp_cmd("Network.setBlockedURLs", params)
+            except Exception as e:
+                if not self.allowed_urls:
+                    raise
+                # Browsers without urlPatterns support still get the deny list, with no exceptions
+                print(f"Could not apply lean allow patterns, blocking without them: {str(e)}")
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_urls})
+        except Exception as e:
+            print(f"Could not enable request blocking: {str(e)}")
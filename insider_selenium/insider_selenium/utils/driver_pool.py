@@ -0,0 +1,161 @@
+import os
+import threading
+from urllib.parse import urlsplit
+
+from .command_hooks import add_command_hook
+
+
+def available_memory_mb():
+    """Return the memory available for new processes in MB, or None if unknown"""
+    try:
+        import psutil
+        return psutil.virtual_memory().available // (1024 * 1024)
+    except ImportError:
+        pass
+    try:
+        with open("/proc/meminfo") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except OSError:
+        pass
+    return None
+
+
+def memory_capped_size(max_size, browser_memory_mb, workers=1):
+    """Cap the number of browsers this worker may run by the memory available to it"""
+    available = available_memory_mb()
+    if available is None or browser_memory_mb <= 0:
+        return max_size
+    # Leave some headroom for the test processes and the OS
+    per_worker = available * 0.8 / max(workers, 1)
+    return max(1, min(max_size, int(per_worker // browser_memory_mb)))
+
+
+def _origin(url):
+    parts = urlsplit(url or "")
+    return f"{parts.scheme}://{parts.netloc}" if parts.scheme in ("http", "https") and parts.netloc else None
+
+
+def track_visited_origins(driver):
+    """Remember the origin of every URL the driver is sent to, so reset_driver_state can clear them all"""
+    if "_visited_origins" in driver.__dict__:
+        return
+    origins = driver._visited_origins = set()
+
+    def hook(execute, command, params):
+        if command == "get":
+            origin = _origin((params or {}).get("url"))
+            if origin:
+                origins.add(origin)
+        return execute(command, params)
+    add_command_hook(driver, hook)
+
+
+def reset_driver_state(driver):
+    """Bring a browser back to a clean state without relaunching it"""
+    origins = driver.__dict__.setdefault("_visited_origins", set())
+    # Tabs opened by links (e.g. Lever) were never driver.get() targets, so read each one's origin before closing it
+    handles = driver.window_handles
+    for handle in reversed(handles):
+        driver.switch_to.window(handle)
+        origins.add(driver.execute_script("return location.origin"))
+        if handle != handles[0]:
+            driver.close()
+
+    driver.execute_script("try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}")
+    try:
+        # Storage is per origin, so every origin the test reached has to be cleared, not just the current one
+        for origin in sorted(origin for origin in origins if origin and origin != "null"):
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    except Exception:
+        driver.delete_all_cookies()
+    origins.clear()
+
+    driver.get("about:blank")
+
+
+class DriverPool:
+    """Pool of pre-launched browsers with checkout/checkin semantics.
+
+    One pool lives in each pytest(-xdist) worker process. Browsers are reset
+    on checkin instead of being relaunched; a browser that fails to reset is
+    discarded and replaced on the next checkout.
+    """
+
+    def __init__(self, factory, max_size=1):
+        self.factory = factory
+        self.max_size = max(1, max_size)
+        self._idle = []
+        self._in_use = set()
+        self._lock = threading.Condition()
+
+    def warm(self, count=1):
+        """Pre-launch browsers so the first tests don't pay for startup"""
+        with self._lock:
+            missing = min(count, self.max_size) - len(self._idle) - len(self._in_use)
+        for _ in range(max(0, missing)):
+            driver = self.factory.create()
+            track_visited_origins(driver)
+            with self._lock:
+                self._idle.append(driver)
+                self._lock.notify()
+
+    def checkout(self, timeout=None):
+        with self._lock:
+            while not self._idle and len(self._in_use) >= self.max_size:
+                if not self._lock.wait(timeout):
+                    raise Exception(f"No browser became available within {timeout}s (pool size {self.max_size})")
+            if self._idle:
+                driver = self._idle.pop()
+                self._in_use.add(driver)
+                return driver
+            # Reserve the slot before launching outside the lock
+            placeholder = object()
+            self._in_use.add(placeholder)
+        try:
+            driver = self.factory.create()
+        except Exception:
+            with self._lock:
+                self._in_use.discard(placeholder)
+                self._lock.notify()
+            raise
+        track_visited_origins(driver)
+        with self._lock:
+            self._in_use.discard(placeholder)
+            self._in_use.add(driver)
+        return driver
+
+    def checkin(self, driver):
+        try:
+            reset_driver_state(driver)
+            healthy = True
+        except Exception as e:
+            print(f"Discarding browser that could not be reset: {str(e)}")
+            healthy = False
+            self._quit(driver)
+        with self._lock:
+            self._in_use.discard(driver)
+            if healthy:
+                self._idle.append(driver)
+            self._lock.notify()
+
+    def close(self):
+        with self._lock:
+            drivers = self._idle + [d for d in self._in_use if hasattr(d, "quit")]
+            self._idle = []
+            self._in_use = set()
+        for driver in drivers:
+            self._quit(driver)
+
+    def _quit(self, driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"Could not quit browser: {str(e)}")
+
+
+def worker_count():
+    """Number of xdist workers sharing this machine (1 when not running under xdist)"""
+    return int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
@@ -0,0 +1,114 @@
+"""Resolve a chromedriver matching the installed Chrome without touching the network.
+
+Resolved drivers are recorded in a small index keyed by Chrome major version.
+On later sessions the index entry is used directly; only when no local
+chromedriver matches is webdriver-manager asked to download one.
+"""
+import glob
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "insider_selenium")
+
+CHROME_BINARIES = [
+    "google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+]
+
+VERSION_PATTERN = re.compile(r"(\d+)\.\d+\.\d+(?:\.\d+)?")
+
+
+def _version_output(command):
+    try:
+        result = subprocess.run(command, capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = VERSION_PATTERN.search(result.stdout + result.stderr)
+    return match.group(0) if match else None
+
+
+def installed_chrome_version():
+    """Full version of the locally installed Chrome/Chromium, or None"""
+    if sys.platform.startswith("win"):
+        return _version_output(["reg", "query", r"HKCU\Software\Google\Chrome\BLBeacon", "/v", "version"])
+    for binary in CHROME_BINARIES:
+        path = binary if os.path.isabs(binary) else shutil.which(binary)
+        if path and os.path.exists(path):
+            version = _version_output([path, "--version"])
+            if version:
+                return version
+    return None
+
+
+def chromedriver_version(path):
+    return _version_output([path, "--version"])
+
+
+def major(version):
+    return version.split(".")[0] if version else None
+
+
+class DriverResolver:
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, offline=False):
+        self.index_path = os.path.join(cache_dir, "chromedriver-index.json")
+        self.offline = offline
+        self.source = None
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self, index):
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.index_path)
+
+    def _local_candidates(self):
+        on_path = shutil.which("chromedriver")
+        if on_path:
+            yield on_path
+        # Drivers previously downloaded by webdriver-manager
+        wdm_root = os.path.join(os.path.expanduser("~"), ".wdm", "drivers", "chromedriver")
+        for path in sorted(glob.glob(os.path.join(wdm_root, "**", "chromedriver*"), recursive=True), reverse=True):
+            if os.path.isfile(path) and os.access(path, os.X_OK) and not path.endswith((".zip", ".json")):
+                yield path
+
+    def resolve(self):
+        """Return a chromedriver path, preferring the index, then local binaries, then a download"""
+        chrome_major = major(installed_chrome_version())
+        index = self._load_index()
+
+        entry = index.get(chrome_major) if chrome_major else None
+        if entry and os.path.exists(entry["path"]):
+            self.source = "index"
+            return entry["path"]
+
+        for path in self._local_candidates():
+            version = chromedriver_version(path)
+            if chrome_major is None or major(version) == chrome_major:
+                self.source = "local"
+                return self._remember(index, major(version), path, version)
+
+        if self.offline:
+            raise Exception(f"No local chromedriver matches Chrome {chrome_major} and downloads are disabled")
+
+        from webdriver_manager.chrome import ChromeDriverManager
+        path = ChromeDriverManager().install()
+        self.source = "download"
+        version = chromedriver_version(path)
+        return self._remember(index, major(version) or chrome_major, path, version)
+
+    def _remember(self, index, driver_major, path, version):
+        if driver_major:
+            index[driver_major] = {"path": path, "version": version}
+            self._save_index(index)
+        return path
@@ -0,0 +1,132 @@
+"""Step-graph runner for page-object flows with resume-from-failure.
+
+A flow is an ordered list of Steps. When a step fails, the flow does not
+start over: it walks back to the nearest completed step that can re-enter
+its end state cheaply (typically by restoring a page checkpoint), and runs
+again from there. Pure steps, which only read the page, are skipped on
+the way back if their inputs are unchanged. A retry costs roughly as much
+as the failed step, not the whole flow.
+"""
+import json
+import time
+
+
+class FlowError(Exception):
+    """A step's preconditions do not hold"""
+
+
+class Step:
+    """One named step of a Flow.
+
+    action       callable() run for the step; its return value is the step's output
+    title        text announced when the step starts (defaults to the name)
+    requires     names of steps that must have completed first in this run
+    precondition optional callable() -> bool checked before the action runs
+    reenter      optional callable() -> bool that recreates the state right after this
+                 step (e.g. restore_checkpoint); used to resume after a later step fails
+    pure         the step only reads state; its output is reused while the outputs of
+                 the steps it requires are unchanged
+    """
+
+    def __init__(self, name, action, title=None, requires=(), precondition=None, reenter=None, pure=False):
+        self.name = name
+        self.action = action
+        self.title = title or name
+        self.requires = tuple(requires)
+        self.precondition = precondition
+        self.reenter = reenter
+        self.pure = pure
+
+
+class Flow:
+    """Ordered Steps run with up to `retries` resumes after a failing step"""
+
+    def __init__(self, steps, retries=1, announce=print):
+        names = [step.name for step in steps]
+        if len(set(names)) != len(names):
+            raise FlowError(f"Duplicate step names in flow: {names}")
+        for step in steps:
+            unknown = [name for name in step.requires if name not in names[:names.index(step.name)]]
+            if unknown:
+                raise FlowError(f"Step '{step.name}' requires {unknown}, which do not run before it")
+        self.steps = steps
+        self.retries = retries
+        self.announce = announce
+        # Outputs of the steps completed in the current run, by name
+        self.outputs = {}
+        # name -> (inputs fingerprint, output) of pure steps that completed
+        self._pure_results = {}
+        # (step, status, seconds) in execution order; status is ran/reused/failed/reentered
+        self.history = []
+
+    def run(self):
+        """Run every step, resuming from the last re-enterable step on failure; returns the outputs"""
+        index, failures = 0, 0
+        while index < len(self.steps):
+            step = self.steps[index]
+            try:
+                self._run_step(step)
+                index += 1
+            except Exception as e:
+                if failures >= self.retries:
+                    raise
+                failures += 1
+                index = self._resume(index, e)
+        return self.outputs
+
+    def _run_step(self, step):
+        missing = [name for name in step.requires if name not in self.outputs]
+        if missing:
+            raise FlowError(f"Step '{step.name}' requires {missing}, which have not completed")
+
+        fingerprint = self._fingerprint(step) if step.pure else None
+        cached = self._pure_results.get(step.name)
+        if cached and cached[0] == fingerprint:
+            self.outputs[step.name] = cached[1]
+            self.history.append((step.name, "reused", 0.0))
+            self.announce(f"{step.title} (inputs unchanged, reusing previous result)")
+            return
+
+        self.announce(step.title)
+        started = time.perf_counter()
+        try:
+            if step.precondition and not step.precondition():
+                raise FlowError(f"Precondition of step '{step.name}' does not hold")
+            output = step.action()
+        except Exception:
+            self.history.append((step.name, "failed", round(time.perf_counter() - started, 3)))
+            raise
+        self.history.append((step.name, "ran", round(time.perf_counter() - started, 3)))
+        self.outputs[step.name] = output
+        if step.pure:
+            self._pure_results[step.name] = (fingerprint, output)
+
+    def _resume(self, failed_index, error):
+        """Re-enter after the closest completed step that supports it; returns the index to continue at"""
+        self.announce(f"Step '{self.steps[failed_index].name}' failed: {str(error)}")
+        for index in range(failed_index - 1, -1, -1):
+            step = self.steps[index]
+            if step.name not in self.outputs or not step.reenter:
+                continue
+            started = time.perf_counter()
+            try:
+                reentered = step.reenter()
+            except Exception as e:
+                self.announce(f"Could not re-enter after '{step.name}': {str(e)}")
+                reentered = False
+            if reentered:
+                self.history.append((step.name, "reentered", round(time.perf_counter() - started, 3)))
+                self._forget_from(index + 1)
+                self.announce(f"Resuming after '{step.name}'")
+                return index + 1
+        self._forget_from(0)
+        self.announce("No step could be re-entered, restarting the flow")
+        return 0
+
+    def _forget_from(self, index):
+        for step in self.steps[index:]:
+            self.outputs.pop(step.name, None)
+
+    def _fingerprint(self, step):
+        inputs = {name: self.outputs.get(name) for name in step.requires}
+        return json.dumps(inputs, sort_keys=True, default=repr)
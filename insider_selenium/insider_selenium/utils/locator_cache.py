@@ -0,0 +1,53 @@
+import json
+import os
+
+
+class LocatorCache:
+    """On-disk memory of which fallback strategy worked for a (page, key) pair.
+
+    Entries are only trusted until they fail: a cached strategy that stops
+    working is forgotten and the full fallback chain is walked again.
+    Saving merges with the file on disk so parallel workers don't clobber
+    each other's entries.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._entries = self._load()
+        self._changed = {}
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, key):
+        return self._entries.get(key)
+
+    def remember(self, key, strategy):
+        self._entries[key] = strategy
+        self._changed[key] = strategy
+
+    def forget(self, key):
+        self._entries.pop(key, None)
+        self._changed[key] = None
+
+    def save(self):
+        if not self._changed:
+            return
+        entries = self._load()
+        for key, strategy in self._changed.items():
+            if strategy is None:
+                entries.pop(key, None)
+            else:
+                entries[key] = strategy
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self._changed = {}
@@ -0,0 +1,111 @@
+import threading
+import time
+
+from selenium.common.exceptions import TimeoutException
+
+
+def _field(event, name):
+    """Read a field from a BiDi event, which selenium hands over as a dataclass or a raw dict"""
+    if isinstance(event, dict):
+        return event.get(name)
+    return getattr(event, name, None)
+
+
+def bidi_enabled(driver):
+    """True when the session was created with a WebDriver BiDi websocket"""
+    return bool((getattr(driver, "caps", None) or {}).get("webSocketUrl"))
+
+
+class NavigationWatcher:
+    """Detects new tabs and navigations from the moment it is created.
+
+    With WebDriver BiDi (DriverFactory(bidi=True)) it subscribes to
+    browsingContext events, so a new tab and the URL it commits to are seen
+    as soon as the browser reports them, without waiting for the page to
+    load. Without BiDi it polls window handles and the URL at a short
+    interval instead, treating every handle not open at creation as new.
+    Create it before the click that opens the tab, then call wait_for_url.
+    """
+
+    POLL_INTERVAL = 0.05
+    # Event name -> how far the navigation got; "started" is only used if "committed" is unsupported
+    EVENTS = {"context_created": "created", "navigation_started": "started",
+              "navigation_committed": "committed", "load": "loaded"}
+
+    def __init__(self, driver, known_handles=None):
+        self.driver = driver
+        self.known_handles = set(known_handles if known_handles is not None else driver.window_handles)
+        self.bidi = bidi_enabled(driver)
+        # (stage, context, url) in arrival order, appended from the websocket thread
+        self.events = []
+        self._changed = threading.Condition()
+        self._handlers = []
+        if self.bidi:
+            self._subscribe()
+
+    def _subscribe(self):
+        browsing_context = self.driver.browsing_context
+        for event, stage in self.EVENTS.items():
+            def on_event(params, stage=stage):
+                with self._changed:
+                    self.events.append((stage, _field(params, "context"), _field(params, "url") or ""))
+                    self._changed.notify_all()
+            try:
+                self._handlers.append((event, browsing_context.add_event_handler(event, on_event)))
+            except Exception as e:
+                print(f"Could not subscribe to browsingContext '{event}': {str(e)}")
+
+    def stop(self):
+        """Remove the BiDi event handlers"""
+        for event, handler_id in self._handlers:
+            try:
+                self.driver.browsing_context.remove_event_handler(event, handler_id)
+            except Exception:
+                pass
+        self._handlers = []
+
+    def wait_for_url(self, fragment, timeout=10, early_commit=False):
+        """Switch to the tab whose URL contains fragment and return (handle, url).
+
+        With early_commit the navigation only has to be committed; otherwise
+        its load event must have fired too. The polling fallback reads the
+        URL through WebDriver, which follows the session's page-load strategy.
+        """
+        try:
+            if self.bidi:
+                stages = ("committed", "started") if early_commit else ("loaded",)
+                handle, url = self._wait_for_event(fragment, stages, timeout)
+                self.driver.switch_to.window(handle)
+            else:
+                handle, url = self._poll_for_url(fragment, timeout)
+            return handle, url
+        finally:
+            self.stop()
+
+    def _wait_for_event(self, fragment, stages, timeout):
+        subscribed = {event for event, _ in self._handlers}
+        if "navigation_committed" in subscribed:
+            stages = tuple(stage for stage in stages if stage != "started")
+        deadline = time.monotonic() + timeout
+        with self._changed:
+            while True:
+                for stage, context, url in self.events:
+                    if stage in stages and fragment in url:
+                        return context, url
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutException(f"No navigation to a URL containing '{fragment}' within {timeout}s")
+                self._changed.wait(remaining)
+
+    def _poll_for_url(self, fragment, timeout):
+        deadline = time.monotonic() + timeout
+        while True:
+            new_handles = [h for h in self.driver.window_handles if h not in self.known_handles]
+            if new_handles and self.driver.current_window_handle != new_handles[-1]:
+                self.driver.switch_to.window(new_handles[-1])
+            url = self.driver.current_url
+            if fragment in url:
+                return self.driver.current_window_handle, url
+            if time.monotonic() > deadline:
+                raise TimeoutException(f"No tab reached a URL containing '{fragment}' within {timeout}s (last: {url})")
+            time.sleep(self.POLL_INTERVAL)
@@ -0,0 +1,51 @@
+# Counts in-flight fetch/XHR requests of a document on window.__netIdle.
+# Registered as a new-document script so requests made during page load are seen.
+NETWORK_TRACKER_JS = """
+(() => {
+    if (window.__netIdle) return;
+    const state = window.__netIdle = {pending: 0, total: 0, last: performance.now()};
+    const begin = () => { state.pending++; state.total++; state.last = performance.now(); };
+    const end = () => { state.pending = Math.max(0, state.pending - 1); state.last = performance.now(); };
+
+    if (window.fetch) {
+        const originalFetch = window.fetch;
+        window.fetch = function () {
+            begin();
+            try {
+                return originalFetch.apply(this, arguments).finally(end);
+            } catch (e) {
+                end();
+                throw e;
+            }
+        };
+    }
+
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        begin();
+        this.addEventListener('loadend', end, {once: true});
+        try {
+            return originalSend.apply(this, arguments);
+        } catch (e) {
+            end();
+            throw e;
+        }
+    };
+})();
+"""
+
+# Resolves once no request has been pending for quietMs
+WAIT_FOR_NETWORK_IDLE_JS = """
+    const [quietMs, done] = arguments;
+    const state = window.__netIdle;
+    const start = performance.now();
+    if (!state) { done(null); return; }
+    (function check() {
+        const now = performance.now();
+        if (state.pending === 0 && now - state.last >= quietMs) {
+            done({elapsed_ms: Math.round(now - start), requests: state.total});
+            return;
+        }
+        setTimeout(check, 25);
+    })();
+"""
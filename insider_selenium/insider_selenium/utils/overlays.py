@@ -0,0 +1,75 @@
+# Keeps cookie banners, modals, ads and high z-index layers out of the way for the
+# life of a document. Registered once per tab as a new-document script: a
+# stylesheet hides the cookie banner before it paints, one sweep handles the
+# initial DOM, and a MutationObserver handles nodes inserted later, batched per
+# animation frame so layout is read at most once per frame.
+# Counters are exposed on window.__overlaySuppressor.counts.
+OVERLAY_SUPPRESSOR_JS = """
+(() => {
+    if (window.__overlaySuppressor) return;
+    const counts = {banner: 0, overlays: 0, fixed: 0, ads: 0, z_index: 0};
+    window.__overlaySuppressor = {counts: counts};
+
+    const BANNER = '#wt-cli-cookie-banner';
+    const OVERLAY = '[class*="modal"], [class*="overlay"], [class*="popup"], [class*="notification"]';
+    const FIXED = '[style*="position: fixed"], [style*="position:fixed"]';
+    const AD = '[class*="ad-"], [class*="advertisement"], [class*="promo"], [id*="ad-"], [id*="advertisement"], [id*="promo"]';
+    const Z_INDEX = '[style*="z-index"]';
+    const ANY = [BANNER, OVERLAY, FIXED, AD, Z_INDEX].join(', ');
+
+    const neutralise = el => {
+        if (!el.isConnected) return;
+        if (el.matches(BANNER)) { el.remove(); counts.banner++; return; }
+        if (el.matches(OVERLAY)) {
+            if (el.style.display !== 'none') { el.remove(); counts.overlays++; }
+            return;
+        }
+        if (el.matches(FIXED) && el.style.display !== 'none' && el.offsetHeight > 50) {
+            el.style.display = 'none'; counts.fixed++;
+        }
+        if (el.matches(AD) && el.style.display !== 'none' && el.offsetHeight > 30) {
+            el.style.display = 'none'; counts.ads++;
+        }
+        if (el.matches(Z_INDEX)) {
+            const zIndex = parseInt(getComputedStyle(el).zIndex);
+            if (zIndex > 1000) { el.style.zIndex = '1'; counts.z_index++; }
+        }
+    };
+
+    const pending = new Set();
+    let scheduled = false;
+    const flush = () => {
+        scheduled = false;
+        const roots = Array.from(pending);
+        pending.clear();
+        for (const root of roots) {
+            if (root.matches && root.matches(ANY)) neutralise(root);
+            if (root.querySelectorAll) root.querySelectorAll(ANY).forEach(neutralise);
+        }
+    };
+    const schedule = node => {
+        pending.add(node);
+        if (!scheduled) { scheduled = true; requestAnimationFrame(flush); }
+    };
+
+    const start = () => {
+        const style = document.createElement('style');
+        style.textContent = BANNER + ' { display: none !important; }';
+        (document.head || document.documentElement).appendChild(style);
+        document.querySelectorAll(ANY).forEach(neutralise);
+        new MutationObserver(records => {
+            for (const record of records) {
+                if (record.type === 'attributes') { schedule(record.target); continue; }
+                record.addedNodes.forEach(node => { if (node.nodeType === 1) schedule(node); });
+            }
+        }).observe(document.documentElement, {
+            childList: true, subtree: true, attributes: true, attributeFilter: ['class', 'style']
+        });
+    };
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', start);
+    } else {
+        start();
+    }
+})();
+"""
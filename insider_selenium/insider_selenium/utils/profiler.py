@@ -0,0 +1,160 @@
+"""WebDriver command profiler attributing commands, waits and sleeps to page-object methods.
+
+Nothing is installed unless a profiler is attached, so a disabled profiler
+costs nothing. When attached, every command through WebDriver.execute,
+every ``time.sleep`` made from a page module and every poll interval slept
+inside a wait (WebDriverWait, NavigationWatcher) is recorded together with
+the page-object call stack and the current test step, so client-side waiting
+shows up in the profile next to the commands.
+"""
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+
+PAGE_MODULE_PREFIX = "pages."
+# Modules whose sleeps are poll intervals of a wait rather than explicit pauses
+WAIT_MODULES = ("selenium.webdriver.support.wait", "utils.navigation")
+WAIT_FUNCTIONS = {"until", "until_not"}
+
+
+class _ProfiledTime:
+    """Stand-in for the ``time`` module inside patched modules that times ``sleep`` calls"""
+
+    def __init__(self, profiler, kind="sleep", name="sleep"):
+        self._profiler = profiler
+        self._kind = kind
+        self._name = name
+
+    def sleep(self, seconds):
+        start = time.perf_counter()
+        time.sleep(seconds)
+        self._profiler.record(self._kind, self._name, start, time.perf_counter() - start, self._profiler.call_stack())
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+
+class CommandProfiler:
+    def __init__(self, name="test"):
+        self.name = name
+        self.events = []
+        self.steps = []
+        self._current_step = None
+        self._driver = None
+        self._patched_modules = []
+        self._started = time.perf_counter()
+
+    def attach(self, driver):
+        from .command_hooks import add_command_hook
+        self._driver = driver
+        add_command_hook(driver, self._hook)
+        sleep_shim = _ProfiledTime(self)
+        wait_shim = _ProfiledTime(self, kind="wait", name="poll")
+        for name, module in list(sys.modules.items()):
+            if getattr(module, "time", None) is not time:
+                continue
+            if name in WAIT_MODULES:
+                module.time = wait_shim
+            elif name.startswith(PAGE_MODULE_PREFIX):
+                module.time = sleep_shim
+            else:
+                continue
+            self._patched_modules.append(module)
+
+    def detach(self):
+        from .command_hooks import remove_command_hook
+        if self._driver is not None:
+            remove_command_hook(self._driver, self._hook)
+            self._driver = None
+        for module in self._patched_modules:
+            module.time = time
+        self._patched_modules = []
+        self.mark_step(None)
+
+    def mark_step(self, name):
+        """End the current test step and start a new one (None just ends it)"""
+        now = time.perf_counter()
+        if self._current_step is not None:
+            step_name, start = self._current_step
+            self.steps.append({"name": step_name, "start_ms": self._ms(start - self._started),
+                               "duration_ms": self._ms(now - start)})
+        self._current_step = (name, now) if name is not None else None
+
+    def _hook(self, execute, command, params):
+        start = time.perf_counter()
+        try:
+            return execute(command, params)
+        finally:
+            self.record("command", command, start, time.perf_counter() - start, self.call_stack())
+
+    def record(self, kind, name, start, duration, stack):
+        self.events.append({
+            "kind": kind,
+            "name": name,
+            "step": self._current_step[0] if self._current_step else None,
+            "stack": stack,
+            "start_ms": self._ms(start - self._started),
+            "duration_ms": self._ms(duration),
+        })
+
+    def call_stack(self):
+        """Page-object methods and waits on the current Python stack, outermost first"""
+        from pages.base_page import BasePage
+        frames = []
+        frame = sys._getframe(2)
+        while frame is not None:
+            code_name = frame.f_code.co_name
+            owner = frame.f_locals.get("self")
+            if isinstance(owner, BasePage):
+                frames.append(f"{type(owner).__name__}.{code_name}")
+            elif code_name in WAIT_FUNCTIONS and frame.f_globals.get("__name__", "").startswith("selenium"):
+                frames.append(f"WebDriverWait.{code_name}")
+            frame = frame.f_back
+        frames.reverse()
+        return frames
+
+    def report(self):
+        by_method = defaultdict(lambda: {"commands": 0, "sleeps": 0, "waits": 0, "duration_ms": 0.0})
+        by_command = defaultdict(lambda: {"count": 0, "duration_ms": 0.0})
+        for event in self.events:
+            method = by_method[event["stack"][-1] if event["stack"] else "<test>"]
+            method[event["kind"] + "s"] += 1
+            method["duration_ms"] = round(method["duration_ms"] + event["duration_ms"], 3)
+            if event["kind"] == "command":
+                command = by_command[event["name"]]
+                command["count"] += 1
+                command["duration_ms"] = round(command["duration_ms"] + event["duration_ms"], 3)
+        return {
+            "test": self.name,
+            "total_ms": self._ms(time.perf_counter() - self._started),
+            "steps": self.steps,
+            "by_method": dict(by_method),
+            "by_command": dict(by_command),
+            "events": self.events,
+        }
+
+    def folded_stacks(self):
+        """Collapsed stacks (``frame;frame;leaf microseconds``) for flamegraph tools"""
+        totals = defaultdict(int)
+        for event in self.events:
+            frames = [self.name, event["step"] or "<no step>"] + event["stack"]
+            frames.append(f"{event['kind']}:{event['name']}")
+            key = ";".join(frame.replace(";", ",").replace(" ", "_") for frame in frames)
+            totals[key] += int(event["duration_ms"] * 1000)
+        return "\n".join(f"{stack} {micros}" for stack, micros in sorted(totals.items())) + "\n"
+
+    def write(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, "".join(c if c.isalnum() or c in "-_." else "_" for c in self.name))
+        with open(base + ".json", "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+        with open(base + ".folded", "w", encoding="utf-8") as f:
+            f.write(self.folded_stacks())
+        print(f"Command profile saved: {base}.json")
+        return base + ".json"
+
+    @staticmethod
+    def _ms(seconds):
+        return round(seconds * 1000, 3)
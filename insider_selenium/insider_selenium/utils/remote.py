@@ -0,0 +1,127 @@
+"""Remote WebDriver sessions sharing one pooled keep-alive HTTP connection manager.
+
+Every WebDriver command is an HTTP round trip, so against a remote grid the
+cost of opening connections and the per-command latency dominate chatty
+page objects. PooledRemoteConnection keeps a single urllib3 PoolManager per
+(server, pool size) for the whole process: all pooled sessions reuse its
+keep-alive connections, the pool size caps how many requests can be on the
+wire at once, and it is only cleared when the last session using it quits.
+"""
+import threading
+import time
+from collections import defaultdict
+
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.remote.client_config import ClientConfig
+
+
+class RemoteCommandStats:
+    """Round-trip latency per WebDriver command and peak number of commands in flight"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def begin(self):
+        with self._lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def end(self, command, seconds):
+        with self._lock:
+            self.in_flight -= 1
+            self.latencies[command].append(seconds * 1000)
+
+    def drain(self):
+        """Latencies and peak in-flight count since the last drain, then start over (for per-test reports)"""
+        with self._lock:
+            sample = {"latencies": dict(self.latencies), "peak_in_flight": self.peak_in_flight}
+            self.latencies = defaultdict(list)
+            self.peak_in_flight = self.in_flight
+            return sample
+
+    def merge(self, sample):
+        """Add a drained sample, e.g. one shipped from an xdist worker"""
+        with self._lock:
+            for command, samples in sample["latencies"].items():
+                self.latencies[command].extend(samples)
+            self.peak_in_flight = max(self.peak_in_flight, sample["peak_in_flight"])
+
+    def summary(self):
+        """{"commands": {name: {count, p50_ms, p95_ms, max_ms}}, "requests", "peak_in_flight"}"""
+        with self._lock:
+            commands = {}
+            for command, samples in self.latencies.items():
+                ordered = sorted(samples)
+                pick = lambda fraction: round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))], 1)
+                commands[command] = {"count": len(ordered), "p50_ms": pick(0.5), "p95_ms": pick(0.95),
+                                     "max_ms": round(ordered[-1], 1)}
+            return {"commands": commands, "requests": sum(len(s) for s in self.latencies.values()),
+                    "peak_in_flight": self.peak_in_flight}
+
+
+class PooledRemoteConnection(ChromiumRemoteConnection):
+    """Chrome command executor whose keep-alive connection pool is shared across sessions"""
+
+    # (server, pool size) -> [PoolManager, number of open connections using it]
+    _shared = {}
+    _shared_lock = threading.Lock()
+    stats = RemoteCommandStats()
+
+    def __init__(self, remote_server_addr, pool_size=8, timeout=120):
+        self._pool_key = (remote_server_addr.rstrip("/"), pool_size)
+        client_config = ClientConfig(
+            remote_server_addr=remote_server_addr,
+            keep_alive=True,
+            timeout=timeout,
+            # block=True makes pool_size a hard limit instead of opening throwaway connections past it
+            init_args_for_pool_manager={"init_args_for_pool_manager": {"maxsize": pool_size, "block": True}},
+        )
+        super().__init__(remote_server_addr, vendor_prefix="goog", browser_name="chrome",
+                         client_config=client_config)
+
+    def _get_connection_manager(self):
+        with self._shared_lock:
+            entry = self._shared.get(self._pool_key)
+            if entry is None:
+                entry = self._shared[self._pool_key] = [super()._get_connection_manager(), 0]
+            entry[1] += 1
+            return entry[0]
+
+    def execute(self, command, params):
+        self.stats.begin()
+        start = time.perf_counter()
+        try:
+            return super().execute(command, params)
+        finally:
+            self.stats.end(command, time.perf_counter() - start)
+
+    def close(self):
+        """Release this session's share of the pool; the last one out clears it"""
+        if not hasattr(self, "_conn"):
+            return
+        with self._shared_lock:
+            entry = self._shared.get(self._pool_key)
+            if entry is not None and entry[0] is self._conn:
+                entry[1] -= 1
+                if entry[1] > 0:
+                    del self._conn
+                    return
+                del self._shared[self._pool_key]
+        self._conn.clear()
+        del self._conn
+
+    @classmethod
+    def connection_stats(cls):
+        """Connections opened vs requests sent per shared pool, to check keep-alive reuse"""
+        with cls._shared_lock:
+            managers = [(key, entry[0]) for key, entry in cls._shared.items()]
+        result = {}
+        for (server, pool_size), manager in managers:
+            pools = [manager.pools[pool_key] for pool_key in manager.pools.keys()]
+            result[server] = {"pool_size": pool_size,
+                              "connections": sum(pool.num_connections for pool in pools),
+                              "requests": sum(pool.num_requests for pool in pools)}
+        return result
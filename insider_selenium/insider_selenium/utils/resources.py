@@ -0,0 +1,168 @@
+"""Browser resource sampling: RSS and CPU of the Chrome process tree plus the page's JS heap.
+
+Samples are taken at test boundaries and around known-heavy page-object
+calls, and only the per-test peaks are kept. CPU is reported as the seconds
+used over the test, plus a peak percentage over windows of at least
+MIN_CPU_INTERVAL (shorter windows are dominated by the 10ms accounting tick). The process tree is rooted at
+the chromedriver process of a local session (Chrome and all its renderers
+are its descendants); psutil is used when installed, /proc otherwise.
+Remote sessions only report the JS heap.
+"""
+import os
+import time
+from collections import defaultdict
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+def _proc_tree_usage(root_pid):
+    """(rss bytes, cpu seconds, processes) summed over root_pid and its descendants, read from /proc"""
+    stats, children = {}, defaultdict(list)
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # Fields after "(comm)": state ppid ... utime(11) stime(12) ... rss(21)
+        fields = stat[stat.rindex(")") + 2:].split()
+        pid = int(entry)
+        stats[pid] = (int(fields[21]) * _PAGE_SIZE, (int(fields[11]) + int(fields[12])) / _CLOCK_TICKS)
+        children[int(fields[1])].append(pid)
+    rss, cpu, count, pending = 0, 0.0, 0, [root_pid]
+    while pending:
+        pid = pending.pop()
+        if pid in stats:
+            rss += stats[pid][0]
+            cpu += stats[pid][1]
+            count += 1
+        pending.extend(children.get(pid, []))
+    return rss, cpu, count
+
+
+def _psutil_tree_usage(psutil, root_pid):
+    root = psutil.Process(root_pid)
+    rss, cpu, count = 0, 0.0, 0
+    for process in [root] + root.children(recursive=True):
+        try:
+            with process.oneshot():
+                rss += process.memory_info().rss
+                times = process.cpu_times()
+                cpu += times.user + times.system
+                count += 1
+        except psutil.Error:
+            continue
+    return rss, cpu, count
+
+
+def process_tree_usage(root_pid):
+    try:
+        import psutil
+    except ImportError:
+        return _proc_tree_usage(root_pid)
+    return _psutil_tree_usage(psutil, root_pid)
+
+
+def budget_violations(summary, budgets):
+    """Messages for each peak in summary that exceeds its budget (budgets: {"rss_mb": 1500, ...})"""
+    violations = []
+    for metric, budget in budgets.items():
+        peak = summary.get(f"peak_{metric}")
+        if budget and peak is not None and peak > budget:
+            violations.append(f"browser {metric} peaked at {peak} (budget {budget}) during '{summary['peak_at'][metric]}'")
+    return violations
+
+
+def sample_resources(driver, label):
+    """Take a sample with the driver's resource monitor, if one is attached"""
+    monitor = driver.__dict__.get("_resource_monitor") if driver is not None else None
+    if monitor:
+        monitor.sample(label)
+
+
+class ResourceMonitor:
+    """Peak RSS, CPU and JS heap of one browser over a test"""
+
+    MIN_CPU_INTERVAL = 1.0
+
+    def __init__(self, driver, root_pid=None):
+        self.driver = driver
+        if root_pid is None:
+            process = getattr(getattr(driver, "service", None), "process", None)
+            root_pid = process.pid if process else None
+        self.root_pid = root_pid
+        self.samples = 0
+        self.peaks = {}
+        self.peak_at = {}
+        self.cpu_seconds = None
+        self._first_cpu = None
+        self._last_cpu = None
+        # None until Performance.enable has been tried, then whether CDP metrics work
+        self._cdp_metrics = None
+
+    def attach(self):
+        self.driver._resource_monitor = self
+        return self
+
+    def detach(self):
+        self.driver.__dict__.pop("_resource_monitor", None)
+
+    def sample(self, label):
+        """Record one sample; returns {"rss_mb", "cpu_percent", "js_heap_mb"} (missing metrics omitted)"""
+        values = {}
+        if self.root_pid:
+            try:
+                rss, cpu_seconds, _ = process_tree_usage(self.root_pid)
+                values["rss_mb"] = round(rss / (1024 * 1024), 1)
+                now = time.monotonic()
+                # Renderers that exit take their CPU time with them, so deltas can dip below zero
+                if self._first_cpu is None:
+                    self._first_cpu = cpu_seconds
+                self.cpu_seconds = round(max(0.0, cpu_seconds - self._first_cpu), 2)
+                if self._last_cpu is None:
+                    self._last_cpu = (cpu_seconds, now)
+                elif now - self._last_cpu[1] >= self.MIN_CPU_INTERVAL:
+                    elapsed = now - self._last_cpu[1]
+                    values["cpu_percent"] = round(max(0.0, cpu_seconds - self._last_cpu[0]) / elapsed * 100, 1)
+                    self._last_cpu = (cpu_seconds, now)
+            except Exception as e:
+                print(f"Could not sample browser processes: {str(e)}")
+                self.root_pid = None
+        heap = self._js_heap_bytes()
+        if heap is not None:
+            values["js_heap_mb"] = round(heap / (1024 * 1024), 1)
+
+        self.samples += 1
+        for metric, value in values.items():
+            if value > self.peaks.get(metric, -1):
+                self.peaks[metric] = value
+                self.peak_at[metric] = label
+        return values
+
+    def _js_heap_bytes(self):
+        if self._cdp_metrics is not False:
+            try:
+                if self._cdp_metrics is None:
+                    self.driver.execute_cdp_cmd("Performance.enable", {})
+                    self._cdp_metrics = True
+                metrics = self.driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+                return next(m["value"] for m in metrics if m["name"] == "JSHeapUsedSize")
+            except Exception:
+                self._cdp_metrics = False
+        try:
+            return self.driver.execute_script(
+                "return performance.memory ? performance.memory.usedJSHeapSize : null;")
+        except Exception:
+            return None
+
+    def summary(self):
+        """Peaks over the samples so far: {"peak_rss_mb", "peak_cpu_percent", "peak_js_heap_mb", "cpu_seconds", ...}"""
+        summary = {f"peak_{metric}": value for metric, value in self.peaks.items()}
+        if self.cpu_seconds is not None:
+            summary["cpu_seconds"] = self.cpu_seconds
+        summary["samples"] = self.samples
+        summary["peak_at"] = dict(self.peak_at)
+        return summary
@@ -0,0 +1,159 @@
+import json
+import time
+from collections import deque
+
+from .command_hooks import add_command_hook, remove_command_hook
+
+# In-page half of the failure trace, registered as a new-document script. Keeps a
+# ring of the document's recent DOM changes (one summary per MutationObserver
+# batch: counts plus a few sample nodes), console messages and uncaught errors
+# on window.__trace. Nothing leaves the page unless a test fails.
+TRACE_PAGE_JS = """
+(() => {
+    if (window.__trace) return;
+    const LIMIT = 300;
+    const trace = window.__trace = {events: [], dropped: 0};
+    const push = event => {
+        event.t = Date.now();
+        trace.events.push(event);
+        if (trace.events.length > LIMIT) { trace.events.shift(); trace.dropped++; }
+    };
+    const clip = (text, size) => String(text).replace(/\\s+/g, ' ').trim().slice(0, size);
+    const describe = node => {
+        if (node.nodeType !== 1) return '#text ' + clip(node.textContent, 40);
+        let name = node.tagName.toLowerCase();
+        if (node.id) name += '#' + node.id;
+        if (typeof node.className === 'string' && node.className) name += '.' + node.className.trim().split(/\\s+/).slice(0, 2).join('.');
+        return name;
+    };
+
+    for (const level of ['log', 'info', 'warn', 'error']) {
+        const original = console[level];
+        console[level] = function (...args) {
+            push({kind: 'console', level: level, text: clip(args.map(String).join(' '), 300)});
+            return original.apply(this, args);
+        };
+    }
+    window.addEventListener('error', e => push({kind: 'error', text: clip(e.message, 300), source: e.filename + ':' + e.lineno}));
+    window.addEventListener('unhandledrejection', e => push({kind: 'error', text: clip(e.reason, 300), source: 'promise'}));
+
+    const start = () => {
+        push({kind: 'document', text: location.href});
+        new MutationObserver(records => {
+            const summary = {kind: 'dom', added: 0, removed: 0, attributes: 0, text: 0, samples: []};
+            for (const record of records) {
+                if (record.type === 'attributes') summary.attributes++;
+                else if (record.type === 'characterData') summary.text++;
+                summary.added += record.addedNodes.length;
+                summary.removed += record.removedNodes.length;
+                if (summary.samples.length < 3) {
+                    record.addedNodes.forEach(n => summary.samples.length < 3 && summary.samples.push('+' + describe(n)));
+                    record.removedNodes.forEach(n => summary.samples.length < 3 && summary.samples.push('-' + describe(n)));
+                }
+            }
+            push(summary);
+        }).observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+    };
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', start);
+    } else {
+        start();
+    }
+})();
+"""
+
+DRAIN_TRACE_JS = """
+    const trace = window.__trace;
+    if (!trace) return null;
+    const drained = {events: trace.events, dropped: trace.dropped};
+    trace.events = [];
+    trace.dropped = 0;
+    return drained;
+"""
+
+
+def _summarise(params):
+    """Short, secret-free description of a command's parameters"""
+    if not params:
+        return ""
+    if "script" in params:
+        return " ".join(params["script"].split())[:80]
+    if "using" in params:
+        return f"{params['using']}={params.get('value')}"[:120]
+    if "url" in params:
+        return params["url"]
+    if "cmd" in params:
+        return params["cmd"]
+    return ""
+
+
+def note_trace(driver, event, **details):
+    """Add a note to the driver's trace recorder, if one is attached"""
+    recorder = driver.__dict__.get("_trace_recorder") if driver is not None else None
+    if recorder:
+        recorder.note(event, **details)
+
+
+class TraceRecorder:
+    """Bounded in-memory trace of one driver's recent WebDriver commands and page events.
+
+    Every command passes through a command hook that appends one small entry
+    to a ring buffer; page objects add notes through note_trace. The in-page
+    ring (TRACE_PAGE_JS) is only drained when flush() is called for a
+    failing test, so passing tests never write anything.
+    """
+
+    def __init__(self, size=500):
+        self.commands = deque(maxlen=size)
+        self.driver = None
+
+    def attach(self, driver):
+        self.driver = driver
+        driver._trace_recorder = self
+        add_command_hook(driver, self._hook)
+
+    def detach(self):
+        if self.driver is None:
+            return
+        remove_command_hook(self.driver, self._hook)
+        self.driver.__dict__.pop("_trace_recorder", None)
+        self.driver = None
+
+    def _hook(self, execute, command, params):
+        started = time.time()
+        start = time.perf_counter()
+        error = None
+        try:
+            return execute(command, params)
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            entry = {"t": round(started * 1000), "kind": "command", "command": command,
+                     "ms": round((time.perf_counter() - start) * 1000, 1)}
+            summary = _summarise(params)
+            if summary:
+                entry["args"] = summary
+            if error:
+                entry["error"] = error
+            self.commands.append(entry)
+
+    def note(self, event, **details):
+        self.commands.append({"t": round(time.time() * 1000), "kind": "note", "event": event, **details})
+
+    def flush(self, name, artifacts):
+        """Write the merged command and page trace as compact gzipped JSON; returns the path"""
+        # Copied first so the drain commands below don't end up in the trace
+        events = list(self.commands)
+        trace = {"test": name, "url": None, "page_dropped": 0}
+        if self.driver is not None:
+            try:
+                page = self.driver.execute_script(DRAIN_TRACE_JS)
+                if page:
+                    events.extend(page["events"])
+                    trace["page_dropped"] = page["dropped"]
+                trace["url"] = self.driver.current_url
+            except Exception as e:
+                trace["page_error"] = str(e)
+        trace["events"] = sorted(events, key=lambda event: event.get("t", 0))
+        return artifacts.save_text("traces", f"{name}.json", json.dumps(trace, separators=(",", ":")))
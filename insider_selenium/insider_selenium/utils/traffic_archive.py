@@ -0,0 +1,241 @@
+"""Record real browser traffic into an on-disk archive and replay it from a local HTTP server.
+
+Archive layout::
+
+    <archive>/index-<worker>.json   url -> {status, headers, body}
+    <archive>/bodies/<sha1>         response bodies
+
+Recording reads Chrome's performance log (Network.* events) and fetches
+response bodies over CDP before any command that may navigate away, while
+the bodies are still held by the page.
+"""
+import base64
+import glob
+import hashlib
+import json
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from .command_hooks import add_command_hook, remove_command_hook
+
+# Commands after which the current page's response bodies may no longer be available
+NAVIGATING_COMMANDS = {"get", "clickElement", "goBack", "goForward", "refresh", "close", "quit"}
+
+# Scripts only navigate when they stand in for a click (the JS click fallbacks)
+SCRIPT_COMMANDS = {"w3cExecuteScript", "w3cExecuteScriptAsync"}
+
+
+def may_navigate(command, params):
+    """True when a WebDriver command can unload the current page"""
+    if command in SCRIPT_COMMANDS:
+        return ".click()" in (params or {}).get("script", "")
+    return command in NAVIGATING_COMMANDS
+
+# Response headers kept in the archive
+KEPT_HEADERS = {"content-type", "location"}
+
+TEXT_TYPES = ("text/", "javascript", "json", "xml", "svg")
+
+
+class TrafficRecorder:
+    """Captures every HTTP(S) response a driver receives into an archive directory"""
+
+    def __init__(self, archive_dir, worker="main"):
+        self.archive_dir = archive_dir
+        self.index_path = os.path.join(archive_dir, f"index-{worker}.json")
+        self.entries = {}
+        self._pending = {}
+        self._hooks = {}
+        self._capturing = False
+        if os.path.exists(self.index_path):
+            with open(self.index_path, encoding="utf-8") as f:
+                self.entries = json.load(f)
+
+    def attach(self, driver):
+        def hook(execute, command, params):
+            if not self._capturing and may_navigate(command, params):
+                self.capture(driver)
+            return execute(command, params)
+
+        self._hooks[id(driver)] = hook
+        add_command_hook(driver, hook)
+
+    def detach(self, driver):
+        hook = self._hooks.pop(id(driver), None)
+        if hook:
+            remove_command_hook(driver, hook)
+        self.capture(driver)
+
+    def capture(self, driver):
+        """Drain the performance log and store every finished response"""
+        self._capturing = True
+        try:
+            for entry in driver.get_log("performance"):
+                message = json.loads(entry["message"])["message"]
+                self._handle_event(driver, message["method"], message.get("params", {}))
+        except Exception as e:
+            print(f"Could not capture traffic: {str(e)}")
+        finally:
+            self._capturing = False
+
+    def _handle_event(self, driver, method, params):
+        if method == "Network.requestWillBeSent" and params.get("redirectResponse"):
+            response = params["redirectResponse"]
+            self._store(response["url"], response["status"], response.get("headers", {}), None)
+        elif method == "Network.responseReceived":
+            response = params["response"]
+            if response["url"].startswith("http"):
+                self._pending[params["requestId"]] = response
+        elif method == "Network.loadingFinished":
+            response = self._pending.pop(params["requestId"], None)
+            if response is None:
+                return
+            try:
+                result = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": params["requestId"]})
+            except Exception:
+                return  # Body already evicted by the browser
+            body = result["body"]
+            body = base64.b64decode(body) if result.get("base64Encoded") else body.encode("utf-8")
+            self._store(response["url"], response["status"], response.get("headers", {}), body)
+        elif method == "Network.loadingFailed":
+            self._pending.pop(params["requestId"], None)
+
+    def _store(self, url, status, headers, body):
+        entry = {
+            "status": status,
+            "headers": {k.lower(): v for k, v in headers.items() if k.lower() in KEPT_HEADERS},
+            "body": None,
+        }
+        if body is not None:
+            digest = hashlib.sha1(body).hexdigest()
+            os.makedirs(os.path.join(self.archive_dir, "bodies"), exist_ok=True)
+            path = os.path.join(self.archive_dir, "bodies", digest)
+            if not os.path.exists(path):
+                with open(path, "wb") as f:
+                    f.write(body)
+            entry["body"] = digest
+        self.entries[url.split("#")[0]] = entry
+
+    def save(self):
+        os.makedirs(self.archive_dir, exist_ok=True)
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.index_path)
+        print(f"Recorded {len(self.entries)} responses to {self.index_path}")
+
+
+def load_archive(archive_dir):
+    """Merge the index files written by every recording worker"""
+    entries = {}
+    for path in sorted(glob.glob(os.path.join(archive_dir, "index-*.json"))):
+        with open(path, encoding="utf-8") as f:
+            entries.update(json.load(f))
+    if not entries:
+        raise Exception(f"No recorded traffic found in {archive_dir}")
+    return entries
+
+
+class ReplayServer:
+    """Serves an archive on localhost under ``/<original host>/<path>``.
+
+    Absolute URLs to recorded hosts inside text responses are rewritten to
+    point back at the server, so the whole flow stays offline.
+    """
+
+    def __init__(self, archive_dir, host="127.0.0.1", port=0):
+        self.archive_dir = archive_dir
+        self.entries = load_archive(archive_dir)
+        self.hosts = sorted({urlsplit(url).netloc for url in self.entries}, key=len, reverse=True)
+        self.default_host = self.hosts[-1]
+        self._by_path = {}
+        for url in self.entries:
+            parts = urlsplit(url)
+            self._by_path.setdefault((parts.netloc, parts.path), url)
+        self._host_pattern = re.compile(
+            r"(?:https?:)?(?:\\?/){2}(" + "|".join(re.escape(h) for h in self.hosts) + r")(?![\w.-])"
+        )
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url_rewrites(self):
+        """Prefix map for BasePage.URL_REWRITES"""
+        rewrites = {}
+        for host in self.hosts:
+            rewrites[f"https://{host}"] = f"{self.url}/{host}"
+            rewrites[f"http://{host}"] = f"{self.url}/{host}"
+        return rewrites
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        print(f"Replaying {len(self.entries)} recorded responses from {self.url}")
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def lookup(self, host, path_and_query):
+        for scheme in ("https", "http"):
+            entry = self.entries.get(f"{scheme}://{host}{path_and_query}")
+            if entry:
+                return entry
+        # Fall back to the same path with a different query string (cache busters etc.)
+        url = self._by_path.get((host, urlsplit(path_and_query).path))
+        return self.entries.get(url) if url else None
+
+    def rewrite(self, text):
+        return self._host_pattern.sub(lambda m: f"{self.url}/{m.group(1)}", text)
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                host, _, rest = self.path.lstrip("/").partition("/")
+                if host not in server.hosts:
+                    # Root-relative URL: resolve against the host of the referring page
+                    referer = urlsplit(self.headers.get("Referer", "")).path.lstrip("/")
+                    referer_host = referer.partition("/")[0]
+                    host = referer_host if referer_host in server.hosts else server.default_host
+                    rest = self.path.lstrip("/")
+                entry = server.lookup(host, "/" + rest)
+                if entry is None:
+                    self.send_error(404, "Not recorded")
+                    return
+                self._send(entry)
+
+            def do_POST(self):
+                self.do_GET()
+
+            def _send(self, entry):
+                body = b""
+                if entry["body"]:
+                    with open(os.path.join(server.archive_dir, "bodies", entry["body"]), "rb") as f:
+                        body = f.read()
+                content_type = entry["headers"].get("content-type", "")
+                if body and any(t in content_type for t in TEXT_TYPES):
+                    body = server.rewrite(body.decode("utf-8", "replace")).encode("utf-8")
+                self.send_response(entry["status"])
+                for name, value in entry["headers"].items():
+                    if name == "location":
+                        value = server.rewrite(value)
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Cache-Control", "no-store")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
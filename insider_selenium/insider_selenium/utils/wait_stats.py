@@ -0,0 +1,102 @@
+import json
+import os
+import time
+
+
+def _percentile(samples, fraction):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class WaitHistory:
+    """On-disk latency history for locator waits, used to size timeouts and poll intervals.
+
+    Each key keeps the last few successful wait durations and the times of
+    recent waits that timed out after the full default budget. Locators
+    with enough history get a ceiling a little above their observed p99 and
+    a poll interval scaled to their median; locators that only ever miss
+    (negative paths in fallback chains) fail fast until their misses age
+    out after MISS_TTL, when one full-length wait checks them again.
+    Unseen locators keep the conservative default. Saving merges with the
+    file on disk like LocatorCache.
+    """
+
+    MAX_SAMPLES = 50
+    MIN_SAMPLES = 5
+    DEFAULT_TIMEOUT = 10
+    DEFAULT_POLL = 0.5
+    MIN_TIMEOUT = 0.5
+    MIN_POLL = 0.05
+    # Ceiling = p99 * HEADROOM + SLACK, so a slightly slower run still passes
+    HEADROOM = 2.0
+    SLACK = 1.0
+    # Seconds after which a miss no longer counts
+    MISS_TTL = 24 * 3600
+
+    def __init__(self, path):
+        self.path = path
+        self._entries = self._load()
+        self._changed = {}
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _recent_misses(self, misses):
+        # Older files stored a plain count, which carries no age and is dropped
+        if not isinstance(misses, list):
+            return []
+        cutoff = time.time() - self.MISS_TTL
+        return [at for at in misses if at > cutoff]
+
+    def fails_fast(self, key):
+        """True when key only has recent misses, so its wait is cut to MIN_TIMEOUT"""
+        entry = self._entries.get(key) or {}
+        return not entry.get("hits") and len(self._recent_misses(entry.get("misses"))) >= self.MIN_SAMPLES
+
+    def policy(self, key, default_timeout=None):
+        """Return (timeout, poll_frequency) for a wait on key"""
+        default_timeout = default_timeout or self.DEFAULT_TIMEOUT
+        entry = self._entries.get(key)
+        if not entry:
+            return default_timeout, self.DEFAULT_POLL
+
+        hits, misses = entry.get("hits", []), len(self._recent_misses(entry.get("misses")))
+        if len(hits) >= self.MIN_SAMPLES and misses <= len(hits):
+            ceiling = _percentile(hits, 0.99) * self.HEADROOM + self.SLACK
+            timeout = min(default_timeout, max(self.MIN_TIMEOUT, ceiling))
+            poll = min(self.DEFAULT_POLL, max(self.MIN_POLL, _percentile(hits, 0.5) / 4))
+            return timeout, poll
+        if self.fails_fast(key):
+            return self.MIN_TIMEOUT, self.MIN_POLL
+        return default_timeout, self.DEFAULT_POLL
+
+    def record(self, key, seconds, found):
+        """Add the outcome of one wait on key (only record misses that used the full budget)"""
+        for entries in (self._entries, self._changed):
+            entry = entries.setdefault(key, {"hits": [], "misses": []})
+            if found:
+                entry["hits"] = (entry["hits"] + [round(seconds, 3)])[-self.MAX_SAMPLES:]
+            else:
+                entry["misses"] = (self._recent_misses(entry.get("misses")) + [round(time.time())])[-self.MAX_SAMPLES:]
+
+    def save(self):
+        if not self._changed:
+            return
+        entries = self._load()
+        for key, change in self._changed.items():
+            entry = entries.setdefault(key, {"hits": [], "misses": []})
+            entry["hits"] = (entry["hits"] + change["hits"])[-self.MAX_SAMPLES:]
+            entry["misses"] = sorted(self._recent_misses(entry.get("misses")) + change["misses"])[-self.MAX_SAMPLES:]
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self._changed = {}